@@ -0,0 +1,266 @@
+"""
+analytics.py
+
+Department- and university-wide analytics over a UniversityRegistry.
+
+The object graph is exported once into NumPy columns (one row per course,
+student and recorded grade) and each query is a vectorized group-by
+(np.bincount over integer group codes) instead of nested Python loops over
+departments, rosters and students. Exported columns and query results are
+cached. The analytics object listens to changes.mark_changed() and only
+refreshes what a change touched:
+    enroll / drop   -> that course's enrolled count (fill rate, faculty load)
+    grade           -> that student's grade rows and GPA (department / major GPA)
+    contact, department_faculty -> nothing
+Registrations (add_person / add_course / add_department / department_course),
+or changes made while notifications were muted, trigger a full re-export.
+"""
+
+from __future__ import annotations
+
+import weakref
+from itertools import chain
+from typing import Callable
+
+import numpy as np
+
+from changes import subscribe, unsubscribe, version
+from registry import UniversityRegistry
+from student import Student
+
+NO_DEPARTMENT = "(none)"
+
+# Change kinds that alter which rows exist, so the export is redone from scratch
+STRUCTURE_KINDS = frozenset({"add_person", "add_course", "add_department", "department_course"})
+# Cached query results built from the course columns / grade and student columns
+COURSE_RESULTS = ("course_fill_rate", "faculty_load")
+GRADE_RESULTS = ("department_gpa", "major_gpa")
+
+
+def _group(labels: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """(unique labels, int codes) for a list of labels."""
+    names, codes = np.unique(np.array(labels, dtype=object), return_inverse=True)
+    return names, codes.astype(np.intp)
+
+
+class UniversityAnalytics:
+    """
+    Cached analytics for one registry.
+    Queries: department_gpa(), course_fill_rate(), faculty_load(), major_gpa()
+    Each returns a dict of aligned NumPy arrays, like cohort.cohort_gpa().
+    """
+
+    def __init__(self, registry: UniversityRegistry) -> None:
+        self.registry = registry
+        self._version: int | None = None
+        self._columns: dict[str, np.ndarray] = {}
+        self._results: dict[str, dict[str, np.ndarray]] = {}
+
+        # Export positions, kept to refresh single rows
+        self._courses: list = []
+        self._course_pos: dict[str, int] = {}
+        self._student_pos: dict[str, int] = {}
+        self._grade_offsets = np.zeros(1, dtype=np.intp)
+
+        # Changes seen since the last refresh
+        self._observed = 0
+        self._stale = False
+        self._dirty_courses: set[str] = set()
+        self._dirty_students: dict[str, Student] = {}
+
+        # Listen through a weak reference so the subscription does not keep this object alive
+        listener = _weak_listener(self)
+        subscribe(listener)
+        weakref.finalize(self, unsubscribe, listener)
+
+    def _on_change(self, kind: str, args: tuple) -> None:
+        self._observed += 1
+        if kind == "enroll" or kind == "drop":
+            self._dirty_courses.add(args[1])
+        elif kind == "grade":
+            self._dirty_students[args[0].student_id] = args[0]
+        elif kind in STRUCTURE_KINDS:
+            self._stale = True
+
+    # ---------- Export ----------
+    def _export(self) -> dict[str, np.ndarray]:
+        registry = self.registry
+        dept_of: dict[str, str] = {}
+        for department in registry.departments:
+            for course in department.iter_courses():
+                dept_of.setdefault(course.course_code, department.dept_name)
+
+        courses = self._courses = list(registry.courses)
+        course_pos = self._course_pos = {course.course_code: i for i, course in enumerate(courses)}
+
+        students = list(registry.students)
+        self._student_pos = {student.student_id: i for i, student in enumerate(students)}
+        # Grade rows are grouped by student; _grade_offsets[i]:_grade_offsets[i + 1] are student i's
+        per_student = [student.grade_records() for student in students]
+        self._grade_offsets = np.concatenate([[0], np.cumsum([len(r) for r in per_student], dtype=np.intp)])
+        records = list(chain.from_iterable(per_student))
+        grade_codes, grade_values, grade_credits = zip(*records) if records else ((), (), ())
+        grade_course = [course_pos.get(code, -1) for code in grade_codes]
+        student_major = [student.major for student in students]
+        student_gpa = [student.gpa for student in students]
+
+        return {
+            "course_code": np.array([c.course_code for c in courses], dtype=object),
+            "course_department": np.array([dept_of.get(c.course_code, NO_DEPARTMENT) for c in courses], dtype=object),
+            "course_instructor": np.array([c.instructor for c in courses], dtype=object),
+            "course_credits": np.array([c.credits for c in courses], dtype=np.int64),
+            "course_enrolled": np.array([c.enrolled_count for c in courses], dtype=np.int64),
+            "course_capacity": np.array([c.max_capacity for c in courses], dtype=np.int64),
+            "grade_course": np.array(grade_course, dtype=np.intp),
+            "grade_student": np.repeat(np.arange(len(students), dtype=np.intp), np.diff(self._grade_offsets)),
+            "grade_value": np.array(grade_values, dtype=float),
+            "grade_credits": np.array(grade_credits, dtype=np.int64),
+            "student_id": np.array([student.student_id for student in students], dtype=object),
+            "student_major": np.array(student_major, dtype=object),
+            "student_gpa": np.array(student_gpa, dtype=float),
+        }
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """Exported columns, refreshed for the changes made since the last call."""
+        current = version()
+        if current != self._version:
+            # Version bumps we were not told about (muted replay) also force a full export
+            if self._version is None or self._stale or current - self._version != self._observed:
+                self._columns = self._export()
+                self._results.clear()
+            else:
+                self._refresh()
+            self._version = current
+            self._observed = 0
+            self._stale = False
+            self._dirty_courses.clear()
+            self._dirty_students.clear()
+        return self._columns
+
+    def _refresh(self) -> None:
+        """Update only the rows of the courses / students changed since the last call."""
+        # Copy-on-write: results handed out earlier share these arrays
+        columns = dict(self._columns)
+        if self._dirty_courses:
+            enrolled = columns["course_enrolled"].copy()
+            for code in self._dirty_courses:
+                pos = self._course_pos.get(code)
+                if pos is not None:
+                    enrolled[pos] = self._courses[pos].enrolled_count
+            columns["course_enrolled"] = enrolled
+            for name in COURSE_RESULTS:
+                self._results.pop(name, None)
+
+        if self._dirty_students:
+            student_pos = self._student_pos
+            positions = sorted(student_pos[sid] for sid in self._dirty_students if sid in student_pos)
+            students = {student_pos[sid]: s for sid, s in self._dirty_students.items() if sid in student_pos}
+            offsets = self._grade_offsets
+            gpa = columns["student_gpa"].copy()
+            counts = np.diff(offsets)
+            parts: dict[str, list] = {"grade_course": [], "grade_student": [], "grade_value": [], "grade_credits": []}
+            start = 0
+            for pos in positions:
+                student = students[pos]
+                records = student.grade_records()
+                codes, values, credits = zip(*records) if records else ((), (), ())
+                for name, new in (
+                    ("grade_course", np.array([self._course_pos.get(c, -1) for c in codes], dtype=np.intp)),
+                    ("grade_student", np.full(len(records), pos, dtype=np.intp)),
+                    ("grade_value", np.array(values, dtype=float)),
+                    ("grade_credits", np.array(credits, dtype=np.int64)),
+                ):
+                    parts[name] += [columns[name][start:offsets[pos]], new]
+                start = offsets[pos + 1]
+                counts[pos] = len(records)
+                gpa[pos] = student.gpa
+            for name, pieces in parts.items():
+                columns[name] = np.concatenate([*pieces, columns[name][start:]])
+            self._grade_offsets = np.concatenate([[0], np.cumsum(counts, dtype=np.intp)])
+            columns["student_gpa"] = gpa
+            for name in GRADE_RESULTS:
+                self._results.pop(name, None)
+
+        self._columns = columns
+
+    def _cached(self, name: str, query: Callable[[dict[str, np.ndarray]], dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+        columns = self.columns
+        if name not in self._results:
+            self._results[name] = query(columns)
+        return self._results[name]
+
+    # ---------- Queries ----------
+    def department_gpa(self) -> dict[str, np.ndarray]:
+        """Credit-weighted mean grade of every graded enrollment in each department's courses."""
+        return self._cached("department_gpa", _department_gpa)
+
+    def course_fill_rate(self) -> dict[str, np.ndarray]:
+        """Enrolled / max_capacity per course."""
+        return self._cached("course_fill_rate", _course_fill_rate)
+
+    def faculty_load(self) -> dict[str, np.ndarray]:
+        """Courses, credits and enrolled students per instructor."""
+        return self._cached("faculty_load", _faculty_load)
+
+    def major_gpa(self) -> dict[str, np.ndarray]:
+        """Mean student GPA and head count per major."""
+        return self._cached("major_gpa", _major_gpa)
+
+
+def _weak_listener(analytics: UniversityAnalytics) -> Callable[[str, tuple], None]:
+    ref = weakref.ref(analytics)
+
+    def listener(kind: str, args: tuple) -> None:
+        target = ref()
+        if target is not None:
+            target._on_change(kind, args)
+
+    return listener
+
+
+def _department_gpa(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    departments, dept_codes = _group(columns["course_department"].tolist())
+    graded = columns["grade_course"] >= 0
+    group = dept_codes[columns["grade_course"][graded]]
+    credits = columns["grade_credits"][graded]
+    points = np.bincount(group, weights=columns["grade_value"][graded] * credits, minlength=len(departments))
+    total_credits = np.bincount(group, weights=credits, minlength=len(departments))
+    gpa = np.divide(points, total_credits, out=np.zeros(len(departments)), where=total_credits > 0)
+    return {
+        "department": departments,
+        "gpa": gpa,
+        "grades": np.bincount(group, minlength=len(departments)),
+    }
+
+
+def _course_fill_rate(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    return {
+        "course_code": columns["course_code"],
+        "department": columns["course_department"],
+        "enrolled": columns["course_enrolled"],
+        "max_capacity": columns["course_capacity"],
+        "fill_rate": columns["course_enrolled"] / columns["course_capacity"],
+    }
+
+
+def _faculty_load(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    instructors, codes = _group(columns["course_instructor"].tolist())
+    n = len(instructors)
+    return {
+        "instructor": instructors,
+        "courses": np.bincount(codes, minlength=n),
+        "credits": np.bincount(codes, weights=columns["course_credits"], minlength=n).astype(np.int64),
+        "students": np.bincount(codes, weights=columns["course_enrolled"], minlength=n).astype(np.int64),
+    }
+
+
+def _major_gpa(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    majors, codes = _group(columns["student_major"].tolist())
+    counts = np.bincount(codes, minlength=len(majors))
+    totals = np.bincount(codes, weights=columns["student_gpa"], minlength=len(majors))
+    return {
+        "major": majors,
+        "students": counts,
+        "gpa": np.divide(totals, counts, out=np.zeros(len(majors)), where=counts > 0),
+    }
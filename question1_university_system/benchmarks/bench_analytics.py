@@ -0,0 +1,139 @@
+"""
+bench_analytics.py
+
+Answers "average GPA per department", "fill rate per course" and "faculty
+teaching load" for 100k students, 2k courses and 20 departments, first with
+Python loops over Department.course_list / Course.enrolled_students /
+Student.grades, then with UniversityAnalytics: the first call exports the
+object graph to NumPy columns, repeated calls hit the cache, a contact
+update leaves it valid, and record_grade() / a drop refresh only the rows
+they touched (checked against a full re-export).
+
+Run from question1_university_system/:
+    python benchmarks/bench_analytics.py
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics import UniversityAnalytics  # noqa: E402
+from course import Course  # noqa: E402
+from department import Department  # noqa: E402
+from faculty import Faculty  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+N_COURSES = 2_000
+N_DEPARTMENTS = 20
+N_FACULTY = 200
+COURSES_PER_STUDENT = 4
+CAPACITY = 250
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<34} {(time.perf_counter() - start) * 1000:9.2f} ms")
+    return result
+
+
+def build_registry(rng: random.Random) -> UniversityRegistry:
+    registry = UniversityRegistry()
+    faculty = [
+        Faculty(f"Dr. {i}", f"F{i:05d}", f"f{i}@uni.edu", "0710000000", f"EMP{i:05d}", "Bench", "2020-01-01")
+        for i in range(N_FACULTY)
+    ]
+    departments = [Department(f"Department {d}") for d in range(N_DEPARTMENTS)]
+    for i in range(N_COURSES):
+        course = Course(f"C{i:05d}", f"Course {i}", rng.choice((2, 3, 4)), faculty[i % N_FACULTY].name, CAPACITY)
+        departments[i % N_DEPARTMENTS].add_course(course)
+    for i, member in enumerate(faculty):
+        departments[i % N_DEPARTMENTS].add_faculty(member)
+    for department in departments:
+        registry.add_department(department)
+
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", f"Major {i % 12}", "2026-02-20"))
+    for result in registry.bulk_enroll(
+        (f"STU{i:07d}", f"C{rng.randrange(N_COURSES):05d}")
+        for i in range(N_STUDENTS)
+        for _ in range(COURSES_PER_STUDENT)
+    ):
+        if result.accepted:
+            registry.get_course(result.course_code).record_grade(
+                registry.get_student(result.student_id), round(rng.uniform(1.5, 4.0), 2)
+            )
+    return registry
+
+
+def loop_queries(registry: UniversityRegistry) -> dict[str, float]:
+    department_gpa = {}
+    for department in registry.departments:
+        points = credits = 0.0
+        for course in department.course_list:
+            for student in course.enrolled_students:
+                grade = student.grades.get(course.course_code)
+                if grade is not None:
+                    points += grade * course.credits
+                    credits += course.credits
+        department_gpa[department.dept_name] = points / credits if credits else 0.0
+
+    fill_rate = {c.course_code: len(c.enrolled_students) / c.max_capacity for c in registry.courses}
+
+    load = {}
+    for course in registry.courses:
+        courses, students = load.get(course.instructor, (0, 0))
+        load[course.instructor] = (courses + 1, students + len(course.enrolled_students))
+    return department_gpa, fill_rate, load
+
+
+def analytics_queries(analytics: UniversityAnalytics):
+    return analytics.department_gpa(), analytics.course_fill_rate(), analytics.faculty_load()
+
+
+def main():
+    registry = build_registry(random.Random(42))
+    analytics = UniversityAnalytics(registry)
+
+    department_gpa, fill_rate, load = timed("python loops", lambda: loop_queries(registry))
+    by_dept, by_course, by_faculty = timed("analytics (export + group-by)", lambda: analytics_queries(analytics))
+    timed("analytics (cached)", lambda: analytics_queries(analytics))
+
+    check(department_gpa, fill_rate, load, by_dept, by_course, by_faculty)
+
+    student = next(iter(registry.students))
+    student.update_contact("new@stu.edu", student.phone)
+    timed("analytics (after update_contact)", lambda: analytics_queries(analytics))
+
+    course = registry.get_course(student.enrolled_courses[0])
+    course.record_grade(student, 4.0)
+    timed("analytics (after record_grade)", lambda: analytics_queries(analytics))
+
+    registry.drop(student.student_id, student.enrolled_courses[-1])
+    results = timed("analytics (after drop)", lambda: analytics_queries(analytics))
+    exported = analytics_queries(UniversityAnalytics(registry))
+    if not all(np.array_equal(a[k], b[k]) for a, b in zip(results, exported) for k in a):
+        raise SystemExit("[ERROR] refreshed analytics differ from a full re-export")
+    print("  refreshed results match a full re-export")
+
+
+def check(department_gpa, fill_rate, load, by_dept, by_course, by_faculty) -> None:
+    expected = np.array([department_gpa[name] for name in by_dept["department"]])
+    fills = np.array([fill_rate[code] for code in by_course["course_code"]])
+    students = np.array([load[name][1] for name in by_faculty["instructor"]])
+    if not (np.allclose(expected, by_dept["gpa"]) and np.allclose(fills, by_course["fill_rate"])
+            and (students == by_faculty["students"]).all()):
+        raise SystemExit("[ERROR] analytics results differ from the loop results")
+    print("  results match the Python loops")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+bench_cohort_gpa.py
+
+For a 100k-student cohort with 5 graded courses each, compares:
+- GPA recomputed from each student's grades dict vs the O(1) running totals
+  (Student.gpa + get_academic_status()) vs cohort_gpa() over the analytics
+  columns, cold (first export) and warm (after a grade change refreshed them)
+- ranking the top 10 by sorting every recomputed GPA vs rank_by_gpa()
+and checks that all paths give the same GPAs / statuses and the same top 10.
+
+Run from question1_university_system/:
+    python benchmarks/bench_cohort_gpa.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analytics import UniversityAnalytics  # noqa: E402
+from cohort import cohort_gpa, rank_by_gpa  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+COURSES_PER_STUDENT = 5
+TOP = 10
+
+
+def build(seed: int = 42) -> list[Student]:
+    rng = random.Random(seed)
+    students = []
+    for i in range(N_STUDENTS):
+        s = Student(f"Student {i}", f"P{i:06d}", f"s{i}@stu.edu", "0700000000",
+                    f"STU{i:06d}", "BSc Computer Science", "2026-02-20")
+        for c in range(COURSES_PER_STUDENT):
+            s.enroll_course(f"C{c:03d}")
+            s.add_grade(f"C{c:03d}", round(min(4.0, max(0.0, rng.gauss(2.9, 0.6))), 1), credits=rng.choice([3, 4]))
+        students.append(s)
+    return students
+
+
+def recomputed_gpa(student: Student) -> float:
+    """GPA the way it was computed before the running totals: a pass over the grades."""
+    grades = student.grades
+    return sum(grades.values()) / len(grades) if grades else 0.0
+
+
+def main():
+    students = build()
+    print(f"[INFO] {N_STUDENTS:,} students x {COURSES_PER_STUDENT} grades\n")
+
+    start = time.perf_counter()
+    recomputed = [(recomputed_gpa(s), Student.status_for_gpa(recomputed_gpa(s))) for s in students]
+    recompute_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    running = [(s.gpa, s.get_academic_status()) for s in students]
+    running_s = time.perf_counter() - start
+
+    registry = UniversityRegistry()
+    for s in students:
+        registry.add_person(s)
+    analytics = UniversityAnalytics(registry)
+    start = time.perf_counter()
+    cohort_gpa(analytics)
+    cold_s = time.perf_counter() - start
+    students[0].add_grade("C000", 4.0, credits=3)
+    recomputed[0] = (recomputed_gpa(students[0]), students[0].get_academic_status())
+    running[0] = (students[0].gpa, students[0].get_academic_status())
+    start = time.perf_counter()
+    summary = cohort_gpa(analytics)
+    warm_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    order = sorted(range(len(students)), key=lambda i: recomputed[i][0], reverse=True)[:TOP]
+    sorted_top = [(students[i].student_id, *recomputed[i]) for i in order]
+    sort_s = time.perf_counter() - start + recompute_s
+
+    start = time.perf_counter()
+    top = rank_by_gpa(students, top=TOP)
+    rank_s = time.perf_counter() - start
+
+    assert all(abs(a[0] - b[0]) < 1e-9 and a[1] == b[1] for a, b in zip(recomputed, running))
+    assert all(abs(gpa - b[0]) < 1e-9 and status == b[1]
+               for gpa, status, b in zip(summary["gpa"], summary["status"], running))
+    assert [(sid, round(gpa, 9), status) for sid, gpa, status in sorted_top] == \
+        [(sid, round(gpa, 9), status) for sid, gpa, status in top]
+
+    for label, seconds in (
+        ("GPA + status, recomputed from grades", recompute_s),
+        ("GPA + status, running totals", running_s),
+        ("GPA + status, cohort_gpa() cold", cold_s),
+        ("GPA + status, cohort_gpa() warm", warm_s),
+        (f"top {TOP}, recompute + full sort", sort_s),
+        (f"top {TOP}, rank_by_gpa()", rank_s),
+    ):
+        print(f"{label:<37}: {seconds * 1000:8.1f} ms")
+    print(f"\nTop student: {top[0]}")
+
+
+if __name__ == "__main__":
+    main()
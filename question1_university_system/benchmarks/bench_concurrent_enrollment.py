@@ -0,0 +1,103 @@
+"""
+bench_concurrent_enrollment.py
+
+Stress test for EnrollmentService: many threads enroll students into a few
+popular, low-capacity courses at the same time.
+
+For each thread count (1–32) it checks that no course is overbooked, that the
+course and student sides agree, and that every rejected seat was waitlisted,
+then reports enrollments/sec.
+
+Run from question1_university_system/:
+    python benchmarks/bench_concurrent_enrollment.py
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from enrollment_service import EnrollmentService  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 20_000
+N_COURSES = 20
+CAPACITY = 500
+COURSES_PER_STUDENT = 3
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+
+
+def build(seed: int = 42):
+    registry = UniversityRegistry()
+    for i in range(N_STUDENTS):
+        registry.add_person(
+            Student(f"Student {i}", f"P{i:06d}", f"s{i}@stu.edu", "0700000000",
+                    f"STU{i:06d}", "BSc Computer Science", "2026-02-20")
+        )
+    for i in range(N_COURSES):
+        registry.add_course(Course(f"POP{i:03d}", f"Popular {i}", 3, "Dr. Bench", CAPACITY))
+
+    rng = random.Random(seed)
+    requests = [
+        (f"STU{i:06d}", code)
+        for i in range(N_STUDENTS)
+        for code in rng.sample([f"POP{c:03d}" for c in range(N_COURSES)], COURSES_PER_STUDENT)
+    ]
+    rng.shuffle(requests)
+    return registry, requests
+
+
+def run(n_threads: int) -> None:
+    registry, requests = build()
+    service = EnrollmentService(registry)
+    counts = {"enrolled": 0, "waitlisted": 0}
+    counts_lock = threading.Lock()
+    barrier = threading.Barrier(n_threads)
+
+    def worker(batch):
+        local = {"enrolled": 0, "waitlisted": 0}
+        barrier.wait()
+        for student_id, code in batch:
+            local[service.enroll(student_id, code)] += 1
+        with counts_lock:
+            for key, value in local.items():
+                counts[key] += value
+
+    threads = [threading.Thread(target=worker, args=(requests[i::n_threads],)) for i in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    overbooked = [c.course_code for c in registry.courses if c.enrolled_count > c.max_capacity]
+    roster_total = sum(c.enrolled_count for c in registry.courses)
+    student_total = sum(s.course_count for s in registry.students)
+    waitlisted_total = sum(len(service.waitlist(c.course_code)) for c in registry.courses)
+
+    assert not overbooked, f"overbooked courses: {overbooked}"
+    assert roster_total == student_total == counts["enrolled"], "course/student sides out of sync"
+    assert waitlisted_total == counts["waitlisted"]
+
+    print(f"{n_threads:>3} threads | {counts['enrolled']:>6,} enrolled | {counts['waitlisted']:>6,} waitlisted"
+          f" | {len(requests) / elapsed:>9,.0f} requests/sec | {counts['enrolled'] / elapsed:>8,.0f} enrollments/sec"
+          f" | overbooked: 0")
+
+
+def main():
+    print(f"[INFO] {N_STUDENTS:,} students x {COURSES_PER_STUDENT} requests into "
+          f"{N_COURSES} courses of {CAPACITY} seats\n")
+    # Force frequent thread switches so check-then-act races would surface
+    sys.setswitchinterval(1e-6)
+    for n_threads in THREAD_COUNTS:
+        run(n_threads)
+
+
+if __name__ == "__main__":
+    main()
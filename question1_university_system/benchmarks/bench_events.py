@@ -0,0 +1,115 @@
+"""
+bench_events.py
+
+Registers 50k students and 1k courses, then enrolls and grades them with an
+EventLog attached (writing JSONL), and reports events/sec for logging next
+to the time the same work takes without a log. It
+then rebuilds the registry three ways: replaying the whole log, loading a
+snapshot, and loading a snapshot taken before the grades and replaying only
+the events after it. Every rebuilt registry is checked against the original.
+
+Run from question1_university_system/:
+    python benchmarks/bench_events.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from events import EventLog, load_snapshot, read_events, restore, save_snapshot  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 50_000
+N_COURSES = 1_000
+COURSES_PER_STUDENT = 4
+CAPACITY = 400
+
+
+def timed(label: str, n_events: int, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {n_events:>9,} events  {elapsed:7.3f}s  {n_events / elapsed:>11,.0f} events/sec")
+    return result
+
+
+def fingerprint(registry: UniversityRegistry) -> tuple:
+    return (
+        [(s.student_id, s.enrolled_courses, s.grade_records()) for s in registry.students],
+        [(c.course_code, [s.student_id for s in c.iter_students()]) for c in registry.courses],
+    )
+
+
+def populate(registry: UniversityRegistry, rng: random.Random) -> None:
+    for i in range(N_COURSES):
+        registry.add_course(Course(f"C{i:05d}", f"Course {i}", 3, "Dr. Bench", CAPACITY))
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", "BSc Computer Science", "2026-02-20"))
+    registry.bulk_enroll(
+        (f"STU{i:07d}", f"C{rng.randrange(N_COURSES):05d}")
+        for i in range(N_STUDENTS)
+        for _ in range(COURSES_PER_STUDENT)
+    )
+
+
+def grade_all(registry: UniversityRegistry, rng: random.Random) -> None:
+    for course in registry.courses:
+        for student in course.iter_students():
+            course.record_grade(student, round(rng.uniform(1.0, 4.0), 2))
+
+
+def main():
+    start = time.perf_counter()
+    unlogged = UniversityRegistry()
+    populate(unlogged, random.Random(42))
+    grade_all(unlogged, random.Random(42))
+    print(f"{'same work without a log':<34} {'':>16}  {time.perf_counter() - start:7.3f}s")
+
+    rng = random.Random(42)
+    registry = UniversityRegistry()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "events.jsonl")
+        snapshot_path = os.path.join(tmp, "snapshot.pkl")
+
+        with EventLog(log_path) as log:
+            before = len(log)
+            start = time.perf_counter()
+            populate(registry, rng)
+            snapshot_seq = save_snapshot(registry, log, snapshot_path)
+            grade_all(registry, rng)
+            log.flush()
+            elapsed = time.perf_counter() - start
+            n_events = len(log) - before
+            print(f"{'log (register, enroll, grade)':<34} {n_events:>9,} events  {elapsed:7.3f}s  "
+                  f"{n_events / elapsed:>11,.0f} events/sec")
+        print(f"log file: {os.path.getsize(log_path) / 1e6:.1f} MB, snapshot at seq {snapshot_seq:,}")
+
+        expected = fingerprint(registry)
+        n_total = sum(1 for _ in read_events(log_path))
+
+        # Both rebuilds include reading the JSONL log
+        rebuilt, _ = timed("full replay", n_total, lambda: restore(None, log_path))
+        assert fingerprint(rebuilt) == expected
+
+        start = time.perf_counter()
+        _, snapshot = load_snapshot(snapshot_path)
+        print(f"{'load snapshot (before grades)':<34} {time.perf_counter() - start:26.3f}s")
+
+        rebuilt, replayed = timed(
+            "snapshot + replay tail", n_total - snapshot_seq, lambda: restore(snapshot_path, log_path)
+        )
+        assert replayed == n_total - snapshot_seq
+        assert fingerprint(rebuilt) == expected
+        print("  rebuilt registries match the original")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+bench_grade_import.py
+
+Writes an end-of-term grade export for 100k students (one mark per
+enrollment plus ~5% bad rows: out-of-range grades, courses the student is
+not enrolled in, unknown students) and imports it twice: row by row through
+Course.record_grade(), and with grade_import.import_grades(). Reports
+rows/sec and checks that both produce the same GPAs.
+
+Run from question1_university_system/:
+    python benchmarks/bench_grade_import.py
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from grade_import import import_grades  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+N_COURSES = 2_000
+COURSES_PER_STUDENT = 4
+CAPACITY = 250
+BAD_ROW_RATE = 0.05
+
+
+def build_registry(seed: int) -> UniversityRegistry:
+    rng = random.Random(seed)
+    registry = UniversityRegistry()
+    for i in range(N_COURSES):
+        registry.add_course(Course(f"C{i:05d}", f"Course {i}", rng.choice((2, 3, 4)), "Dr. Bench", CAPACITY))
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", "BSc Computer Science", "2026-02-20"))
+    registry.bulk_enroll(
+        (f"STU{i:07d}", f"C{rng.randrange(N_COURSES):05d}")
+        for i in range(N_STUDENTS)
+        for _ in range(COURSES_PER_STUDENT)
+    )
+    return registry
+
+
+def write_grades(registry: UniversityRegistry, path: str, rng: random.Random) -> int:
+    rows = [
+        (student.student_id, code, f"{rng.uniform(0.0, 4.0):.2f}")
+        for student in registry.students
+        for code in student.enrolled_courses
+    ]
+    for _ in range(int(len(rows) * BAD_ROW_RATE)):
+        kind = rng.randrange(3)
+        if kind == 0:
+            rows.append((f"STU{rng.randrange(N_STUDENTS):07d}", "C00000", "4.7"))
+        elif kind == 1:
+            rows.append((f"STU{rng.randrange(N_STUDENTS):07d}", "X99999", "3.0"))
+        else:
+            rows.append(("STU9999999", "C00001", "2.5"))
+    rng.shuffle(rows)
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("student_id", "course_code", "grade"))
+        writer.writerows(rows)
+    return len(rows)
+
+
+def import_row_by_row(registry: UniversityRegistry, path: str) -> int:
+    rejected = 0
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                registry.get_course(row["course_code"]).record_grade(
+                    registry.get_student(row["student_id"]), row["grade"]
+                )
+            except ValueError:
+                rejected += 1
+    return rejected
+
+
+def main():
+    baseline = build_registry(42)
+    batched = build_registry(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grades.csv")
+        n_rows = write_grades(baseline, path, random.Random(7))
+        print(f"grade file: {n_rows:,} rows, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        rejected = import_row_by_row(baseline, path)
+        elapsed = time.perf_counter() - start
+        print(f"{'row by row (record_grade)':<28} {elapsed:7.3f}s  {n_rows / elapsed:>12,.0f} rows/sec  "
+              f"{rejected:,} rejected")
+
+        report = import_grades(batched, path, errors_path=os.path.join(tmp, "grade_errors.csv"))
+        print(f"{'import_grades (chunked)':<28} {report.seconds:7.3f}s  {report.rows_per_sec:>12,.0f} rows/sec  "
+              f"{report.rejected:,} rejected")
+
+    mismatches = sum(
+        1 for a, b in zip(baseline.students, batched.students) if abs(a.weighted_gpa - b.weighted_gpa) > 1e-9
+    )
+    print(f"GPA mismatches: {mismatches}")
+    if mismatches or rejected != report.rejected:
+        raise SystemExit("[ERROR] batched import differs from row-by-row import")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+bench_people_memory.py
+
+Memory benchmark for a 1M-person directory (90% students, 7% faculty, 3% staff):
+- Python objects (Student/Faculty/Staff with __slots__ and interned strings)
+- PeopleTable columnar backend
+
+Memory is measured with tracemalloc while each representation is built.
+
+Run from question1_university_system/:
+    python benchmarks/bench_people_memory.py [n_records]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from people_table import FACULTY, STAFF, STUDENT, PeopleTable, row_to_person  # noqa: E402
+
+N_RECORDS = 1_000_000
+MAJORS = ["BSc Computer Science", "MSc Data Science", "BSc Mathematics", "BA Economics", "BSc Physics"]
+DEPARTMENTS = ["Computer Science", "Data Science", "Mathematics", "Economics", "Physics", "Registry"]
+ROLES = ["Administrator", "Lab Technician", "Finance Officer"]
+
+
+def synthetic_rows(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    for i in range(n):
+        r = rng.random()
+        name, pid, email, phone = f"Person {i}", f"P{i:07d}", f"p{i}@uni.edu", f"07{i % 10**8:08d}"
+        if r < 0.90:
+            yield (STUDENT, name, pid, email, phone, f"STU{i:07d}", rng.choice(MAJORS),
+                   f"2026-02-{rng.randint(1, 28):02d}", "")
+        elif r < 0.97:
+            yield (FACULTY, name, pid, email, phone, f"EMP{i:07d}", rng.choice(DEPARTMENTS),
+                   f"20{rng.randint(10, 25)}-01-15", "")
+        else:
+            yield (STAFF, name, pid, email, phone, f"STF{i:07d}", rng.choice(DEPARTMENTS), "",
+                   rng.choice(ROLES))
+
+
+def measure(label: str, build, n: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {current / 1024 ** 2:9.1f} MB retained  {peak / 1024 ** 2:9.1f} MB peak"
+          f"  {current / n:7.1f} B/record  {elapsed:6.2f}s build")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_RECORDS
+    print(f"[INFO] {n:,} records\n")
+
+    people = measure("objects (__slots__)", lambda: [row_to_person(r) for r in synthetic_rows(n)], n)
+    sample = people[12345 % n]
+    del people
+
+    table = measure("PeopleTable", lambda: PeopleTable.from_rows(synthetic_rows(n)), n)
+    print(f"\nPeopleTable.nbytes: {table.nbytes / 1024 ** 2:.1f} MB")
+
+    row = table.find(sample.person_id)
+    assert row.get_info() == sample.get_info()
+    print(f"Row view polymorphism check: {row!r} -> {row.get_responsibilities()[:40]}...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+bench_registry.py
+
+Bulk-enrolls 100k students across 2k courses through UniversityRegistry and
+reports per-operation cost for enrollment, lookup and drop, then repeats the
+enrollment as a single bulk_enroll() batch on a fresh registry. With the
+dict-backed indexes every operation is O(1), so the cost per enrollment
+stays flat as the cohort grows.
+
+Run from question1_university_system/:
+    python benchmarks/bench_registry.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+N_COURSES = 2_000
+COURSES_PER_STUDENT = 4
+CAPACITY = 250
+
+
+def timed(label: str, n_ops: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {n_ops:>9,} ops  {elapsed:7.3f}s  {elapsed / n_ops * 1e6:7.2f} µs/op")
+
+
+def main():
+    rng = random.Random(42)
+    registry = UniversityRegistry()
+
+    students = [
+        Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                f"STU{i:07d}", "BSc Computer Science", "2026-02-20")
+        for i in range(N_STUDENTS)
+    ]
+    courses = [Course(f"C{i:05d}", f"Course {i}", 3, "Dr. Bench", CAPACITY) for i in range(N_COURSES)]
+
+    timed("register students", N_STUDENTS, lambda: [registry.add_person(s) for s in students])
+    timed("register courses", N_COURSES, lambda: [registry.add_course(c) for c in courses])
+
+    requests = [
+        (s.student_id, f"C{rng.randrange(N_COURSES):05d}")
+        for s in students
+        for _ in range(COURSES_PER_STUDENT)
+    ]
+
+    enrolled = []
+
+    def enroll_all():
+        for student_id, code in requests:
+            try:
+                registry.enroll(student_id, code)
+                enrolled.append((student_id, code))
+            except ValueError:
+                pass  # full course or duplicate pick
+
+    timed("enroll", len(requests), enroll_all)
+    print(f"   ({len(enrolled):,} accepted, {len(requests) - len(enrolled):,} rejected)")
+
+    sample = rng.sample(enrolled, 100_000)
+    timed("lookup student + course", len(sample),
+          lambda: [registry.get_course(c).has_student(registry.get_student(s)) for s, c in sample])
+    timed("drop", len(sample), lambda: [registry.drop(s, c) for s, c in sample])
+
+    bulk_registry = UniversityRegistry()
+    for s in students:
+        s_copy = Student(s.name, s.person_id, s.email, s.phone, s.student_id, s.major, s.enrollment_date)
+        bulk_registry.add_person(s_copy)
+    for c in courses:
+        bulk_registry.add_course(Course(c.course_code, c.course_name, c.credits, c.instructor, c.max_capacity))
+
+    results = []
+    timed("bulk_enroll (one batch)", len(requests), lambda: results.extend(bulk_registry.bulk_enroll(requests)))
+    print(f"   ({sum(r.accepted for r in results):,} accepted, {sum(not r.accepted for r in results):,} rejected)")
+
+
+if __name__ == "__main__":
+    main()
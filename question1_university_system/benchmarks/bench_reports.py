@@ -0,0 +1,95 @@
+"""
+bench_reports.py
+
+Builds one department with 5k courses and 100k enrolled students, then
+compares building the whole report as strings (get_department_info() plus
+every course and roster line joined together) against streaming the same
+content through reports.export_all_departments(). Reports wall time and peak
+traced memory (from a second, traced run) for each approach.
+
+Run from question1_university_system/:
+    python benchmarks/bench_reports.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from department import Department  # noqa: E402
+from faculty import Faculty  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from reports import FORMATS, export_all_departments  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+N_COURSES = 5_000
+COURSES_PER_STUDENT = 4
+CAPACITY = 250
+
+
+def measure(label: str, func):
+    # Timed without tracing (tracemalloc slows allocation-heavy code), then traced for peak memory
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<26} {elapsed:7.3f}s  peak {peak / 1e6:8.2f} MB")
+    return result
+
+
+def build_registry(rng: random.Random) -> UniversityRegistry:
+    registry = UniversityRegistry()
+    head = Faculty("Dr. Bench", "F0000000", "bench@uni.edu", "0710000000", "EMP0", "Benchmarks", "2020-01-01")
+    department = Department("Benchmarks", head)
+    registry.add_person(head)
+    for i in range(N_COURSES):
+        course = Course(f"C{i:05d}", f"Course {i}", 3, head.name, CAPACITY)
+        department.add_course(course)
+        registry.add_course(course)
+    registry.add_department(department)
+
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", "BSc Computer Science", "2026-02-20"))
+    registry.bulk_enroll(
+        (f"STU{i:07d}", f"C{rng.randrange(N_COURSES):05d}")
+        for i in range(N_STUDENTS)
+        for _ in range(COURSES_PER_STUDENT)
+    )
+    return registry
+
+
+def string_report(registry: UniversityRegistry) -> int:
+    parts = []
+    for department in registry.departments:
+        parts.append(department.get_department_info())
+        for course in department.course_list:
+            parts.append(str(course))
+            parts.extend(student.get_info() for student in course.enrolled_students)
+    return len("\n".join(parts))
+
+
+def main():
+    registry = build_registry(random.Random(42))
+
+    size = measure("in-memory strings", lambda: string_report(registry))
+    print(f"  report length: {size:,} chars")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            counts = measure(f"streamed ({fmt})", lambda: export_all_departments(registry, tmp, fmt))
+        print(f"  rows written: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+bench_storage.py
+
+Saves 100k students across 2k courses to SQLite with batched executemany()
+writes, then compares a cold start that looks up a handful of students and
+one course roster through StoredRegistry against loading every student.
+
+Run from question1_university_system/:
+    python benchmarks/bench_storage.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from storage import StoredRegistry, UniversityStore  # noqa: E402
+from student import Student  # noqa: E402
+
+N_STUDENTS = 100_000
+N_COURSES = 2_000
+COURSES_PER_STUDENT = 4
+CAPACITY = 250
+N_LOOKUPS = 100
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<34} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def build_registry(rng: random.Random) -> UniversityRegistry:
+    registry = UniversityRegistry()
+    for i in range(N_COURSES):
+        registry.add_course(Course(f"C{i:05d}", f"Course {i}", 3, "Dr. Bench", CAPACITY))
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", "BSc Computer Science", "2026-02-20"))
+
+    requests = [
+        (f"STU{i:07d}", f"C{rng.randrange(N_COURSES):05d}")
+        for i in range(N_STUDENTS)
+        for _ in range(COURSES_PER_STUDENT)
+    ]
+    for result in registry.bulk_enroll(requests):
+        if result.accepted:
+            student = registry.get_student(result.student_id)
+            student.add_grade(result.course_code, round(rng.uniform(2.0, 4.0), 2), 3)
+    return registry
+
+
+def main():
+    rng = random.Random(42)
+    registry = timed("build in-memory registry", lambda: build_registry(rng))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "university.db")
+
+        with UniversityStore(path) as store:
+            timed("save (batched executemany)", lambda: store.save_registry(registry))
+        print(f"database size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        sample = [f"STU{rng.randrange(N_STUDENTS):07d}" for _ in range(N_LOOKUPS)]
+
+        def cold_start():
+            with UniversityStore(path) as store:
+                stored = StoredRegistry(store)
+                for student_id in sample:
+                    stored.get_student(student_id)
+                return len(stored.roster("C00000"))
+
+        size = timed(f"cold start: {N_LOOKUPS} students + 1 roster", cold_start)
+        print(f"  roster size: {size}")
+
+        def full_load():
+            with UniversityStore(path) as store:
+                return sum(1 for _ in StoredRegistry(store).students)
+
+        loaded = timed("full load of every student", full_load)
+        print(f"  students loaded: {loaded:,}")
+
+
+if __name__ == "__main__":
+    main()
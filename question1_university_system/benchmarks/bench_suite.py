@@ -0,0 +1,165 @@
+"""
+bench_suite.py
+
+Scale benchmark suite for the university model, built on synthetic.py.
+
+Times enrollment (bulk_enroll), grade entry (Course.record_grade), GPA
+ranking (cohort.rank_by_gpa) and department reports
+(reports.export_all_departments) at several sizes (10^3 to 10^6
+students). Each case runs on a freshly generated university and keeps
+the best of --repeat runs. Results are compared with a stored baseline
+JSON, and a case is flagged as a regression when it is slower than the
+baseline by more than --tolerance. The exit status is 1 if any case
+regressed.
+
+Run from question1_university_system/:
+    python benchmarks/bench_suite.py                      # 10^3, 10^4, 10^5 students
+    python benchmarks/bench_suite.py --sizes 1000000 --repeat 1
+    python benchmarks/bench_suite.py --save-baseline      # store these timings as the baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from cohort import rank_by_gpa  # noqa: E402
+from reports import export_all_departments  # noqa: E402
+from synthetic import (  # noqa: E402
+    UniversityConfig, enrollment_requests, generate_university, grade_enrollments,
+)
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25
+
+
+# Each case: setup(config) -> state, run(state) -> number of operations
+def setup_enrollment(config):
+    registry = generate_university(config, enroll=False)
+    return registry, enrollment_requests(config, random.Random(config.seed))
+
+
+def run_enrollment(state):
+    registry, requests = state
+    registry.bulk_enroll(requests)
+    return len(requests)
+
+
+def setup_grades(config):
+    return generate_university(config, grade=False), config
+
+
+def run_grades(state):
+    registry, config = state
+    return grade_enrollments(registry, config, random.Random(config.seed))
+
+
+def setup_ranking(config):
+    return generate_university(config)
+
+
+def run_ranking(registry):
+    students = list(registry.students)
+    rank_by_gpa(students, top=100)
+    return len(students)
+
+
+def setup_reports(config):
+    return generate_university(config, grade=False)
+
+
+def run_reports(registry):
+    with tempfile.TemporaryDirectory() as tmp:
+        counts = export_all_departments(registry, tmp, "csv")
+    return sum(counts.values())
+
+
+CASES = {
+    "enrollment": (setup_enrollment, run_enrollment),
+    "grade_entry": (setup_grades, run_grades),
+    "gpa_ranking": (setup_ranking, run_ranking),
+    "department_reports": (setup_reports, run_reports),
+}
+
+
+def run_case(name: str, config: UniversityConfig, repeat: int) -> dict:
+    setup, run = CASES[name]
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup(config)
+        gc.collect()
+        start = time.perf_counter()
+        n_ops = run(state)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": best, "ops": n_ops, "us_per_op": best / max(n_ops, 1) * 1e6}
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scale benchmarks for the university model.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="numbers of students to benchmark")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per case (best is kept)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown vs baseline before flagging (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+
+    print(f"{'case':<20} {'students':>9} {'ops':>10} {'seconds':>9} {'µs/op':>9}  vs baseline")
+    for size in args.sizes:
+        config = UniversityConfig(students=size)
+        for name in args.cases:
+            key = f"{name}@{size}"
+            result = results[key] = run_case(name, config, args.repeat)
+
+            previous = baseline.get(key)
+            if previous:
+                change = result["seconds"] / previous["seconds"] - 1
+                status = f"{change:+7.1%}"
+                if change > args.tolerance:
+                    status += "  [REGRESSION]"
+                    regressions.append(key)
+            else:
+                status = "   (no baseline)"
+            print(f"{name:<20} {size:>9,} {result['ops']:>10,} {result['seconds']:9.3f} "
+                  f"{result['us_per_op']:9.2f}  {status}")
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": baseline},
+                      f, indent=2)
+        print(f"[SAVED] Baseline -> {args.baseline}")
+
+    if regressions:
+        print(f"[WARN] {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+bench_timetable.py
+
+Validates a semester of enrollments for 50k students (5 requests each, 2k
+courses with two weekly meetings) for timetable clashes. Compares a naive
+check that compares every meeting pair of the student's courses with the
+bitmask check in timetable.semester_clashes(), then runs the same batch
+through UniversityRegistry.bulk_enroll(), which rejects the clashes.
+
+Run from question1_university_system/:
+    python benchmarks/bench_timetable.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+from timetable import DAYS, Meeting, semester_clashes  # noqa: E402
+
+N_STUDENTS = 50_000
+N_COURSES = 2_000
+COURSES_PER_STUDENT = 5
+MEETINGS_PER_COURSE = 2
+CAPACITY = 1_000
+
+
+def timed(label: str, n_ops: int, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {n_ops:>9,} ops  {elapsed:7.3f}s  {elapsed / n_ops * 1e6:7.2f} µs/op")
+    return result
+
+
+def random_schedule(rng: random.Random) -> list[Meeting]:
+    meetings = []
+    for day in rng.sample(DAYS[:5], MEETINGS_PER_COURSE):
+        start = rng.randrange(8 * 60, 18 * 60, 30)
+        end = start + rng.choice((60, 90, 120))
+        meetings.append(Meeting(day, f"{start // 60:02d}:{start % 60:02d}", f"{end // 60:02d}:{end % 60:02d}"))
+    return meetings
+
+
+def naive_clash_count(courses: dict[str, Course], requests: list[tuple[str, str]]) -> int:
+    """Compare every meeting of a requested course with every meeting already held."""
+
+    def minutes(hhmm: str) -> int:
+        hours, mins = hhmm.split(":")
+        return int(hours) * 60 + int(mins)
+
+    held: dict[str, list[Meeting]] = {}
+    clashes = 0
+    for student_id, code in requests:
+        taken = held.setdefault(student_id, [])
+        new = courses[code].schedule
+        if any(
+            a.day == b.day and minutes(a.start) < minutes(b.end) and minutes(b.start) < minutes(a.end)
+            for a in new for b in taken
+        ):
+            clashes += 1
+        else:
+            taken.extend(new)
+    return clashes
+
+
+def main():
+    rng = random.Random(42)
+    registry = UniversityRegistry()
+    courses = {}
+    for i in range(N_COURSES):
+        course = Course(f"C{i:05d}", f"Course {i}", 3, "Dr. Bench", CAPACITY, random_schedule(rng))
+        courses[course.course_code] = course
+        registry.add_course(course)
+    for i in range(N_STUDENTS):
+        registry.add_person(Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:07d}", "BSc Computer Science", "2026-02-20"))
+
+    requests = [
+        (f"STU{i:07d}", code)
+        for i in range(N_STUDENTS)
+        for code in rng.sample(list(courses), COURSES_PER_STUDENT)
+    ]
+
+    naive = timed("naive pairwise check", len(requests), lambda: naive_clash_count(courses, requests))
+    clashes = timed("bitmask semester_clashes", len(requests), lambda: semester_clashes(registry, requests))
+    # semester_clashes() reports each held course a request overlaps; count the requests
+    clashing = len({(clash.student_id, clash.course_code) for clash in clashes})
+    print(f"  clashing requests: naive {naive:,}, bitmask {clashing:,} ({len(clashes):,} overlaps)")
+    if naive != clashing:
+        raise SystemExit("[ERROR] clash counts differ")
+    print(f"  e.g. {clashes[0]}")
+
+    results = timed("bulk_enroll (with clashes)", len(requests), lambda: registry.bulk_enroll(requests))
+    rejected = sum(1 for r in results if r.reason.startswith("timetable clash"))
+    print(f"  rejected for clashes: {rejected:,}")
+
+
+if __name__ == "__main__":
+    main()
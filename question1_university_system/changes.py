@@ -0,0 +1,68 @@
+"""
+changes.py
+
+Change notifications for the university model.
+
+Every mutation of enrollments, grades, contact details, department
+membership or registry contents calls mark_changed(kind, *objects). This
+bumps a global version counter - caches built from the object graph can
+remember version() and rebuild once it has moved on - and passes the change
+to any subscribed listeners (see events.py, and analytics.py, which
+refreshes only the rows a change touched).
+
+Kinds and their arguments:
+    enroll / drop       (student, course_code)
+    grade               (student, course_code, grade, credits)
+    contact             (person,)
+    add_person          (person,)
+    add_course          (course,)
+    add_department      (department,)
+    department_faculty  (department, faculty)
+    department_course   (department, course)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Callable
+
+Listener = Callable[[str, tuple], None]
+
+_version = 0
+_listeners: list[Listener] = []
+# mark_changed() is called from EnrollmentService worker threads
+_version_lock = threading.Lock()
+
+
+def mark_changed(kind: str, *args) -> None:
+    global _version
+    with _version_lock:
+        _version += 1
+    if _listeners:
+        for listener in _listeners:
+            listener(kind, args)
+
+
+def version() -> int:
+    return _version
+
+
+def subscribe(listener: Listener) -> None:
+    _listeners.append(listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    _listeners.remove(listener)
+
+
+@contextmanager
+def muted() -> Iterator[None]:
+    """Keep counting versions but do not notify listeners (e.g. while replaying a log)."""
+    saved = _listeners[:]
+    _listeners.clear()
+    try:
+        yield
+    finally:
+        _listeners[:0] = saved
@@ -0,0 +1,60 @@
+"""
+cohort.py
+
+GPA and academic status for whole cohorts.
+cohort_gpa() computes every student's GPA (plain or credit-weighted) and
+Dean's List / Good Standing / Probation status in one array computation
+over the grade columns of a UniversityAnalytics export, which is refreshed
+incrementally as grades change. rank_by_gpa() takes the top N students with
+one heapq.nlargest pass over the O(1) running-total GPA reads instead of
+recomputing every GPA and sorting the whole cohort.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from operator import attrgetter
+
+import numpy as np
+
+from analytics import UniversityAnalytics
+from student import Student
+
+
+def cohort_gpa(analytics: UniversityAnalytics, weighted: bool = False) -> dict[str, np.ndarray]:
+    """
+    Return arrays aligned with the registry's students:
+        student_id, gpa, status (label), graded (number of graded courses)
+    """
+    columns = analytics.columns
+    n = len(columns["student_id"])
+    student = columns["grade_student"]
+    values = columns["grade_value"]
+    if weighted:
+        credits = columns["grade_credits"]
+        numerator = np.bincount(student, weights=values * credits, minlength=n)
+        denominator = np.bincount(student, weights=credits, minlength=n)
+    else:
+        numerator = np.bincount(student, weights=values, minlength=n)
+        denominator = np.bincount(student, minlength=n)
+
+    gpa = np.divide(numerator, denominator, out=np.zeros(n), where=denominator > 0)
+    status = np.select(
+        [gpa >= Student.DEANS_LIST_GPA, gpa >= Student.GOOD_STANDING_GPA],
+        ["Dean's List", "Good Standing"],
+        "Probation",
+    )
+    return {
+        "student_id": columns["student_id"],
+        "gpa": gpa,
+        "status": status,
+        "graded": np.bincount(student, minlength=n),
+    }
+
+
+def rank_by_gpa(students: Iterable[Student], top: int | None = None, weighted: bool = False) -> list[tuple[str, float, str]]:
+    """Return (student_id, gpa, status) sorted by GPA, highest first (ties keep their input order)."""
+    key = attrgetter("weighted_gpa" if weighted else "gpa")
+    ranked = sorted(students, key=key, reverse=True) if top is None else heapq.nlargest(top, students, key=key)
+    return [(s.student_id, gpa, Student.status_for_gpa(gpa)) for s in ranked for gpa in (key(s),)]
@@ -7,14 +7,18 @@ Includes validation for max capacity and duplicate enrollment.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+
+from changes import mark_changed
 from student import Student
+from timetable import Meeting, parse_schedule, schedule_mask
 
 
 class Course:
     """
     Represents a university course.
-    Attributes: course_code, course_name, credits, instructor, enrolled_students, max_capacity
-    Methods: add_student(), remove_student(), is_full()
+    Attributes: course_code, course_name, credits, instructor, enrolled_students, max_capacity, schedule
+    Methods: add_student(), remove_student(), record_grade(), is_full(), iter_students()
     """
 
     def __init__(
@@ -24,6 +28,7 @@ class Course:
         credits: int,
         instructor: str,
         max_capacity: int = 30,
+        schedule: str | Iterable[str | Meeting] | None = None,
     ) -> None:
         code = course_code.strip().upper()
         if not code:
@@ -38,32 +43,60 @@ class Course:
         self.credits = int(credits)
         self.instructor = instructor
         self.max_capacity = int(max_capacity)
-        self.enrolled_students: list[Student] = []
+        # Weekly meetings, e.g. "MON 09:00-11:00; WED 09:00-10:00", and their timetable bitmask
+        self.schedule = parse_schedule(schedule)
+        self.schedule_mask = schedule_mask(self.schedule)
+        # student_id -> Student, insertion ordered for O(1) add/remove/lookup
+        self._roster: dict[str, Student] = {}
+
+    @property
+    def enrolled_students(self) -> list[Student]:
+        """Read-only list of enrolled students (in enrollment order)."""
+        return list(self._roster.values())
+
+    def iter_students(self) -> Iterator[Student]:
+        """Iterate enrolled students (in enrollment order) without copying the roster."""
+        return iter(self._roster.values())
+
+    @property
+    def enrolled_count(self) -> int:
+        return len(self._roster)
+
+    def has_student(self, student: Student) -> bool:
+        return student.student_id in self._roster
 
     def is_full(self) -> bool:
-        return len(self.enrolled_students) >= self.max_capacity
+        return len(self._roster) >= self.max_capacity
 
     def add_student(self, student: Student) -> None:
         if self.is_full():
             raise ValueError(f"Course {self.course_code} is full.")
-        if student in self.enrolled_students:
+        if student.student_id in self._roster:
             raise ValueError(f"{student.name} is already enrolled in {self.course_code}.")
 
         # Sync Student side enrollment to keep system consistent
-        student.enroll_course(self.course_code)
+        student.enroll_course(self.course_code, self.schedule_mask)
 
-        self.enrolled_students.append(student)
+        self._roster[student.student_id] = student
 
     def remove_student(self, student: Student) -> None:
-        if student not in self.enrolled_students:
+        if student.student_id not in self._roster:
             raise ValueError(f"{student.name} is not enrolled in {self.course_code}.")
-        self.enrolled_students.remove(student)
+        del self._roster[student.student_id]
+
+        if student.is_enrolled(self.course_code):
+            student.drop_course(self.course_code)
+        else:
+            mark_changed("drop", student, self.course_code)
 
-        if self.course_code in student.enrolled_courses:
-            student.enrolled_courses.remove(self.course_code)
+    def record_grade(self, student: Student, grade: float) -> None:
+        """Record a grade weighted by this course's credits."""
+        if student.student_id not in self._roster:
+            raise ValueError(f"{student.name} is not enrolled in {self.course_code}.")
+        student.add_grade(self.course_code, grade, credits=self.credits)
 
     def __str__(self) -> str:
         return (
             f"{self.course_code} - {self.course_name} "
-            f"({len(self.enrolled_students)}/{self.max_capacity})"
+            f"({len(self._roster)}/{self.max_capacity})"
         )
\ No newline at end of file
@@ -5,6 +5,9 @@ Defines the Department class.
 Manages faculty members and courses within a department.
 """
 
+from collections.abc import Iterable, Iterator
+
+from changes import mark_changed
 from faculty import Faculty
 from course import Course
 
@@ -16,32 +19,58 @@ class Department:
     Attributes:
         dept_name, dept_head, faculty_list, course_list
     Methods:
-        add_faculty(), add_course(), get_department_info()
+        add_faculty(), add_course(), iter_faculty(), iter_courses(), get_department_info()
     """
 
     def __init__(self, dept_name: str, dept_head: Faculty | None = None) -> None:
         self.dept_name = dept_name
         self.dept_head = dept_head
-        self.faculty_list: list[Faculty] = []
-        self.course_list: list[Course] = []
+        # Insertion-ordered indexes keyed by person_id / course_code
+        self._faculty: dict[str, Faculty] = {}
+        self._courses: dict[str, Course] = {}
 
         if dept_head is not None:
             self.add_faculty(dept_head)
 
+    @property
+    def faculty_list(self) -> list[Faculty]:
+        return list(self._faculty.values())
+
+    @property
+    def course_list(self) -> list[Course]:
+        return list(self._courses.values())
+
+    def iter_faculty(self) -> Iterator[Faculty]:
+        """Iterate faculty without copying the list."""
+        return iter(self._faculty.values())
+
+    def iter_courses(self) -> Iterator[Course]:
+        """Iterate courses without copying the list."""
+        return iter(self._courses.values())
+
     def add_faculty(self, faculty: Faculty) -> None:
-        if faculty in self.faculty_list:
+        if faculty.person_id in self._faculty:
             raise ValueError(f"{faculty.name} already exists in {self.dept_name}.")
-        self.faculty_list.append(faculty)
+        self._faculty[faculty.person_id] = faculty
+        mark_changed("department_faculty", self, faculty)
 
     def add_course(self, course: Course) -> None:
-        if course in self.course_list:
+        if course.course_code in self._courses:
             raise ValueError(f"{course.course_code} already exists in {self.dept_name}.")
-        self.course_list.append(course)
+        self._courses[course.course_code] = course
+        mark_changed("department_course", self, course)
+
+    def _restore(self, faculty: Iterable[Faculty], courses: Iterable[Course]) -> None:
+        """Load already stored members without reporting them as changes (used by storage.py)."""
+        for member in faculty:
+            self._faculty[member.person_id] = member
+        for course in courses:
+            self._courses[course.course_code] = course
 
     def get_department_info(self) -> str:
         head = self.dept_head.name if self.dept_head else "None"
-        faculty_names = ", ".join(f.name for f in self.faculty_list) or "None"
-        course_codes = ", ".join(c.course_code for c in self.course_list) or "None"
+        faculty_names = ", ".join(f.name for f in self._faculty.values()) or "None"
+        course_codes = ", ".join(self._courses) or "None"
 
         return (
             f"Department: {self.dept_name}\n"
@@ -0,0 +1,120 @@
+"""
+enrollment_service.py
+
+Defines the EnrollmentService class.
+Thread-safe enrollment for high-contention registration windows: the
+is_full() check and the seat assignment happen under a per-course lock, so
+concurrent requests can never overbook a course. Students who find a course
+full can be placed on a FIFO waitlist and are promoted when a seat frees up.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from course import Course
+from registry import UniversityRegistry
+from student import Student
+
+
+class EnrollmentService:
+    """
+    Concurrent-safe enrollment on top of a UniversityRegistry.
+
+    Locking: one lock per course and one per student (a student may enroll in
+    several courses from different threads). Locks are always taken in the
+    order course -> student, so the service cannot deadlock.
+
+    Methods:
+        enroll(), drop(), waitlist()
+    """
+
+    ENROLLED = "enrolled"
+    WAITLISTED = "waitlisted"
+
+    def __init__(self, registry: UniversityRegistry, use_waitlist: bool = True) -> None:
+        self.registry = registry
+        self.use_waitlist = use_waitlist
+
+        self._guard = threading.Lock()
+        self._course_locks: dict[str, threading.Lock] = {}
+        self._student_locks: dict[str, threading.Lock] = {}
+        self._waitlists: dict[str, deque[Student]] = {}
+        self._waitlisted: dict[str, set[str]] = {}
+
+    def _lock_for(self, locks: dict[str, threading.Lock], key: str) -> threading.Lock:
+        lock = locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = locks.setdefault(key, threading.Lock())
+        return lock
+
+    def enroll(self, student_id: str, course_code: str) -> str:
+        """
+        Enroll a student, or waitlist them if the course is full.
+        Returns ENROLLED or WAITLISTED; raises ValueError like Course.add_student.
+        """
+        student = self.registry.get_student(student_id)
+        course = self.registry.get_course(course_code)
+
+        with self._lock_for(self._course_locks, course.course_code):
+            if course.is_full():
+                if not self.use_waitlist:
+                    raise ValueError(f"Course {course.course_code} is full.")
+                return self._add_to_waitlist(course, student)
+
+            with self._lock_for(self._student_locks, student.student_id):
+                course.add_student(student)
+        return self.ENROLLED
+
+    def drop(self, student_id: str, course_code: str) -> Student | None:
+        """
+        Drop a student and promote the first eligible waitlisted student.
+        Returns the promoted student, if any. A waitlisted student is only
+        taken off the waitlist.
+        """
+        student = self.registry.get_student(student_id)
+        course = self.registry.get_course(course_code)
+
+        with self._lock_for(self._course_locks, course.course_code):
+            waiting = self._waitlisted.get(course.course_code)
+            if waiting and student.student_id in waiting:
+                waiting.discard(student.student_id)
+                self._waitlists[course.course_code].remove(student)
+                return None
+            with self._lock_for(self._student_locks, student.student_id):
+                course.remove_student(student)
+            return self._promote(course)
+
+    def waitlist(self, course_code: str) -> list[Student]:
+        course = self.registry.get_course(course_code)
+        with self._lock_for(self._course_locks, course.course_code):
+            return list(self._waitlists.get(course.course_code, ()))
+
+    # Caller must hold the course lock for both helpers below.
+    def _add_to_waitlist(self, course: Course, student: Student) -> str:
+        queue = self._waitlists.setdefault(course.course_code, deque())
+        waiting = self._waitlisted.setdefault(course.course_code, set())
+        if course.has_student(student):
+            raise ValueError(f"{student.name} is already enrolled in {course.course_code}.")
+        if student.student_id in waiting:
+            raise ValueError(f"{student.name} is already waitlisted for {course.course_code}.")
+
+        queue.append(student)
+        waiting.add(student.student_id)
+        return self.WAITLISTED
+
+    def _promote(self, course: Course) -> Student | None:
+        queue = self._waitlists.get(course.course_code)
+        while queue and not course.is_full():
+            candidate = queue.popleft()
+            self._waitlisted[course.course_code].discard(candidate.student_id)
+            try:
+                with self._lock_for(self._student_locks, candidate.student_id):
+                    course.add_student(candidate)
+                return candidate
+            except ValueError:
+                # e.g. candidate reached the course limit while waiting; try the next one
+                continue
+        return None
@@ -0,0 +1,370 @@
+"""
+events.py
+
+Append-only event log (change-data capture) for the university model.
+
+An attached EventLog receives every mutation reported through
+changes.mark_changed() - enroll, drop, grade, contact updates, department
+membership and registrations - and records it as an Event with a
+sequence number. Consumers can subscribe() to new events or tail() from an
+offset, the log can be written to a JSONL file (events are encoded in
+batches of up to WRITE_BATCH per line, so encoding is not paid per mutation;
+flush() writes the rest), and a registry is rebuilt
+on restart from a pickle snapshot plus replay of the events after it.
+Registration events carry the object's full state (e.g. a student's
+enrollments and grades) so replay does not depend on what happened before
+the object was registered.
+
+Durability: pending events reach the file once WRITE_BATCH of them have
+accumulated, or from a timer FLUSH_INTERVAL seconds after the first of them
+was logged, whichever comes first; close() writes the rest. The timer is
+not a daemon thread, so a normal interpreter exit still writes them. The
+file is not fsynced: a crash can lose up to FLUSH_INTERVAL seconds' worth of
+events, and one that hits mid-write leaves a partial last line, which
+read_events() skips with a warning and EventLog.open() truncates. Call
+flush() where an event must be on disk before going on. Once written,
+events are dropped from memory; tail() reads them back from the file.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import threading
+import warnings
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from typing import Callable, NamedTuple
+
+import changes
+from course import Course
+from department import Department
+from people_table import person_to_row, row_to_person
+from registry import UniversityRegistry
+from student import Student
+from timetable import format_schedule
+
+
+WRITE_BATCH = 1_000
+FLUSH_INTERVAL = 1.0  # seconds
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class Event(NamedTuple):
+    seq: int
+    kind: str
+    data: tuple
+
+
+def _student_state(student: Student) -> tuple:
+    return student.enrolled_courses, student.grade_records()
+
+
+# kind -> converts mark_changed() arguments (live objects) into plain, JSON-friendly data
+SERIALIZERS: dict[str, Callable[..., tuple]] = {
+    "enroll": lambda student, code: (student.student_id, code),
+    "drop": lambda student, code: (student.student_id, code),
+    "grade": lambda student, code, grade, credits: (student.student_id, code, grade, credits),
+    "contact": lambda person: (person.person_id, person.email, person.phone),
+    "add_person": lambda person: (
+        person_to_row(person), *(_student_state(person) if isinstance(person, Student) else ((), ()))
+    ),
+    "add_course": lambda course: (
+        course.course_code, course.course_name, course.credits, course.instructor, course.max_capacity,
+        format_schedule(course.schedule), [s.student_id for s in course.iter_students()],
+    ),
+    "add_department": lambda department: (
+        department.dept_name,
+        department.dept_head.person_id if department.dept_head else None,
+        [f.person_id for f in department.iter_faculty()],
+        [c.course_code for c in department.iter_courses()],
+    ),
+    "department_faculty": lambda department, faculty: (department.dept_name, faculty.person_id),
+    "department_course": lambda department, course: (department.dept_name, course.course_code),
+}
+
+
+class EventLog:
+    """
+    Sequence-numbered, append-only log of model changes.
+    attach()/detach() start and stop capturing; subscribe() and tail() read it.
+    With a path, every event is also appended to that JSONL file.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        # Without a file: every event. With one: only the events not yet written to it
+        self._events: list[Event] = []
+        self._subscribers: list[Callable[[Event], None]] = []
+        self._file = open(path, "a", encoding="utf-8") if path else None
+        self._seq = 0
+        self._written = 0
+        self._timer: threading.Timer | None = None
+        self._attached = False
+        # append() is driven from EnrollmentService worker threads: seq numbers must stay unique
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str) -> "EventLog":
+        """Keep appending to an existing JSONL log file, dropping a partial last line first."""
+        last_seq = _repair(path)
+        log = cls(path)
+        log._seq = log._written = last_seq
+        return log
+
+    # ---------- Capture ----------
+    def attach(self) -> "EventLog":
+        if not self._attached:
+            changes.subscribe(self._on_change)
+            self._attached = True
+        return self
+
+    def detach(self) -> None:
+        if self._attached:
+            changes.unsubscribe(self._on_change)
+            self._attached = False
+
+    def close(self) -> None:
+        self.detach()
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "EventLog":
+        return self.attach()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _on_change(self, kind: str, args: tuple) -> None:
+        self.append(kind, SERIALIZERS[kind](*args))
+
+    def append(self, kind: str, data: tuple) -> Event:
+        with self._lock:
+            self._seq += 1
+            event = Event(self._seq, kind, data)
+            self._events.append(event)
+            if self._file:
+                if len(self._events) >= WRITE_BATCH:
+                    self._flush()
+                elif self._timer is None:
+                    self._timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+                    self._timer.start()
+        for callback in self._subscribers:
+            callback(event)
+        return event
+
+    def flush(self) -> None:
+        """Write events not yet in the log file, one line per batch: [last_seq, [events...]]."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._file or not self._events:
+            return
+        for start in range(0, len(self._events), WRITE_BATCH):
+            batch = self._events[start:start + WRITE_BATCH]
+            self._file.write(_encode((batch[-1].seq, batch)) + "\n")
+        self._file.flush()
+        self._written = self._seq
+        self._events.clear()
+
+    # ---------- Consumers ----------
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def __len__(self) -> int:
+        return self._seq
+
+    def subscribe(self, callback: Callable[[Event], None]) -> Callable[[], None]:
+        """Call callback for every new event; returns a function that unsubscribes."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def tail(self, after_seq: int = 0) -> Iterator[Event]:
+        """Events with seq > after_seq, in order."""
+        if self.path is None:
+            return iter(self._events[after_seq:])
+        with self._lock:
+            written, pending = self._written, list(self._events)
+        # Seqs are contiguous: stop after the events written so far, before any line still being written
+        older = islice(read_events(self.path, after_seq), max(written - after_seq, 0))
+        return chain(older, (event for event in pending if event.seq > after_seq))
+
+
+def read_events(path: str, after_seq: int = 0) -> Iterator[Event]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                warnings.warn(f"{path}: ignoring incomplete last line (interrupted write)", RuntimeWarning)
+                return
+            # Lines start with "[last_seq,": skip older batches without parsing them
+            if int(line[1:line.index(",")]) <= after_seq:
+                continue
+            for seq, kind, data in json.loads(line)[1]:
+                if seq > after_seq:
+                    yield Event(seq, kind, tuple(data))
+
+
+def _repair(path: str) -> int:
+    """Truncate a partial last line left by a crash; returns the last seq in the file."""
+    last_seq = complete = 0
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                last_seq = int(line[1:line.index(b",")])
+                complete += len(line)
+            size = f.seek(0, 2)
+    except FileNotFoundError:
+        return 0
+    if complete < size:
+        warnings.warn(f"{path}: truncating incomplete last line (interrupted write)", RuntimeWarning)
+        with open(path, "rb+") as f:
+            f.truncate(complete)
+    return last_seq
+
+
+# ---------- Snapshots & replay ----------
+def save_snapshot(registry: UniversityRegistry, log: EventLog, path: str) -> int:
+    """Pickle the registry with the log position it reflects; returns that seq."""
+    log.flush()
+    with open(path, "wb") as f:
+        pickle.dump((log.last_seq, registry), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return log.last_seq
+
+
+def load_snapshot(path: str) -> tuple[int, UniversityRegistry]:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def restore(snapshot_path: str | None, log_path: str) -> tuple[UniversityRegistry, int]:
+    """
+    Rebuild a registry: load the snapshot (or start empty) and replay the
+    logged events recorded after it. Returns (registry, events replayed).
+    """
+    seq, registry = load_snapshot(snapshot_path) if snapshot_path else (0, UniversityRegistry())
+    return registry, replay(registry, read_events(log_path, after_seq=seq))
+
+
+def replay(registry: UniversityRegistry, events: Iterable[Event]) -> int:
+    """
+    Apply events to a registry. Changes made while replaying are not reported
+    to attached logs. Events about objects the registry does not know are skipped.
+    """
+    count = 0
+    with changes.muted():
+        for event in events:
+            APPLY[event.kind](registry, *event.data)
+            count += 1
+    return count
+
+
+def _find(getter: Callable, key: str):
+    try:
+        return getter(key)
+    except ValueError:
+        return None
+
+
+def _enroll(registry: UniversityRegistry, student_id: str, code: str) -> None:
+    student = _find(registry.get_student, student_id)
+    if student is None:
+        return
+    course = _find(registry.get_course, code)
+    if course is not None and not course.has_student(student):
+        if student.is_enrolled(code):
+            student.drop_course(code)
+        course.add_student(student)
+    elif course is None and not student.is_enrolled(code):
+        student.enroll_course(code)
+
+
+def _drop(registry: UniversityRegistry, student_id: str, code: str) -> None:
+    student = _find(registry.get_student, student_id)
+    if student is None:
+        return
+    course = _find(registry.get_course, code)
+    if course is not None and course.has_student(student):
+        course.remove_student(student)
+    elif student.is_enrolled(code):
+        student.drop_course(code)
+
+
+def _grade(registry: UniversityRegistry, student_id: str, code: str, grade: float, credits: int) -> None:
+    student = _find(registry.get_student, student_id)
+    if student is not None and student.is_enrolled(code):
+        student._set_grade(code, grade, credits)
+
+
+def _contact(registry: UniversityRegistry, person_id: str, email: str, phone: str) -> None:
+    person = _find(registry.get_person, person_id)
+    if person is not None:
+        person.update_contact(email, phone)
+
+
+def _add_person(registry: UniversityRegistry, row: list, enrolled: list, grades: list) -> None:
+    person = row_to_person(tuple(row))
+    registry.add_person(person)
+    for code in enrolled:
+        _enroll(registry, person.student_id, code)
+    for code, grade, credits in grades:
+        _grade(registry, person.student_id, code, grade, credits)
+
+
+def _add_course(registry: UniversityRegistry, *fields) -> None:
+    *course_fields, roster = fields
+    course = Course(*course_fields)
+    registry.add_course(course)
+    for student_id in roster:
+        _enroll(registry, student_id, course.course_code)
+
+
+def _add_department(registry: UniversityRegistry, name: str, head_id: str | None, faculty_ids: list, codes: list) -> None:
+    head = _find(registry.get_person, head_id) if head_id else None
+    department = Department(name, head)
+    for person_id in faculty_ids:
+        if person_id != head_id:
+            faculty = _find(registry.get_person, person_id)
+            if faculty is not None:
+                department.add_faculty(faculty)
+    for code in codes:
+        course = _find(registry.get_course, code)
+        if course is not None:
+            department.add_course(course)
+    registry.add_department(department)
+
+
+def _department_faculty(registry: UniversityRegistry, name: str, person_id: str) -> None:
+    department = _find(registry.get_department, name)
+    faculty = _find(registry.get_person, person_id)
+    if department is not None and faculty is not None and faculty not in department.iter_faculty():
+        department.add_faculty(faculty)
+
+
+def _department_course(registry: UniversityRegistry, name: str, code: str) -> None:
+    department = _find(registry.get_department, name)
+    course = _find(registry.get_course, code)
+    if department is not None and course is not None and course not in department.iter_courses():
+        department.add_course(course)
+
+
+APPLY: dict[str, Callable[..., None]] = {
+    "enroll": _enroll,
+    "drop": _drop,
+    "grade": _grade,
+    "contact": _contact,
+    "add_person": _add_person,
+    "add_course": _add_course,
+    "add_department": _add_department,
+    "department_faculty": _department_faculty,
+    "department_course": _department_course,
+}
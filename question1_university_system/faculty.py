@@ -5,6 +5,8 @@ Defines the Faculty class extending Person.
 Represents academic staff responsible for teaching and research.
 """
 
+import sys
+
 from person import Person
 
 
@@ -14,6 +16,8 @@ class Faculty(Person):
     Adds: employee_id, department, hire_date
     """
 
+    __slots__ = ("employee_id", "department", "hire_date")
+
     def __init__(
         self,
         name: str,
@@ -26,7 +30,7 @@ class Faculty(Person):
     ) -> None:
         super().__init__(name, person_id, email, phone)
         self.employee_id = employee_id
-        self.department = department
+        self.department = sys.intern(department)
         self.hire_date = hire_date
 
     def get_info(self) -> str:
@@ -0,0 +1,169 @@
+"""
+grade_import.py
+
+Bulk end-of-term grade import from a CSV export (student_id, course_code, grade).
+
+The file is streamed in chunks with pandas. Each chunk is validated with
+vectorized operations against an EnrollmentIndex (an index of every
+(student_id, course_code) enrollment): grade range, enrollment membership and
+unknown students are checked for the whole chunk at once, valid grades are
+applied in one pass, and rejected rows are appended to an error CSV with the
+reason. Grades are weighted by the course's credits, like Course.record_grade.
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from registry import UniversityRegistry
+from student import Student
+
+CHUNK_SIZE = 100_000
+REQUIRED_COLUMNS = ("student_id", "course_code", "grade")
+KEY_SEPARATOR = "\x1f"
+DEFAULT_CREDITS = 1
+
+
+class GradeImportReport(NamedTuple):
+    rows: int
+    applied: int
+    rejected: int
+    seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class EnrollmentIndex:
+    """
+    Index over every (student_id, course_code) enrollment in a registry.
+    student_id and course_code are mapped to integer positions with hash
+    indexes, and each enrollment becomes one sorted int64 key, so a whole
+    column of pairs is looked up with a single searchsorted().
+    Position i maps to students[i], course_codes[i] and credits[i].
+    """
+
+    def __init__(self, registry: UniversityRegistry) -> None:
+        course_credits = {course.course_code: course.credits for course in registry.courses}
+
+        self.students: list[Student] = []
+        self.course_codes: list[str] = []
+        self.credits: list[int] = []
+        student_ids: list[str] = []
+        code_positions: dict[str, int] = {}
+        student_keys: list[int] = []
+        code_keys: list[int] = []
+
+        for student_pos, student in enumerate(registry.students):
+            student_ids.append(student.student_id)
+            for code, _ in student.iter_schedule():
+                self.students.append(student)
+                self.course_codes.append(code)
+                self.credits.append(course_credits.get(code, DEFAULT_CREDITS))
+                student_keys.append(student_pos)
+                code_keys.append(code_positions.setdefault(code, len(code_positions)))
+
+        self._student_ids = pd.Index(student_ids)
+        self._codes = pd.Index(list(code_positions))
+        keys = np.array(student_keys, dtype=np.int64) * max(len(code_positions), 1) + np.array(code_keys, dtype=np.int64)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+    def student_positions(self, student_ids: pd.Series) -> np.ndarray:
+        return self._student_ids.get_indexer(student_ids)
+
+    def lookup(self, student_pos: np.ndarray, course_codes: pd.Series) -> np.ndarray:
+        """Enrollment position of each (student position, course_code) pair, or -1 if not enrolled."""
+        code_pos = self._codes.get_indexer(course_codes)
+        if not len(self._keys):
+            return np.full(len(code_pos), -1)
+        keys = student_pos.astype(np.int64) * len(self._codes) + code_pos
+        slots = np.searchsorted(self._keys, keys).clip(max=len(self._keys) - 1)
+        found = (student_pos >= 0) & (code_pos >= 0) & (self._keys[slots] == keys)
+        return np.where(found, self._order[slots], -1)
+
+
+def validate_chunk(chunk: pd.DataFrame, index: EnrollmentIndex) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return (positions, grades, reasons) for one chunk.
+    reasons is "" for valid rows; positions index into the EnrollmentIndex.
+    """
+    student_ids = chunk["student_id"]
+    course_codes = chunk["course_code"]
+    grades = pd.to_numeric(chunk["grade"], errors="coerce").to_numpy(dtype=float)
+
+    student_pos = index.student_positions(student_ids)
+    positions = index.lookup(student_pos, course_codes)
+
+    # Clean exports match as-is; only misses pay for strip()/upper() and a second lookup
+    misses = np.flatnonzero(positions < 0)
+    if len(misses):
+        retry_ids = student_ids.iloc[misses].str.strip()
+        retry_codes = course_codes.iloc[misses].str.strip().str.upper()
+        student_pos[misses] = index.student_positions(retry_ids)
+        positions[misses] = index.lookup(student_pos[misses], retry_codes)
+
+    reasons = np.full(len(chunk), "", dtype=object)
+    reasons[positions < 0] = "not enrolled"
+    reasons[student_pos < 0] = "unknown student"
+    bad_grade = ~((grades >= Student.MIN_GRADE) & (grades <= Student.MAX_GRADE))  # NaN fails both
+    reasons[bad_grade & (positions >= 0)] = f"grade must be between {Student.MIN_GRADE} and {Student.MAX_GRADE}"
+    return positions, grades, reasons
+
+
+def import_grades(
+    registry: UniversityRegistry,
+    path: str,
+    errors_path: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    index: EnrollmentIndex | None = None,
+) -> GradeImportReport:
+    """
+    Import grades from `path` into the registry's students.
+    Rejected rows (with their 1-based data line and reason) go to errors_path.
+    Later rows for the same student and course replace earlier ones, as with add_grade().
+    """
+    start = time.perf_counter()
+    index = index or EnrollmentIndex(registry)
+    rows = applied = rejected = 0
+
+    errors_file = open(errors_path, "w", newline="", encoding="utf-8") if errors_path else None
+    errors = csv.writer(errors_file) if errors_file else None
+    if errors:
+        errors.writerow(("line", *REQUIRED_COLUMNS, "reason"))
+
+    try:
+        for chunk in pd.read_csv(path, dtype=str, chunksize=chunk_size, keep_default_na=False):
+            missing_columns = [c for c in REQUIRED_COLUMNS if c not in chunk.columns]
+            if missing_columns:
+                raise ValueError(f"Grade file is missing columns: {', '.join(missing_columns)}")
+
+            positions, grades, reasons = validate_chunk(chunk, index)
+            valid = reasons == ""
+
+            students, codes, credits = index.students, index.course_codes, index.credits
+            for position, grade in zip(positions[valid].tolist(), grades[valid].tolist()):
+                students[position]._set_grade(codes[position], grade, credits[position])
+
+            n_valid = int(valid.sum())
+            applied += n_valid
+            rejected += len(chunk) - n_valid
+            if errors and n_valid < len(chunk):
+                bad = chunk.loc[~valid, list(REQUIRED_COLUMNS)]
+                lines = rows + np.flatnonzero(~valid) + 1
+                errors.writerows(zip(lines.tolist(), *(bad[c].tolist() for c in REQUIRED_COLUMNS), reasons[~valid]))
+            rows += len(chunk)
+    finally:
+        if errors_file:
+            errors_file.close()
+
+    return GradeImportReport(rows, applied, rejected, time.perf_counter() - start)
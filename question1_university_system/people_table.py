@@ -0,0 +1,309 @@
+"""
+people_table.py
+
+Defines the PeopleTable class: a columnar, memory-efficient store for large
+people directories (Students, Faculty, Staff).
+
+Columns are NumPy arrays instead of one Python object per person:
+- free-text columns (name, ids, email, phone) are packed into one UTF-8 byte
+  buffer + int64 offsets per column (Arrow-style)
+- low-cardinality columns (major/department, role, dates) are categorical:
+  int32 codes + a list of interned labels
+- the person kind is an int8 code
+
+table[i] returns a lightweight row view (StudentRow / FacultyRow / StaffRow)
+that keeps the usual get_info() / get_responsibilities() polymorphism by
+materialising the real object only when those methods are called.
+"""
+
+from __future__ import annotations
+
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from faculty import Faculty
+from person import Person
+from staff import Staff
+from student import Student
+
+STUDENT, FACULTY, STAFF = 0, 1, 2
+
+# Row layout accepted by PeopleTable.from_rows():
+# (kind, name, person_id, email, phone, ext_id, unit, date, role)
+#   ext_id: student_id / employee_id
+#   unit:   major (Student) / department (Faculty, Staff)
+#   date:   enrollment_date / hire_date ("" for Staff)
+#   role:   Staff role ("" otherwise)
+STRING_FIELDS = ("name", "person_id", "email", "phone", "ext_id")
+CATEGORY_FIELDS = ("unit", "date", "role")
+CHUNK_SIZE = 100_000
+
+
+class StringColumn:
+    """Variable-length strings packed into one bytes buffer with offsets."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: bytes, offsets: np.ndarray) -> None:
+        self._data = data
+        self._offsets = offsets
+
+    @classmethod
+    def from_chunks(cls, chunks: list[list[str]]) -> "StringColumn":
+        buffers = []
+        lengths = []
+        for chunk in chunks:
+            encoded = [value.encode("utf-8") for value in chunk]
+            buffers.append(b"".join(encoded))
+            lengths.append(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+
+        offsets = np.zeros(sum(map(len, lengths)) + 1, dtype=np.int64)
+        if len(offsets) > 1:
+            np.cumsum(np.concatenate(lengths), out=offsets[1:])
+        return cls(b"".join(buffers), offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._data[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._offsets.nbytes
+
+
+class CategoryColumn:
+    """Low-cardinality strings stored as int32 codes into interned labels."""
+
+    __slots__ = ("codes", "labels")
+
+    def __init__(self, codes: np.ndarray, labels: list[str]) -> None:
+        self.codes = codes
+        self.labels = labels
+
+    @classmethod
+    def from_chunks(cls, chunks: list[list[str]]) -> "CategoryColumn":
+        index: dict[str, int] = {}
+        labels: list[str] = []
+        parts = []
+        for chunk in chunks:
+            codes = np.empty(len(chunk), dtype=np.int32)
+            for i, value in enumerate(chunk):
+                code = index.get(value)
+                if code is None:
+                    code = index[value] = len(labels)
+                    labels.append(sys.intern(value))
+                codes[i] = code
+            parts.append(codes)
+        codes = np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+        return cls(codes, labels)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> str:
+        return self.labels[self.codes[i]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(sys.getsizeof(label) for label in self.labels)
+
+
+class PeopleTable:
+    """
+    Columnar people directory.
+    Methods: from_rows(), from_people(), __getitem__(), __iter__(), find(), nbytes
+    """
+
+    def __init__(self, kind: np.ndarray, columns: dict) -> None:
+        self.kind = kind
+        self.columns = columns
+        self._id_index: dict[str, int] | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "PeopleTable":
+        """Build from row tuples (see module docstring), consumed in chunks."""
+        kinds = []
+        string_chunks: dict[str, list[list[str]]] = {f: [] for f in STRING_FIELDS}
+        category_chunks: dict[str, list[list[str]]] = {f: [] for f in CATEGORY_FIELDS}
+
+        rows = iter(rows)
+        while True:
+            chunk = [row for _, row in zip(range(CHUNK_SIZE), rows)]
+            if not chunk:
+                break
+            kind, name, person_id, email, phone, ext_id, unit, date, role = zip(*chunk)
+            kinds.append(np.array(kind, dtype=np.int8))
+            for field, values in zip(STRING_FIELDS, (name, person_id, email, phone, ext_id)):
+                string_chunks[field].append(list(values))
+            for field, values in zip(CATEGORY_FIELDS, (unit, date, role)):
+                category_chunks[field].append(list(values))
+
+        columns = {f: StringColumn.from_chunks(string_chunks.pop(f)) for f in STRING_FIELDS}
+        columns.update({f: CategoryColumn.from_chunks(category_chunks.pop(f)) for f in CATEGORY_FIELDS})
+        kind = np.concatenate(kinds) if kinds else np.empty(0, dtype=np.int8)
+        return cls(kind, columns)
+
+    @classmethod
+    def from_people(cls, people: Iterable[Person]) -> "PeopleTable":
+        return cls.from_rows(person_to_row(p) for p in people)
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def __getitem__(self, i: int) -> "PersonRow":
+        if not -len(self) <= i < len(self):
+            raise IndexError(f"row {i} out of range")
+        i %= len(self)
+        return ROW_TYPES[self.kind[i]](self, i)
+
+    def __iter__(self) -> Iterator["PersonRow"]:
+        for i in range(len(self)):
+            yield ROW_TYPES[self.kind[i]](self, i)
+
+    def find(self, person_id: str) -> "PersonRow":
+        """Lookup by person_id (the id index is built on first use)."""
+        if self._id_index is None:
+            ids = self.columns["person_id"]
+            self._id_index = {ids[i]: i for i in range(len(self))}
+        try:
+            return self[self._id_index[person_id]]
+        except KeyError:
+            raise ValueError(f"Unknown person {person_id}.") from None
+
+    @property
+    def nbytes(self) -> int:
+        return self.kind.nbytes + sum(col.nbytes for col in self.columns.values())
+
+
+def person_to_row(person: Person) -> tuple:
+    if isinstance(person, Student):
+        return (STUDENT, person.name, person.person_id, person.email, person.phone,
+                person.student_id, person.major, person.enrollment_date, "")
+    if isinstance(person, Faculty):
+        return (FACULTY, person.name, person.person_id, person.email, person.phone,
+                person.employee_id, person.department, person.hire_date, "")
+    if isinstance(person, Staff):
+        return (STAFF, person.name, person.person_id, person.email, person.phone,
+                person.employee_id, person.department, "", person.role)
+    raise ValueError(f"Unsupported person type: {type(person).__name__}")
+
+
+def row_to_person(row: tuple) -> Person:
+    kind, name, person_id, email, phone, ext_id, unit, date, role = row
+    if kind == STUDENT:
+        return Student(name, person_id, email, phone, ext_id, unit, date)
+    if kind == FACULTY:
+        return Faculty(name, person_id, email, phone, ext_id, unit, date)
+    if kind == STAFF:
+        return Staff(name, person_id, email, phone, ext_id, role, unit)
+    raise ValueError(f"Unsupported person kind: {kind}")
+
+
+class PersonRow(ABC):
+    """Lightweight view of one table row; no per-row copies of the data."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: PeopleTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def _col(self, field: str) -> str:
+        return self._table.columns[field][self._index]
+
+    @property
+    def name(self) -> str:
+        return self._col("name")
+
+    @property
+    def person_id(self) -> str:
+        return self._col("person_id")
+
+    @property
+    def email(self) -> str:
+        return self._col("email")
+
+    @property
+    def phone(self) -> str:
+        return self._col("phone")
+
+    @abstractmethod
+    def to_object(self) -> Person:
+        """Materialise the row as its Person subclass."""
+
+    def get_info(self) -> str:
+        return self.to_object().get_info()
+
+    def get_responsibilities(self) -> str:
+        return self.to_object().get_responsibilities()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.person_id} {self.name!r}>"
+
+
+class StudentRow(PersonRow):
+    __slots__ = ()
+
+    @property
+    def student_id(self) -> str:
+        return self._col("ext_id")
+
+    @property
+    def major(self) -> str:
+        return self._col("unit")
+
+    @property
+    def enrollment_date(self) -> str:
+        return self._col("date")
+
+    def to_object(self) -> Student:
+        return Student(self.name, self.person_id, self.email, self.phone,
+                       self.student_id, self.major, self.enrollment_date)
+
+
+class FacultyRow(PersonRow):
+    __slots__ = ()
+
+    @property
+    def employee_id(self) -> str:
+        return self._col("ext_id")
+
+    @property
+    def department(self) -> str:
+        return self._col("unit")
+
+    @property
+    def hire_date(self) -> str:
+        return self._col("date")
+
+    def to_object(self) -> Faculty:
+        return Faculty(self.name, self.person_id, self.email, self.phone,
+                       self.employee_id, self.department, self.hire_date)
+
+
+class StaffRow(PersonRow):
+    __slots__ = ()
+
+    @property
+    def employee_id(self) -> str:
+        return self._col("ext_id")
+
+    @property
+    def role(self) -> str:
+        return self._col("role")
+
+    @property
+    def department(self) -> str:
+        return self._col("unit")
+
+    def to_object(self) -> Staff:
+        return Staff(self.name, self.person_id, self.email, self.phone,
+                     self.employee_id, self.role, self.department)
+
+
+ROW_TYPES = (StudentRow, FacultyRow, StaffRow)
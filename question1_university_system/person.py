@@ -6,6 +6,8 @@ This class demonstrates encapsulation and serves as a parent
 class for Student, Faculty, and Staff.
 """
 
+from changes import mark_changed
+
 
 class Person:
     """
@@ -18,6 +20,9 @@ class Person:
         phone: Phone number
     """
 
+    # __slots__ removes the per-instance __dict__ (large directories hold millions of people)
+    __slots__ = ("name", "person_id", "email", "phone")
+
     def __init__(self, name: str, person_id: str, email: str, phone: str) -> None:
         self.name = name
         self.person_id = person_id
@@ -43,6 +48,7 @@ class Person:
             self.email = email
         if phone is not None:
             self.phone = phone
+        mark_changed("contact", self)
 
     def get_responsibilities(self) -> str:
         """
@@ -0,0 +1,225 @@
+"""
+registry.py
+
+Defines the UniversityRegistry class.
+Keeps hash indexes (insertion-ordered dicts) of people, students, courses
+and departments so lookups, enrollment and drops are O(1).
+Also provides bulk_enroll() for registration-day batches.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from changes import mark_changed
+from course import Course
+from department import Department
+from person import Person
+from student import Student
+
+
+class EnrollmentResult(NamedTuple):
+    """Outcome of one (student_id, course_code) request in a bulk enrollment."""
+
+    student_id: str
+    course_code: str
+    accepted: bool
+    reason: str = ""
+
+
+class UniversityRegistry:
+    """
+    Central index of the university object model.
+
+    Indexes:
+        people:      person_id   -> Person (Student, Faculty, Staff)
+        students:    student_id  -> Student
+        courses:     course_code -> Course
+        departments: dept_name   -> Department
+    Methods:
+        add_person(), add_course(), add_department(), get_*(),
+        enroll(), drop(), bulk_enroll(), roster(), courses_of()
+    """
+
+    def __init__(self) -> None:
+        self._people: dict[str, Person] = {}
+        self._students: dict[str, Student] = {}
+        self._courses: dict[str, Course] = {}
+        self._departments: dict[str, Department] = {}
+
+    # ---------- Registration ----------
+    def add_person(self, person: Person) -> None:
+        if person.person_id in self._people:
+            raise ValueError(f"Person {person.person_id} is already registered.")
+        if isinstance(person, Student) and person.student_id in self._students:
+            raise ValueError(f"Student {person.student_id} is already registered.")
+
+        self._people[person.person_id] = person
+        if isinstance(person, Student):
+            self._students[person.student_id] = person
+        mark_changed("add_person", person)
+
+    def add_course(self, course: Course) -> None:
+        if course.course_code in self._courses:
+            raise ValueError(f"Course {course.course_code} is already registered.")
+        self._courses[course.course_code] = course
+        mark_changed("add_course", course)
+
+    def add_department(self, department: Department) -> None:
+        if department.dept_name in self._departments:
+            raise ValueError(f"Department {department.dept_name} is already registered.")
+        self._departments[department.dept_name] = department
+
+        for course in department.course_list:
+            if course.course_code not in self._courses:
+                self.add_course(course)
+        for faculty in department.faculty_list:
+            if faculty.person_id not in self._people:
+                self.add_person(faculty)
+        mark_changed("add_department", department)
+
+    # ---------- Lookups ----------
+    # _find_*() return None when missing; subclasses (e.g. a storage-backed
+    # registry) override them to load objects on demand.
+    def _find_person(self, person_id: str) -> Person | None:
+        return self._people.get(person_id)
+
+    def _find_student(self, student_id: str) -> Student | None:
+        return self._students.get(student_id)
+
+    def _find_course(self, course_code: str) -> Course | None:
+        return self._courses.get(course_code)
+
+    def _find_department(self, dept_name: str) -> Department | None:
+        return self._departments.get(dept_name)
+
+    def get_person(self, person_id: str) -> Person:
+        person = self._find_person(person_id)
+        if person is None:
+            raise ValueError(f"Unknown person {person_id}.")
+        return person
+
+    def get_student(self, student_id: str) -> Student:
+        student = self._find_student(student_id)
+        if student is None:
+            raise ValueError(f"Unknown student {student_id}.")
+        return student
+
+    def get_course(self, course_code: str) -> Course:
+        code = course_code.strip().upper()
+        course = self._find_course(code)
+        if course is None:
+            raise ValueError(f"Unknown course {code}.")
+        return course
+
+    def get_department(self, dept_name: str) -> Department:
+        department = self._find_department(dept_name)
+        if department is None:
+            raise ValueError(f"Unknown department {dept_name}.")
+        return department
+
+    @property
+    def people(self) -> Iterator[Person]:
+        return iter(self._people.values())
+
+    @property
+    def students(self) -> Iterator[Student]:
+        return iter(self._students.values())
+
+    @property
+    def courses(self) -> Iterator[Course]:
+        return iter(self._courses.values())
+
+    @property
+    def departments(self) -> Iterator[Department]:
+        return iter(self._departments.values())
+
+    # ---------- Enrollment ----------
+    def enroll(self, student_id: str, course_code: str) -> None:
+        self.get_course(course_code).add_student(self.get_student(student_id))
+
+    def drop(self, student_id: str, course_code: str) -> None:
+        self.get_course(course_code).remove_student(self.get_student(student_id))
+
+    def bulk_enroll(self, requests: Iterable[tuple[str, str]]) -> list[EnrollmentResult]:
+        """
+        Enroll many (student_id, course_code) pairs as one batch.
+
+        All requests are validated in a single pass (unknown ids, duplicates,
+        existing enrollments, max_capacity, MAX_COURSES_PER_SEMESTER, timetable
+        clashes), counting seats, course slots and timetable slots already
+        claimed earlier in the batch. Accepted
+        requests are then applied together; if applying fails, every change made
+        by this batch is rolled back. Never raises for invalid requests: returns
+        one EnrollmentResult per request, in request order.
+        """
+        results: list[EnrollmentResult] = []
+        accepted: list[tuple[Student, Course]] = []
+        seen: set[tuple[str, str]] = set()
+        claimed_seats: dict[str, int] = {}
+        claimed_slots: dict[str, int] = {}
+        claimed_masks: dict[str, int] = {}
+        claimed_courses: dict[str, list[Course]] = {}
+
+        for student_id, course_code in requests:
+            code = course_code.strip().upper()
+            student = self._find_student(student_id)
+            course = self._find_course(code)
+
+            if student is None:
+                reason = "unknown student"
+            elif course is None:
+                reason = "unknown course"
+            elif (student_id, code) in seen:
+                reason = "duplicate request"
+            elif course.has_student(student):
+                reason = "already enrolled"
+            elif student.course_count + claimed_slots.get(student_id, 0) >= student.MAX_COURSES_PER_SEMESTER:
+                reason = f"exceeds {student.MAX_COURSES_PER_SEMESTER} courses per semester"
+            elif course.enrolled_count + claimed_seats.get(code, 0) >= course.max_capacity:
+                reason = "course full"
+            elif course.schedule_mask & (student.busy_mask | claimed_masks.get(student_id, 0)):
+                clash = student.clash_with(course.schedule_mask) or next(
+                    other.course_code for other in claimed_courses[student_id]
+                    if other.schedule_mask & course.schedule_mask
+                )
+                reason = f"timetable clash with {clash}"
+            else:
+                reason = ""
+
+            seen.add((student_id, code))
+            if reason:
+                results.append(EnrollmentResult(student_id, code, False, reason))
+                continue
+
+            claimed_seats[code] = claimed_seats.get(code, 0) + 1
+            claimed_slots[student_id] = claimed_slots.get(student_id, 0) + 1
+            if course.schedule_mask:
+                claimed_masks[student_id] = claimed_masks.get(student_id, 0) | course.schedule_mask
+                claimed_courses.setdefault(student_id, []).append(course)
+            accepted.append((student, course))
+            results.append(EnrollmentResult(student_id, code, True))
+
+        applied: list[tuple[Student, Course]] = []
+        try:
+            for student, course in accepted:
+                course.add_student(student)
+                applied.append((student, course))
+        except Exception:
+            for student, course in reversed(applied):
+                course.remove_student(student)
+            raise
+
+        return results
+
+    def roster(self, course_code: str) -> list[Student]:
+        return self.get_course(course_code).enrolled_students
+
+    def courses_of(self, student_id: str) -> list[Course]:
+        student = self.get_student(student_id)
+        courses = (self._find_course(code) for code in student.enrolled_courses)
+        return [course for course in courses if course is not None]
+
+    def __len__(self) -> int:
+        return len(self._people)
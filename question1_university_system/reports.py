@@ -0,0 +1,164 @@
+"""
+reports.py
+
+Streaming reports for departments, course rosters and student transcripts.
+
+Each report is a generator of plain tuples (one row at a time, columns named
+by the matching *_FIELDS constant), so nothing is joined into one big string
+and memory stays flat however large a department or roster is. Rows go to a
+CSV, JSONL or plain-text writer; paginate() slices out a single page.
+export_all_departments() writes every department's courses, faculty and
+rosters in one pass over the registry.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TextIO
+
+from course import Course
+from department import Department
+from registry import UniversityRegistry
+from student import Student
+
+DEPARTMENT_FIELDS = ("department", "course_code", "course_name", "credits", "instructor", "enrolled", "max_capacity")
+FACULTY_FIELDS = ("department", "person_id", "employee_id", "name", "is_head")
+ROSTER_FIELDS = ("course_code", "student_id", "name", "major", "gpa", "academic_status")
+TRANSCRIPT_FIELDS = ("student_id", "course_code", "grade", "credits")
+
+FORMATS = ("csv", "jsonl", "text")
+TEXT_COLUMN_WIDTH = 18
+
+
+# ---------- Row generators ----------
+def department_rows(department: Department) -> Iterator[tuple]:
+    for course in department.iter_courses():
+        yield (
+            department.dept_name, course.course_code, course.course_name, course.credits,
+            course.instructor, course.enrolled_count, course.max_capacity,
+        )
+
+
+def faculty_rows(department: Department) -> Iterator[tuple]:
+    head = department.dept_head
+    for faculty in department.iter_faculty():
+        yield department.dept_name, faculty.person_id, faculty.employee_id, faculty.name, faculty is head
+
+
+def roster_rows(course: Course) -> Iterator[tuple]:
+    for student in course.iter_students():
+        gpa = student.gpa
+        yield (
+            course.course_code, student.student_id, student.name, student.major,
+            round(gpa, 2), Student.status_for_gpa(gpa),
+        )
+
+
+def transcript_rows(student: Student) -> Iterator[tuple]:
+    for code, grade, credits in student.iter_grade_records():
+        yield student.student_id, code, grade, credits
+
+
+def paginate(rows: Iterable[tuple], page: int, page_size: int = 50) -> Iterator[tuple]:
+    """Rows of one 1-based page; earlier rows are skipped without being kept."""
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be positive integers.")
+    start = (page - 1) * page_size
+    return islice(rows, start, start + page_size)
+
+
+# ---------- Writers ----------
+def write_csv(rows: Iterable[tuple], fields: tuple[str, ...], out: TextIO, header: bool = True) -> int:
+    writer = csv.writer(out)
+    if header:
+        writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[tuple], fields: tuple[str, ...], out: TextIO, header: bool = True) -> int:
+    encode = json.JSONEncoder().encode
+    count = 0
+    for row in rows:
+        out.write(encode(dict(zip(fields, row))) + "\n")
+        count += 1
+    return count
+
+
+def write_text(rows: Iterable[tuple], fields: tuple[str, ...], out: TextIO, header: bool = True) -> int:
+    line = "".join(f"{{:<{TEXT_COLUMN_WIDTH}}}" for _ in fields)
+    if header:
+        out.write(line.format(*fields).rstrip() + "\n")
+        out.write("-" * (TEXT_COLUMN_WIDTH * len(fields)) + "\n")
+    count = 0
+    for row in rows:
+        out.write(line.format(*(str(value) for value in row)).rstrip() + "\n")
+        count += 1
+    return count
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "text": write_text}
+
+
+def write_report(
+    rows: Iterable[tuple], fields: tuple[str, ...], out: TextIO, fmt: str = "csv", header: bool = True
+) -> int:
+    """Stream rows to `out` in the given format and return the number of rows written."""
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown report format '{fmt}'. Choose from {', '.join(FORMATS)}.")
+    return WRITERS[fmt](rows, fields, out, header)
+
+
+# ---------- Bulk export ----------
+def export_all_departments(registry: UniversityRegistry, out_dir: str, fmt: str = "csv") -> dict[str, int]:
+    """
+    Write departments.<fmt>, faculty.<fmt> and rosters.<fmt> into out_dir,
+    visiting each department (and each of its courses) once.
+    Returns rows written per report.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown report format '{fmt}'. Choose from {', '.join(FORMATS)}.")
+    os.makedirs(out_dir, exist_ok=True)
+    ext = "txt" if fmt == "text" else fmt
+    reports = {
+        "departments": DEPARTMENT_FIELDS,
+        "faculty": FACULTY_FIELDS,
+        "rosters": ROSTER_FIELDS,
+    }
+    counts = dict.fromkeys(reports, 0)
+    files = {name: open(os.path.join(out_dir, f"{name}.{ext}"), "w", newline="", encoding="utf-8") for name in reports}
+
+    try:
+        for name, fields in reports.items():
+            write_report((), fields, files[name], fmt)
+
+        for department in registry.departments:
+            counts["departments"] += write_report(
+                department_rows(department), DEPARTMENT_FIELDS, files["departments"], fmt, header=False
+            )
+            counts["faculty"] += write_report(
+                faculty_rows(department), FACULTY_FIELDS, files["faculty"], fmt, header=False
+            )
+            for course in department.iter_courses():
+                counts["rosters"] += write_report(
+                    roster_rows(course), ROSTER_FIELDS, files["rosters"], fmt, header=False
+                )
+    finally:
+        for out in files.values():
+            out.close()
+
+    return counts
+
+
+def export_transcripts(registry: UniversityRegistry, path: str, fmt: str = "csv") -> int:
+    """Write every student's transcript rows to one file."""
+    rows = (row for student in registry.students for row in transcript_rows(student))
+    with open(path, "w", newline="", encoding="utf-8") as out:
+        return write_report(rows, TRANSCRIPT_FIELDS, out, fmt)
@@ -5,6 +5,8 @@ Defines the Staff class extending Person.
 Represents administrative or support staff in the university.
 """
 
+import sys
+
 from person import Person
 
 
@@ -14,6 +16,8 @@ class Staff(Person):
     Adds: employee_id, role, department
     """
 
+    __slots__ = ("employee_id", "role", "department")
+
     def __init__(
         self,
         name: str,
@@ -26,8 +30,8 @@ class Staff(Person):
     ) -> None:
         super().__init__(name, person_id, email, phone)
         self.employee_id = employee_id
-        self.role = role
-        self.department = department
+        self.role = sys.intern(role)
+        self.department = sys.intern(department)
 
     def get_info(self) -> str:
         base = super().get_info()
@@ -0,0 +1,432 @@
+"""
+storage.py
+
+SQLite persistence for the university model.
+
+UniversityStore saves people, courses, departments, enrollments and grades
+with batched executemany() inserts, and loads them back on demand through
+indexed lookups (person_id, student_id, course_code). StoredRegistry is a
+UniversityRegistry that starts empty and fetches objects from the store the
+first time they are requested; courses load their enrolled students only
+when the roster is first accessed. The registry shares the store's identity
+map, so students loaded through a roster are saved like any other.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from course import Course
+from department import Department
+from faculty import Faculty
+from people_table import STUDENT, person_to_row, row_to_person
+from person import Person
+from registry import UniversityRegistry
+from student import Student
+from timetable import format_schedule, parse_schedule, schedule_mask
+
+BATCH_SIZE = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    person_id TEXT PRIMARY KEY,
+    kind      INTEGER NOT NULL,
+    name      TEXT NOT NULL,
+    email     TEXT,
+    phone     TEXT,
+    ext_id    TEXT NOT NULL,
+    unit      TEXT,
+    date      TEXT,
+    role      TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_people_ext_id ON people (kind, ext_id);
+
+CREATE TABLE IF NOT EXISTS courses (
+    course_code  TEXT PRIMARY KEY,
+    course_name  TEXT NOT NULL,
+    credits      INTEGER NOT NULL,
+    instructor   TEXT,
+    max_capacity INTEGER NOT NULL,
+    schedule     TEXT NOT NULL DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS departments (
+    dept_name TEXT PRIMARY KEY,
+    head_id   TEXT
+);
+CREATE TABLE IF NOT EXISTS department_faculty (
+    dept_name TEXT NOT NULL,
+    person_id TEXT NOT NULL,
+    UNIQUE (dept_name, person_id)
+);
+CREATE TABLE IF NOT EXISTS department_courses (
+    dept_name   TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    UNIQUE (dept_name, course_code)
+);
+
+CREATE TABLE IF NOT EXISTS enrollments (
+    student_id  TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    UNIQUE (student_id, course_code)
+);
+CREATE INDEX IF NOT EXISTS idx_enrollments_course ON enrollments (course_code);
+
+CREATE TABLE IF NOT EXISTS grades (
+    student_id  TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    grade       REAL NOT NULL,
+    credits     INTEGER NOT NULL,
+    UNIQUE (student_id, course_code)
+);
+"""
+
+PEOPLE_COLUMNS = "kind, name, person_id, email, phone, ext_id, unit, date, role"
+
+
+def batched(rows: Iterable[tuple], size: int = BATCH_SIZE) -> Iterator[list[tuple]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+class UniversityStore:
+    """
+    SQLite-backed store.
+    Write: save_people(), save_courses(), save_departments(), save_enrollments(), save_registry()
+    Read:  load_person(), load_student(), load_course(), load_department(), *_ids()
+    Loaded objects are cached (identity map), so each row becomes one object.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        # Identity map: every materialised object, shared with StoredRegistry
+        self._people: dict[str, Person] = {}
+        self._students: dict[str, Student] = {}
+        self._courses: dict[str, Course] = {}
+        self._departments: dict[str, Department] = {}
+        self._schedule_masks: dict[str, int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "UniversityStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------- Writes (batched) ----------
+    def _insert_many(self, sql: str, rows: Iterable[tuple]) -> int:
+        with self.conn:
+            return self._execute_batches(sql, rows)
+
+    def _execute_batches(self, sql: str, rows: Iterable[tuple]) -> int:
+        """executemany() in batches, inside the caller's transaction."""
+        count = 0
+        for batch in batched(rows, self.batch_size):
+            self.conn.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    def save_people(self, people: Iterable[Person]) -> int:
+        return self._insert_many(
+            f"INSERT OR REPLACE INTO people ({PEOPLE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (person_to_row(p) for p in people),
+        )
+
+    def save_courses(self, courses: Iterable[Course]) -> int:
+        return self._insert_many(
+            "INSERT OR REPLACE INTO courses VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (c.course_code, c.course_name, c.credits, c.instructor, c.max_capacity, format_schedule(c.schedule))
+                for c in courses
+            ),
+        )
+
+    def save_departments(self, departments: Iterable[Department]) -> int:
+        departments = list(departments)
+        with self.conn:
+            self._execute_batches(
+                "INSERT OR REPLACE INTO departments VALUES (?, ?)",
+                ((d.dept_name, d.dept_head.person_id if d.dept_head else None) for d in departments),
+            )
+            self._execute_batches(
+                "INSERT OR IGNORE INTO department_faculty VALUES (?, ?)",
+                ((d.dept_name, f.person_id) for d in departments for f in d.faculty_list),
+            )
+            return self._execute_batches(
+                "INSERT OR IGNORE INTO department_courses VALUES (?, ?)",
+                ((d.dept_name, c.course_code) for d in departments for c in d.course_list),
+            )
+
+    def save_enrollments(self, students: Iterable[Student]) -> int:
+        """Save each student's enrollments and grades, replacing what was stored, in one transaction."""
+        students = list(students)
+        with self.conn:
+            self._execute_batches(
+                "DELETE FROM enrollments WHERE student_id = ?", ((s.student_id,) for s in students)
+            )
+            self._execute_batches(
+                "DELETE FROM grades WHERE student_id = ?", ((s.student_id,) for s in students)
+            )
+            self._execute_batches(
+                "INSERT INTO grades VALUES (?, ?, ?, ?)",
+                ((s.student_id, *record) for s in students for record in s.grade_records()),
+            )
+            return self._execute_batches(
+                "INSERT INTO enrollments VALUES (?, ?)",
+                ((s.student_id, code) for s in students for code in s.enrolled_courses),
+            )
+
+    def save_registry(self, registry: UniversityRegistry) -> None:
+        self.save_people(registry.people)
+        self.save_courses(registry.courses)
+        self.save_departments(registry.departments)
+        self.save_enrollments(registry.students)
+
+    # ---------- Reads (indexed, lazy) ----------
+    def load_person(self, person_id: str) -> Person | None:
+        person = self._people.get(person_id)
+        if person is not None:
+            return person
+        row = self.conn.execute(
+            f"SELECT {PEOPLE_COLUMNS} FROM people WHERE person_id = ?", (person_id,)
+        ).fetchone()
+        return self._materialise(row) if row else None
+
+    def load_student(self, student_id: str) -> Student | None:
+        student = self._students.get(student_id)
+        if student is not None:
+            return student
+        row = self.conn.execute(
+            f"SELECT {PEOPLE_COLUMNS} FROM people WHERE kind = ? AND ext_id = ?", (STUDENT, student_id)
+        ).fetchone()
+        return self._materialise(row) if row else None
+
+    def _materialise(self, row: tuple) -> Person:
+        person = self._people.get(row[2])
+        if person is not None:
+            return person
+
+        person = row_to_person(row)
+        if isinstance(person, Student):
+            # Reading stored state back is not a change: no events, no cache invalidation
+            enrolled = self.conn.execute(
+                "SELECT e.course_code, c.schedule FROM enrollments e "
+                "LEFT JOIN courses c ON c.course_code = e.course_code "
+                "WHERE e.student_id = ? ORDER BY e.rowid",
+                (person.student_id,),
+            )
+            grades = self.conn.execute(
+                "SELECT course_code, grade, credits FROM grades WHERE student_id = ? ORDER BY rowid",
+                (person.student_id,),
+            )
+            person._restore(
+                [(code, self._schedule_mask(code, schedule)) for code, schedule in enrolled], grades
+            )
+            self._students[person.student_id] = person
+
+        self._people[person.person_id] = person
+        return person
+
+    def _schedule_mask(self, course_code: str, schedule: str | None) -> int:
+        mask = self._schedule_masks.get(course_code)
+        if mask is None:
+            mask = self._schedule_masks[course_code] = schedule_mask(parse_schedule(schedule))
+        return mask
+
+    def load_course(self, course_code: str) -> Course | None:
+        course = self._courses.get(course_code)
+        if course is not None:
+            return course
+        row = self.conn.execute(
+            "SELECT course_code, course_name, credits, instructor, max_capacity, schedule FROM courses "
+            "WHERE course_code = ?",
+            (course_code,),
+        ).fetchone()
+        if row is None:
+            return None
+        course = self._courses[course_code] = LazyCourse(self, *row)
+        return course
+
+    def load_roster(self, course_code: str) -> dict[str, Student]:
+        roster = {}
+        for (student_id,) in self.conn.execute(
+            "SELECT student_id FROM enrollments WHERE course_code = ? ORDER BY rowid", (course_code,)
+        ):
+            student = self.load_student(student_id)
+            if student is not None:
+                roster[student_id] = student
+        return roster
+
+    def load_department(self, dept_name: str) -> Department | None:
+        department = self._departments.get(dept_name)
+        if department is not None:
+            return department
+        row = self.conn.execute(
+            "SELECT head_id FROM departments WHERE dept_name = ?", (dept_name,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        head = self.load_person(row[0]) if row[0] else None
+        department = Department(dept_name)
+        department.dept_head = head
+        faculty = [head] if head is not None else []
+        for (person_id,) in self.conn.execute(
+            "SELECT person_id FROM department_faculty WHERE dept_name = ? ORDER BY rowid", (dept_name,)
+        ):
+            member = self.load_person(person_id)
+            if isinstance(member, Faculty) and member is not head:
+                faculty.append(member)
+        courses = [
+            self.load_course(code)
+            for (code,) in self.conn.execute(
+                "SELECT course_code FROM department_courses WHERE dept_name = ? ORDER BY rowid", (dept_name,)
+            )
+        ]
+        department._restore(faculty, courses)
+
+        self._departments[dept_name] = department
+        return department
+
+    def person_ids(self) -> Iterator[str]:
+        return (row[0] for row in self.conn.execute("SELECT person_id FROM people ORDER BY rowid"))
+
+    def student_ids(self) -> Iterator[str]:
+        return (
+            row[0]
+            for row in self.conn.execute("SELECT ext_id FROM people WHERE kind = ? ORDER BY rowid", (STUDENT,))
+        )
+
+    def course_codes(self) -> Iterator[str]:
+        return (row[0] for row in self.conn.execute("SELECT course_code FROM courses ORDER BY rowid"))
+
+    def dept_names(self) -> Iterator[str]:
+        return (row[0] for row in self.conn.execute("SELECT dept_name FROM departments ORDER BY rowid"))
+
+
+class LazyCourse(Course):
+    """Course whose enrolled students are read from the store on first access."""
+
+    def __init__(self, store: UniversityStore, *args) -> None:
+        super().__init__(*args)
+        self._store = store
+        del self._roster
+
+    def __getattr__(self, name: str):
+        # Only reached while _roster has not been loaded yet
+        if name == "_roster":
+            self._roster = self._store.load_roster(self.course_code)
+            return self._roster
+        raise AttributeError(name)
+
+
+class StoredRegistry(UniversityRegistry):
+    """
+    Registry backed by a UniversityStore: starts empty and loads people,
+    courses and departments the first time they are looked up.
+    Iterating people/students/courses/departments streams them from the store,
+    followed by those added since the last save(); len() counts both.
+    People and students share the store's identity map, including students
+    loaded through a course roster. Call save() to write changes back.
+    """
+
+    def __init__(self, store: UniversityStore) -> None:
+        super().__init__()
+        self.store = store
+        self._people = store._people
+        self._students = store._students
+        # Added through this registry and not saved yet: not in the store's tables
+        self._new_people: dict[str, Person] = {}
+        self._new_courses: dict[str, Course] = {}
+        self._new_departments: dict[str, Department] = {}
+
+    def _find_person(self, person_id: str) -> Person | None:
+        person = super()._find_person(person_id)
+        return person if person is not None else self.store.load_person(person_id)
+
+    def _find_student(self, student_id: str) -> Student | None:
+        student = super()._find_student(student_id)
+        return student if student is not None else self.store.load_student(student_id)
+
+    def _find_course(self, course_code: str) -> Course | None:
+        course = super()._find_course(course_code)
+        if course is None:
+            course = self.store.load_course(course_code)
+            if course is not None:
+                self._courses[course_code] = course
+        return course
+
+    def _find_department(self, dept_name: str) -> Department | None:
+        department = super()._find_department(dept_name)
+        if department is None:
+            department = self.store.load_department(dept_name)
+            if department is not None:
+                self._departments[dept_name] = department
+        return department
+
+    # Look the key up first so that stored-but-unloaded objects count as duplicates
+    def add_person(self, person: Person) -> None:
+        self._find_person(person.person_id)
+        if isinstance(person, Student):
+            self._find_student(person.student_id)
+        super().add_person(person)
+        self._new_people[person.person_id] = person
+
+    def add_course(self, course: Course) -> None:
+        self._find_course(course.course_code)
+        super().add_course(course)
+        self._new_courses[course.course_code] = course
+
+    def add_department(self, department: Department) -> None:
+        self._find_department(department.dept_name)
+        # Stored members are linked, not registered again
+        for course in department.course_list:
+            self._find_course(course.course_code)
+        for faculty in department.faculty_list:
+            self._find_person(faculty.person_id)
+        super().add_department(department)
+        self._new_departments[department.dept_name] = department
+
+    @property
+    def people(self) -> Iterator[Person]:
+        yield from (self.get_person(pid) for pid in self.store.person_ids())
+        yield from list(self._new_people.values())
+
+    @property
+    def students(self) -> Iterator[Student]:
+        yield from (self.get_student(sid) for sid in self.store.student_ids())
+        yield from [p for p in self._new_people.values() if isinstance(p, Student)]
+
+    @property
+    def courses(self) -> Iterator[Course]:
+        yield from (self.get_course(code) for code in self.store.course_codes())
+        yield from list(self._new_courses.values())
+
+    @property
+    def departments(self) -> Iterator[Department]:
+        yield from (self.get_department(name) for name in self.store.dept_names())
+        yield from list(self._new_departments.values())
+
+    def save(self) -> None:
+        """Write every loaded or added object back to the store."""
+        self.store.save_people(self._people.values())
+        self.store.save_courses(self._courses.values())
+        self.store.save_departments(self._departments.values())
+        self.store.save_enrollments(self._students.values())
+        self._new_people.clear()
+        self._new_courses.clear()
+        self._new_departments.clear()
+
+    def __len__(self) -> int:
+        return self.store.conn.execute("SELECT COUNT(*) FROM people").fetchone()[0] + len(self._new_people)
@@ -8,6 +8,10 @@ academic status evaluation, and data validation.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Iterator
+
+from changes import mark_changed
 from person import Person
 
 
@@ -16,7 +20,17 @@ class Student(Person):
     Represents a student in the university system.
     """
 
+    __slots__ = (
+        "student_id", "major", "enrollment_date",
+        "_enrolled", "_busy_mask", "_grades", "_grade_credits",
+        "_grade_sum", "_credit_points", "_credits_graded",
+    )
+
     MAX_COURSES_PER_SEMESTER = 6
+    DEANS_LIST_GPA = 3.5
+    GOOD_STANDING_GPA = 2.0
+    MIN_GRADE = 0.0
+    MAX_GRADE = 4.0
 
     def __init__(
         self,
@@ -31,51 +45,149 @@ class Student(Person):
         super().__init__(name, person_id, email, phone)
 
         self.student_id = student_id
-        self.major = major
-        self.enrollment_date = enrollment_date
+        # Interned: many students share the same major / intake date
+        self.major = sys.intern(major)
+        self.enrollment_date = sys.intern(enrollment_date)
 
-        self.enrolled_courses: list[str] = []
+        # course_code -> timetable mask; dict keys keep insertion order and give O(1) membership checks
+        self._enrolled: dict[str, int] = {}
+        # OR of the enrolled courses' masks (see timetable.py)
+        self._busy_mask = 0
         self._grades: dict[str, float] = {}
 
-    def enroll_course(self, course_code: str) -> None:
+        # Running totals maintained by add_grade() so GPA reads are O(1)
+        self._grade_credits: dict[str, int] = {}
+        self._grade_sum = 0.0
+        self._credit_points = 0.0
+        self._credits_graded = 0
+
+    @property
+    def enrolled_courses(self) -> list[str]:
+        """
+        Read-only list of enrolled course codes (in enrollment order).
+        """
+        return list(self._enrolled)
+
+    @property
+    def course_count(self) -> int:
+        return len(self._enrolled)
+
+    @property
+    def busy_mask(self) -> int:
+        return self._busy_mask
+
+    def iter_schedule(self) -> Iterator[tuple[str, int]]:
+        """
+        (course_code, timetable mask) for every enrolled course.
+        """
+        return iter(self._enrolled.items())
+
+    def clash_with(self, schedule_mask: int) -> str | None:
+        """
+        Code of an enrolled course overlapping schedule_mask, or None (O(1) when free).
+        """
+        if not schedule_mask & self._busy_mask:
+            return None
+        return next(code for code, mask in self._enrolled.items() if mask & schedule_mask)
+
+    def is_enrolled(self, course_code: str) -> bool:
+        return course_code.strip().upper() in self._enrolled
+
+    def enroll_course(self, course_code: str, schedule_mask: int = 0) -> None:
         """
         Add course to enrolled list (max 6 courses).
+        schedule_mask is the course's timetable mask (Course.add_student passes it);
+        overlapping an enrolled course is rejected.
         """
         code = course_code.strip().upper()
         if not code:
             raise ValueError("Course code cannot be empty.")
 
-        if code in self.enrolled_courses:
+        if code in self._enrolled:
             raise ValueError(f"Already enrolled in {code}.")
 
-        if len(self.enrolled_courses) >= self.MAX_COURSES_PER_SEMESTER:
+        if len(self._enrolled) >= self.MAX_COURSES_PER_SEMESTER:
             raise ValueError(
                 f"Cannot enroll in more than {self.MAX_COURSES_PER_SEMESTER} courses per semester."
             )
 
-        self.enrolled_courses.append(code)
+        clash = self.clash_with(schedule_mask)
+        if clash is not None:
+            raise ValueError(f"{code} clashes with {clash} in the timetable.")
 
-    def add_grade(self, course_code: str, grade: float) -> None:
+        self._enrolled[code] = schedule_mask
+        self._busy_mask |= schedule_mask
+        mark_changed("enroll", self, code)
+
+    def drop_course(self, course_code: str) -> None:
+        """
+        Remove course from enrolled list.
+        """
+        code = course_code.strip().upper()
+        if code not in self._enrolled:
+            raise ValueError(f"Not enrolled in {code}.")
+        # Enrolled masks never overlap, so clearing this course's bits is exact
+        self._busy_mask &= ~self._enrolled.pop(code)
+        mark_changed("drop", self, code)
+
+    def add_grade(self, course_code: str, grade: float, credits: int = 1) -> None:
         """
         Record a grade for a course (0.0–4.0).
+        credits weights the grade in weighted_gpa (Course.record_grade passes Course.credits).
         """
         code = course_code.strip().upper()
 
-        if code not in self.enrolled_courses:
+        if code not in self._enrolled:
             raise ValueError(f"Cannot add grade: not enrolled in {code}.")
 
-        if not (0.0 <= float(grade) <= 4.0):
+        grade = float(grade)
+        if not (self.MIN_GRADE <= grade <= self.MAX_GRADE):
             raise ValueError("Grade must be between 0.0 and 4.0.")
+        if int(credits) <= 0:
+            raise ValueError("credits must be a positive integer.")
 
-        self._grades[code] = float(grade)
+        self._set_grade(code, grade, int(credits))
+
+    def _set_grade(self, code: str, grade: float, credits: int) -> None:
+        """
+        Store an already validated grade and update the running totals.
+        """
+        self._store_grade(code, grade, credits)
+        mark_changed("grade", self, code, grade, credits)
+
+    def _store_grade(self, code: str, grade: float, credits: int) -> None:
+        # Replacing a grade: take the old one out of the running totals first
+        if code in self._grades:
+            old_grade = self._grades[code]
+            old_credits = self._grade_credits[code]
+            self._grade_sum -= old_grade
+            self._credit_points -= old_grade * old_credits
+            self._credits_graded -= old_credits
+
+        self._grades[code] = grade
+        self._grade_credits[code] = credits
+        self._grade_sum += grade
+        self._credit_points += grade * credits
+        self._credits_graded += credits
+
+    def _restore(self, enrolled: Iterable[tuple[str, int]], grades: Iterable[tuple[str, float, int]]) -> None:
+        """
+        Load already stored (course_code, mask) enrollments and (course_code, grade, credits)
+        records without reporting them as changes (used when reading from storage.py).
+        """
+        for code, mask in enrolled:
+            self._enrolled[code] = mask
+            self._busy_mask |= mask
+        for code, grade, credits in grades:
+            self._store_grade(code, grade, credits)
 
     def calculate_gpa(self) -> float:
         """
-        Calculate GPA from recorded grades.
+        Calculate GPA from recorded grades (O(1) from running totals).
         """
         if not self._grades:
             return 0.0
-        return sum(self._grades.values()) / len(self._grades)
+        return self._grade_sum / len(self._grades)
 
     @property
     def gpa(self) -> float:
@@ -84,6 +196,35 @@ class Student(Person):
         """
         return self.calculate_gpa()
 
+    @property
+    def weighted_gpa(self) -> float:
+        """
+        Credit-weighted GPA.
+        """
+        if not self._credits_graded:
+            return 0.0
+        return self._credit_points / self._credits_graded
+
+    @property
+    def grade_totals(self) -> tuple[float, int, float, int]:
+        """
+        Running totals: (grade sum, graded courses, credit points, graded credits).
+        """
+        return self._grade_sum, len(self._grades), self._credit_points, self._credits_graded
+
+    def grade_records(self) -> list[tuple[str, float, int]]:
+        """
+        (course_code, grade, credits) for every recorded grade.
+        """
+        return [(code, grade, self._grade_credits[code]) for code, grade in self._grades.items()]
+
+    def iter_grade_records(self) -> Iterator[tuple[str, float, int]]:
+        """
+        Lazily yield (course_code, grade, credits) for every recorded grade.
+        """
+        credits = self._grade_credits
+        return ((code, grade, credits[code]) for code, grade in self._grades.items())
+
     @property
     def grades(self) -> dict[str, float]:
         """
@@ -98,9 +239,13 @@ class Student(Person):
         - Good Standing (>= 2.0)
         - Probation (< 2.0)
         """
-        if self.gpa >= 3.5:
+        return self.status_for_gpa(self.gpa)
+
+    @classmethod
+    def status_for_gpa(cls, gpa: float) -> str:
+        if gpa >= cls.DEANS_LIST_GPA:
             return "Dean's List"
-        if self.gpa >= 2.0:
+        if gpa >= cls.GOOD_STANDING_GPA:
             return "Good Standing"
         return "Probation"
 
@@ -115,7 +260,8 @@ class Student(Person):
         Extend Person.get_info() with student details.
         """
         base = super().get_info()
-        courses = ", ".join(self.enrolled_courses) if self.enrolled_courses else "None"
+        courses = ", ".join(self._enrolled) if self._enrolled else "None"
+        gpa = self.gpa
 
         return (
             f"{base}\n"
@@ -123,6 +269,6 @@ class Student(Person):
             f"Major: {self.major}\n"
             f"Enrollment Date: {self.enrollment_date}\n"
             f"Enrolled Courses: {courses}\n"
-            f"GPA: {self.gpa:.2f}\n"
-            f"Academic Status: {self.get_academic_status()}"
+            f"GPA: {gpa:.2f}\n"
+            f"Academic Status: {self.status_for_gpa(gpa)}"
         )
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+synthetic.py
+
+Synthetic university generator for scale testing.
+
+generate_university() builds a UniversityRegistry of any size from a
+UniversityConfig: students, faculty, staff, departments, courses (with
+capacities, credits and optional weekly schedules), enrollments through
+bulk_enroll() and grades drawn from a clipped normal distribution. The same
+config and seed always produce the same university.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import NamedTuple
+
+from course import Course
+from department import Department
+from faculty import Faculty
+from registry import UniversityRegistry
+from staff import Staff
+from student import Student
+from timetable import DAYS, Meeting
+
+MAJORS = (
+    "BSc Computer Science", "BSc Data Science", "BSc Mathematics", "BSc Physics",
+    "BA Economics", "BA Psychology", "BEng Software Engineering", "MSc Data Science",
+)
+DEPARTMENT_NAMES = (
+    "Computer Science", "Data Science", "Mathematics", "Physics",
+    "Economics", "Psychology", "Engineering", "Statistics",
+)
+STAFF_ROLES = ("Registrar", "Lab Technician", "Librarian", "Student Advisor", "IT Support")
+INTAKE_DATES = ("2024-02-20", "2024-09-15", "2025-02-20", "2025-09-15", "2026-02-20")
+
+
+class UniversityConfig(NamedTuple):
+    """
+    Sizes and distributions for a synthetic university.
+    faculty / staff / courses of None scale with the number of students.
+    """
+
+    students: int = 1_000
+    faculty: int | None = None
+    staff: int | None = None
+    departments: int = 8
+    courses: int | None = None
+    courses_per_student: int = 4
+    min_capacity: int = 30
+    max_capacity: int = 250
+    credit_choices: tuple[int, ...] = (2, 3, 4)
+    meetings_per_course: int = 0
+    grade_mean: float = 3.0
+    grade_sd: float = 0.6
+    graded_fraction: float = 1.0
+    seed: int = 42
+
+    @property
+    def n_faculty(self) -> int:
+        return self.faculty if self.faculty is not None else max(self.students // 50, self.departments)
+
+    @property
+    def n_staff(self) -> int:
+        return self.staff if self.staff is not None else max(self.students // 200, 1)
+
+    @property
+    def n_courses(self) -> int:
+        return self.courses if self.courses is not None else max(self.students // 25, self.departments)
+
+
+def department_name(index: int) -> str:
+    base = DEPARTMENT_NAMES[index % len(DEPARTMENT_NAMES)]
+    return base if index < len(DEPARTMENT_NAMES) else f"{base} {index // len(DEPARTMENT_NAMES) + 1}"
+
+
+def random_schedule(rng: random.Random, meetings: int) -> list[Meeting]:
+    schedule = []
+    for day in rng.sample(DAYS[:5], min(meetings, 5)):
+        start = rng.randrange(8 * 60, 18 * 60, 30)
+        end = start + rng.choice((60, 90, 120))
+        schedule.append(Meeting(day, f"{start // 60:02d}:{start % 60:02d}", f"{end // 60:02d}:{end % 60:02d}"))
+    return schedule
+
+
+def generate_students(config: UniversityConfig, rng: random.Random) -> list[Student]:
+    return [
+        Student(f"Student {i}", f"P{i:07d}", f"s{i}@stu.edu", f"07{i % 100_000_000:08d}",
+                f"STU{i:07d}", rng.choice(MAJORS), rng.choice(INTAKE_DATES))
+        for i in range(config.students)
+    ]
+
+
+def generate_courses(config: UniversityConfig, rng: random.Random, faculty: list[Faculty]) -> list[Course]:
+    return [
+        Course(
+            f"C{i:05d}", f"Course {i}", rng.choice(config.credit_choices), faculty[i % len(faculty)].name,
+            rng.randint(config.min_capacity, config.max_capacity),
+            random_schedule(rng, config.meetings_per_course),
+        )
+        for i in range(config.n_courses)
+    ]
+
+
+def enrollment_requests(config: UniversityConfig, rng: random.Random) -> list[tuple[str, str]]:
+    """courses_per_student distinct random courses per student."""
+    n_courses = config.n_courses
+    per_student = min(config.courses_per_student, n_courses)
+    return [
+        (f"STU{i:07d}", f"C{code:05d}")
+        for i in range(config.students)
+        for code in rng.sample(range(n_courses), per_student)
+    ]
+
+
+def random_grade(config: UniversityConfig, rng: random.Random) -> float:
+    grade = rng.gauss(config.grade_mean, config.grade_sd)
+    return round(min(max(grade, Student.MIN_GRADE), Student.MAX_GRADE), 2)
+
+
+def grade_enrollments(registry: UniversityRegistry, config: UniversityConfig, rng: random.Random) -> int:
+    """Record a grade for graded_fraction of all enrollments; returns grades recorded."""
+    recorded = 0
+    for course in registry.courses:
+        for student in course.iter_students():
+            if rng.random() < config.graded_fraction:
+                course.record_grade(student, random_grade(config, rng))
+                recorded += 1
+    return recorded
+
+
+def generate_university(
+    config: UniversityConfig = UniversityConfig(), enroll: bool = True, grade: bool = True
+) -> UniversityRegistry:
+    rng = random.Random(config.seed)
+    registry = UniversityRegistry()
+
+    faculty = [
+        Faculty(f"Dr. Faculty {i}", f"F{i:07d}", f"f{i}@uni.edu", f"071{i % 10_000_000:07d}",
+                f"EMP{i:07d}", department_name(i % config.departments), rng.choice(INTAKE_DATES))
+        for i in range(config.n_faculty)
+    ]
+    courses = generate_courses(config, rng, faculty)
+
+    for d in range(config.departments):
+        members = faculty[d::config.departments]
+        department = Department(department_name(d), members[0] if members else None)
+        for member in members[1:]:
+            department.add_faculty(member)
+        for course in courses[d::config.departments]:
+            department.add_course(course)
+        registry.add_department(department)
+
+    for i in range(config.n_staff):
+        registry.add_person(Staff(f"Staff {i}", f"T{i:07d}", f"t{i}@uni.edu", f"072{i % 10_000_000:07d}",
+                                  f"STF{i:07d}", rng.choice(STAFF_ROLES), department_name(i % config.departments)))
+    for student in generate_students(config, rng):
+        registry.add_person(student)
+
+    if enroll:
+        registry.bulk_enroll(enrollment_requests(config, rng))
+        if grade:
+            grade_enrollments(registry, config, rng)
+    return registry
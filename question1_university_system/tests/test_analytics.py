@@ -0,0 +1,86 @@
+"""
+test_analytics.py
+
+Tests for the change-driven refresh in analytics.py.
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import changes  # noqa: E402
+from analytics import UniversityAnalytics  # noqa: E402
+from cohort import cohort_gpa  # noqa: E402
+from course import Course  # noqa: E402
+from department import Department  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+
+def all_queries(analytics: UniversityAnalytics) -> list[dict[str, np.ndarray]]:
+    return [analytics.department_gpa(), analytics.course_fill_rate(), analytics.faculty_load(), analytics.major_gpa()]
+
+
+class UniversityAnalyticsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = UniversityRegistry()
+        department = Department("Computing")
+        for i in range(3):
+            department.add_course(Course(f"CS10{i}", f"Course {i}", i + 2, f"Dr. {i % 2}", 10))
+        self.registry.add_department(department)
+        for i in range(6):
+            self.registry.add_person(Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                                             f"STU{i:03d}", f"Major {i % 2}", "2026-02-20"))
+            for j in range(i % 3 + 1):
+                self.registry.enroll(f"STU{i:03d}", f"CS10{j}")
+                self.registry.get_course(f"CS10{j}").record_grade(self.registry.get_student(f"STU{i:03d}"), 2.0 + j / 2)
+        self.analytics = UniversityAnalytics(self.registry)
+        all_queries(self.analytics)
+
+    def assert_matches_export(self) -> None:
+        for refreshed, exported in zip(all_queries(self.analytics), all_queries(UniversityAnalytics(self.registry))):
+            for name in exported:
+                np.testing.assert_array_equal(refreshed[name], exported[name])
+
+    def test_contact_update_keeps_cached_results(self) -> None:
+        before = self.analytics.department_gpa()
+        self.registry.get_person("P001").update_contact("new@stu.edu")
+        self.assertIs(self.analytics.department_gpa(), before)
+
+    def test_grades_enrollments_and_drops_are_refreshed(self) -> None:
+        fill_rate = self.analytics.course_fill_rate()
+        self.registry.get_course("CS100").record_grade(self.registry.get_student("STU002"), 4.0)
+        self.registry.enroll("STU000", "CS102")
+        self.registry.get_course("CS102").record_grade(self.registry.get_student("STU000"), 1.0)
+        self.registry.drop("STU005", "CS101")
+        self.assert_matches_export()
+        self.assertEqual(fill_rate["enrolled"].tolist(), [6, 4, 2])
+
+    def test_muted_changes_force_a_full_export(self) -> None:
+        with changes.muted():
+            self.registry.get_course("CS100").record_grade(self.registry.get_student("STU003"), 0.5)
+        self.assert_matches_export()
+
+    def test_cohort_gpa_matches_each_student_after_refresh(self) -> None:
+        cohort_gpa(self.analytics)
+        self.registry.get_course("CS101").record_grade(self.registry.get_student("STU004"), 4.0)
+        self.registry.get_course("CS100").record_grade(self.registry.get_student("STU004"), 3.0)
+        students = list(self.registry.students)
+        for weighted in (False, True):
+            summary = cohort_gpa(self.analytics, weighted)
+            gpas = [s.weighted_gpa if weighted else s.gpa for s in students]
+            self.assertEqual(summary["student_id"].tolist(), [s.student_id for s in students])
+            np.testing.assert_allclose(summary["gpa"], gpas)
+            self.assertEqual(summary["status"].tolist(), [Student.status_for_gpa(g) for g in gpas])
+            self.assertEqual(summary["graded"].tolist(), [len(s.grades) for s in students])
+
+
+if __name__ == "__main__":
+    unittest.main()
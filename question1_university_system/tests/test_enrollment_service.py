@@ -0,0 +1,98 @@
+"""
+test_enrollment_service.py
+
+Tests for the thread-safe EnrollmentService (capacity, waitlist, drop).
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from enrollment_service import EnrollmentService  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+THREADS = 8
+STUDENTS = 40
+CAPACITY = 5
+
+
+def make_registry(capacity: int = CAPACITY, students: int = STUDENTS) -> UniversityRegistry:
+    registry = UniversityRegistry()
+    registry.add_course(Course("CS101", "Intro to Programming", 3, "Dr. Test", capacity))
+    for i in range(students):
+        registry.add_person(Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                                    f"STU{i:03d}", "BSc Computer Science", "2026-02-20"))
+    return registry
+
+
+class EnrollmentServiceTest(unittest.TestCase):
+    def test_concurrent_enrollment_never_overbooks(self) -> None:
+        registry = make_registry()
+        service = EnrollmentService(registry)
+        outcomes: dict[str, str] = {}
+        barrier = threading.Barrier(THREADS)
+
+        def worker(offset: int) -> None:
+            barrier.wait()
+            for i in range(offset, STUDENTS, THREADS):
+                outcomes[f"STU{i:03d}"] = service.enroll(f"STU{i:03d}", "CS101")
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        enrolled = [sid for sid, outcome in outcomes.items() if outcome == EnrollmentService.ENROLLED]
+        waitlisted = [s.student_id for s in service.waitlist("CS101")]
+        self.assertEqual(len(enrolled), CAPACITY)
+        self.assertEqual(sorted(s.student_id for s in registry.roster("CS101")), sorted(enrolled))
+        self.assertEqual(sorted(enrolled + waitlisted), [f"STU{i:03d}" for i in range(STUDENTS)])
+        self.assertTrue(all(registry.get_student(sid).is_enrolled("CS101") for sid in enrolled))
+
+    def test_drop_promotes_the_first_waitlisted_student(self) -> None:
+        registry = make_registry(capacity=2, students=4)
+        service = EnrollmentService(registry)
+        results = [service.enroll(f"STU{i:03d}", "CS101") for i in range(4)]
+        self.assertEqual(results, ["enrolled", "enrolled", "waitlisted", "waitlisted"])
+
+        promoted = service.drop("STU000", "CS101")
+        self.assertEqual(promoted.student_id, "STU002")
+        self.assertEqual([s.student_id for s in registry.roster("CS101")], ["STU001", "STU002"])
+        self.assertEqual([s.student_id for s in service.waitlist("CS101")], ["STU003"])
+        self.assertFalse(registry.get_student("STU000").is_enrolled("CS101"))
+
+    def test_dropping_a_waitlisted_student_leaves_the_waitlist(self) -> None:
+        registry = make_registry(capacity=1, students=3)
+        service = EnrollmentService(registry)
+        for i in range(3):
+            service.enroll(f"STU{i:03d}", "CS101")
+
+        self.assertIsNone(service.drop("STU001", "CS101"))
+        self.assertEqual([s.student_id for s in service.waitlist("CS101")], ["STU002"])
+        self.assertEqual(service.drop("STU000", "CS101").student_id, "STU002")
+        self.assertEqual(service.waitlist("CS101"), [])
+
+    def test_duplicate_and_full_requests_are_rejected(self) -> None:
+        registry = make_registry(capacity=1, students=3)
+        service = EnrollmentService(registry)
+        service.enroll("STU000", "CS101")
+        service.enroll("STU001", "CS101")
+        with self.assertRaises(ValueError):
+            service.enroll("STU000", "CS101")
+        with self.assertRaises(ValueError):
+            service.enroll("STU001", "CS101")
+        with self.assertRaises(ValueError):
+            EnrollmentService(registry, use_waitlist=False).enroll("STU002", "CS101")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+test_events.py
+
+Tests for the event log in events.py.
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import changes  # noqa: E402
+import events  # noqa: E402
+from events import EventLog, read_events  # noqa: E402
+
+THREADS = 8
+APPENDS = 2_000
+
+
+class EventLogTest(unittest.TestCase):
+    def test_concurrent_appends_get_unique_seqs(self) -> None:
+        log = EventLog()
+        version = changes.version()
+
+        def worker() -> None:
+            for i in range(APPENDS):
+                log.append("contact", (f"P{i}", "", ""))
+                changes.mark_changed("contact", None)
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(e.seq for e in log.tail()), list(range(1, THREADS * APPENDS + 1)))
+        self.assertEqual(changes.version() - version, THREADS * APPENDS)
+
+    def test_pending_events_are_written_after_flush_interval(self) -> None:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "events.jsonl")
+            with mock.patch.object(events, "FLUSH_INTERVAL", 0.05):
+                log = EventLog(path)
+                log.append("contact", ("P1", "a@uni.edu", ""))
+                log.append("contact", ("P2", "b@uni.edu", ""))
+            self.assertEqual(list(read_events(path)), [])
+
+            # No further append: the timer alone writes the burst
+            deadline = time.monotonic() + 5
+            while not list(read_events(path)) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual([e.seq for e in read_events(path)], [1, 2])
+            log.close()
+
+    def test_written_events_leave_memory_and_tail_reads_the_file(self) -> None:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "events.jsonl")
+            with EventLog(path) as log:
+                for i in range(events.WRITE_BATCH + 5):
+                    log.append("contact", (f"P{i}", "", ""))
+                self.assertEqual(len(log._events), 5)
+                self.assertEqual(len(log), events.WRITE_BATCH + 5)
+                self.assertEqual([e.seq for e in log.tail(events.WRITE_BATCH - 2)],
+                                 list(range(events.WRITE_BATCH - 1, events.WRITE_BATCH + 6)))
+
+    def test_partial_last_line_is_skipped_and_truncated(self) -> None:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "events.jsonl")
+            with EventLog(path) as log:
+                for i in range(events.WRITE_BATCH + 3):
+                    log.append("contact", (f"P{i}", "", ""))
+            # Crash mid-write: the second batch line is cut off mid-record
+            with open(path, "rb+") as f:
+                f.truncate(f.seek(0, 2) - 20)
+
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual(len(list(read_events(path))), events.WRITE_BATCH)
+            with self.assertWarns(RuntimeWarning):
+                registry, replayed = events.restore(None, path)
+            self.assertEqual(replayed, events.WRITE_BATCH)
+
+            with self.assertWarns(RuntimeWarning):
+                log = EventLog.open(path)
+            self.assertEqual(log.last_seq, events.WRITE_BATCH)
+            log.append("contact", ("P9", "", ""))
+            log.close()
+            self.assertEqual([e.seq for e in read_events(path)][-2:], [events.WRITE_BATCH, events.WRITE_BATCH + 1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+test_grade_import.py
+
+Tests for the chunked CSV grade import in grade_import.py.
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from grade_import import import_grades  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+
+class GradeImportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.workdir = tempfile.TemporaryDirectory()
+        self.registry = UniversityRegistry()
+        self.registry.add_course(Course("CS101", "Intro to Programming", 3, "Dr. Test", 10))
+        self.registry.add_course(Course("CS102", "Data Structures", 4, "Dr. Test", 10))
+        for i in range(3):
+            self.registry.add_person(Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                                             f"STU{i:03d}", "BSc Computer Science", "2026-02-20"))
+            self.registry.enroll(f"STU{i:03d}", "CS101")
+        self.registry.enroll("STU000", "CS102")
+
+    def tearDown(self) -> None:
+        self.workdir.cleanup()
+
+    def write(self, name: str, rows: list[tuple]) -> str:
+        path = os.path.join(self.workdir.name, name)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+        return path
+
+    def test_valid_rows_are_applied_and_bad_rows_reported(self) -> None:
+        path = self.write("grades.csv", [
+            ("student_id", "course_code", "grade"),
+            ("STU000", "CS101", "3.0"),
+            (" STU000 ", "cs102", "4.0"),
+            ("STU001", "CS101", "4.5"),
+            ("STU001", "CS102", "3.0"),
+            ("STU999", "CS101", "3.0"),
+            ("STU002", "CS101", "abc"),
+            ("STU000", "CS101", "2.0"),
+        ])
+        errors_path = os.path.join(self.workdir.name, "errors.csv")
+        report = import_grades(self.registry, path, errors_path, chunk_size=3)
+
+        self.assertEqual((report.rows, report.applied, report.rejected), (7, 3, 4))
+        student = self.registry.get_student("STU000")
+        # The later CS101 row replaces the earlier one; grades are weighted by course credits
+        self.assertEqual(student.grades, {"CS101": 2.0, "CS102": 4.0})
+        self.assertAlmostEqual(student.weighted_gpa, (2.0 * 3 + 4.0 * 4) / 7)
+        self.assertEqual(self.registry.get_student("STU001").grades, {})
+
+        with open(errors_path, newline="", encoding="utf-8") as f:
+            errors = list(csv.reader(f))
+        self.assertEqual([(row[0], row[-1]) for row in errors[1:]], [
+            ("3", "grade must be between 0.0 and 4.0"),
+            ("4", "not enrolled"),
+            ("5", "unknown student"),
+            ("6", "grade must be between 0.0 and 4.0"),
+        ])
+
+    def test_missing_columns_raise(self) -> None:
+        path = self.write("grades.csv", [("student_id", "grade"), ("STU000", "3.0")])
+        with self.assertRaises(ValueError):
+            import_grades(self.registry, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+test_registry.py
+
+Tests for UniversityRegistry.bulk_enroll (rejection reasons, rollback).
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from registry import EnrollmentResult, UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+
+def make_student(i: int) -> Student:
+    return Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                   f"STU{i:03d}", "BSc Computer Science", "2026-02-20")
+
+
+class BulkEnrollTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = UniversityRegistry()
+        self.registry.add_course(Course("CS101", "Intro to Programming", 3, "Dr. Test", 2, "MON 09:00-11:00"))
+        self.registry.add_course(Course("CS102", "Data Structures", 3, "Dr. Test", 10, "MON 10:00-12:00"))
+        for i in range(8):
+            self.registry.add_course(Course(f"GE{i:03d}", f"Elective {i}", 2, "Dr. Test", 10, f"TUE {8 + i:02d}:00-{8 + i:02d}:30"))
+        for i in range(4):
+            self.registry.add_person(make_student(i))
+        self.registry.enroll("STU003", "CS101")
+
+    def test_every_rejection_reason(self) -> None:
+        results = self.registry.bulk_enroll([
+            ("STU000", "cs101"),
+            ("STU999", "CS101"),
+            ("STU000", "XX999"),
+            ("STU000", "CS101"),
+            ("STU003", "CS101"),
+            ("STU001", "CS101"),
+            ("STU000", "CS102"),
+            ("STU002", "CS101"),
+            *((("STU002", f"GE{i:03d}")) for i in range(7)),
+        ])
+        self.assertEqual([(r.accepted, r.reason) for r in results[:8]], [
+            (True, ""),
+            (False, "unknown student"),
+            (False, "unknown course"),
+            (False, "duplicate request"),
+            (False, "already enrolled"),
+            (False, "course full"),
+            (False, "timetable clash with CS101"),
+            (False, "course full"),
+        ])
+        self.assertEqual(results[0], EnrollmentResult("STU000", "CS101", True))
+        self.assertEqual([r.accepted for r in results[8:]], [True] * 6 + [False])
+        self.assertEqual(results[-1].reason, f"exceeds {Student.MAX_COURSES_PER_SEMESTER} courses per semester")
+        self.assertEqual([s.student_id for s in self.registry.roster("CS101")], ["STU003", "STU000"])
+
+    def test_failure_while_applying_rolls_back_the_batch(self) -> None:
+        add_student = Course.add_student
+        calls = []
+
+        def failing(course, student):
+            calls.append(student.student_id)
+            if len(calls) == 3:
+                raise RuntimeError("storage unavailable")
+            add_student(course, student)
+
+        with mock.patch.object(Course, "add_student", failing):
+            with self.assertRaises(RuntimeError):
+                self.registry.bulk_enroll([("STU000", "GE000"), ("STU001", "GE000"), ("STU002", "GE000")])
+
+        self.assertEqual(self.registry.roster("GE000"), [])
+        self.assertEqual([self.registry.get_student(f"STU{i:03d}").enrolled_courses for i in range(3)], [[], [], []])
+
+
+if __name__ == "__main__":
+    unittest.main()
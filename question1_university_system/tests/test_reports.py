@@ -0,0 +1,85 @@
+"""
+test_reports.py
+
+Tests for the streaming reports in reports.py.
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import reports  # noqa: E402
+from course import Course  # noqa: E402
+from department import Department  # noqa: E402
+from faculty import Faculty  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+
+
+class ReportsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = UniversityRegistry()
+        head = Faculty("Dr. Test", "F001", "test@uni.edu", "0700000000", "EMP001", "Computing", "2020-01-01")
+        department = Department("Computing", head)
+        department.add_course(Course("CS101", "Intro to Programming", 3, "Dr. Test", 10))
+        department.add_course(Course("CS102", "Data Structures", 4, "Dr. Test", 10))
+        self.registry.add_department(department)
+        for i in range(3):
+            self.registry.add_person(Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                                             f"STU{i:03d}", "BSc Computer Science", "2026-02-20"))
+            self.registry.enroll(f"STU{i:03d}", "CS101")
+            self.registry.get_course("CS101").record_grade(self.registry.get_student(f"STU{i:03d}"), 1.5 + i)
+
+    def test_roster_rows_carry_gpa_and_status(self) -> None:
+        rows = list(reports.roster_rows(self.registry.get_course("CS101")))
+        self.assertEqual(rows[0], ("CS101", "STU000", "Student 0", "BSc Computer Science", 1.5, "Probation"))
+        self.assertEqual([row[-1] for row in rows], ["Probation", "Good Standing", "Dean's List"])
+
+    def test_paginate_slices_one_page(self) -> None:
+        rows = ((i,) for i in range(7))
+        self.assertEqual(list(reports.paginate(rows, 2, page_size=3)), [(3,), (4,), (5,)])
+        self.assertEqual(list(reports.paginate(iter([(1,)]), 3, page_size=3)), [])
+        with self.assertRaises(ValueError):
+            reports.paginate(iter(()), 0)
+
+    def test_writers_emit_the_same_rows(self) -> None:
+        rows = list(reports.department_rows(self.registry.get_department("Computing")))
+        outputs = {}
+        for fmt in reports.FORMATS:
+            out = io.StringIO()
+            self.assertEqual(reports.write_report(iter(rows), reports.DEPARTMENT_FIELDS, out, fmt), 2)
+            outputs[fmt] = out.getvalue().splitlines()
+
+        self.assertEqual(outputs["csv"][0].split(","), list(reports.DEPARTMENT_FIELDS))
+        self.assertEqual(outputs["csv"][1], "Computing,CS101,Intro to Programming,3,Dr. Test,3,10")
+        self.assertEqual(json.loads(outputs["jsonl"][1])["course_code"], "CS102")
+        self.assertEqual(len(outputs["text"]), 4)
+        with self.assertRaises(ValueError):
+            reports.write_report(iter(rows), reports.DEPARTMENT_FIELDS, io.StringIO(), "xml")
+
+    def test_export_all_departments_and_transcripts(self) -> None:
+        with tempfile.TemporaryDirectory() as out_dir:
+            counts = reports.export_all_departments(self.registry, out_dir)
+            self.assertEqual(counts, {"departments": 2, "faculty": 1, "rosters": 3})
+            with open(os.path.join(out_dir, "rosters.csv"), newline="", encoding="utf-8") as f:
+                rosters = list(csv.DictReader(f))
+            self.assertEqual([row["student_id"] for row in rosters], ["STU000", "STU001", "STU002"])
+
+            path = os.path.join(out_dir, "transcripts.jsonl")
+            self.assertEqual(reports.export_transcripts(self.registry, path, "jsonl"), 3)
+            with open(path, encoding="utf-8") as f:
+                first = json.loads(f.readline())
+            self.assertEqual(first, {"student_id": "STU000", "course_code": "CS101", "grade": 1.5, "credits": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
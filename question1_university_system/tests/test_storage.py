@@ -0,0 +1,125 @@
+"""
+test_storage.py
+
+Round-trip tests for storage.py (SQLite store + StoredRegistry).
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import changes  # noqa: E402
+from course import Course  # noqa: E402
+from department import Department  # noqa: E402
+from events import EventLog  # noqa: E402
+from faculty import Faculty  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from storage import StoredRegistry, UniversityStore  # noqa: E402
+from student import Student  # noqa: E402
+
+
+def make_student(i: int) -> Student:
+    return Student(f"Student {i}", f"P{i:03d}", f"s{i}@stu.edu", "0700000000",
+                   f"STU{i:03d}", "BSc Computer Science", "2026-02-20")
+
+
+class StoredRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.workdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.workdir.name, "university.db")
+
+        registry = UniversityRegistry()
+        course = Course("CS101", "Intro to Programming", 3, "Dr. Test", 10)
+        head = Faculty("Dr. Test", "F001", "test@uni.edu", "0700000000", "EMP001", "Computing", "2020-01-01")
+        department = Department("Computing", head)
+        department.add_course(course)
+        registry.add_department(department)
+        for i in range(3):
+            registry.add_person(make_student(i))
+            registry.enroll(f"STU{i:03d}", "CS101")
+            registry.get_student(f"STU{i:03d}").add_grade("CS101", 3.0, 3)
+        with UniversityStore(self.path) as store:
+            store.save_registry(registry)
+
+    def tearDown(self) -> None:
+        self.workdir.cleanup()
+
+    def test_grade_on_roster_loaded_student_is_saved(self) -> None:
+        with UniversityStore(self.path) as store:
+            registry = StoredRegistry(store)
+            course = registry.get_course("CS101")
+            for student in course.iter_students():
+                course.record_grade(student, 3.5)
+            registry.save()
+
+        with UniversityStore(self.path) as store:
+            registry = StoredRegistry(store)
+            for i in range(3):
+                student = registry.get_student(f"STU{i:03d}")
+                self.assertEqual(student.grades, {"CS101": 3.5})
+                self.assertEqual(student.enrolled_courses, ["CS101"])
+
+    def test_roster_and_lookup_share_one_object(self) -> None:
+        with UniversityStore(self.path) as store:
+            registry = StoredRegistry(store)
+            roster = registry.roster("CS101")
+            self.assertIs(registry.get_student("STU001"), roster[1])
+            self.assertIs(registry.get_person("P001"), roster[1])
+
+    def test_loading_reports_no_changes(self) -> None:
+        with UniversityStore(self.path) as store, EventLog() as log:
+            registry = StoredRegistry(store)
+            version = changes.version()
+            department = registry.get_department("Computing")
+            students = registry.roster("CS101")
+
+            self.assertEqual(len(log), 0)
+            self.assertEqual(changes.version(), version)
+            self.assertEqual([f.person_id for f in department.iter_faculty()], ["F001"])
+            self.assertEqual([s.grades for s in students], [{"CS101": 3.0}] * 3)
+
+    def test_failed_save_keeps_stored_enrollments(self) -> None:
+        class Broken:
+            student_id = "STU001"
+
+            def grade_records(self):
+                raise RuntimeError("disk full")
+
+        with UniversityStore(self.path) as store:
+            with self.assertRaises(RuntimeError):
+                store.save_enrollments([Broken()])
+        with UniversityStore(self.path) as store:
+            student = store.load_student("STU001")
+            self.assertEqual(student.enrolled_courses, ["CS101"])
+            self.assertEqual(student.grades, {"CS101": 3.0})
+
+    def test_unsaved_people_are_listed_and_counted(self) -> None:
+        with UniversityStore(self.path) as store:
+            registry = StoredRegistry(store)
+            registry.add_person(make_student(9))
+            self.assertEqual(len(registry), 5)
+            self.assertEqual([s.student_id for s in registry.students][-1], "STU009")
+            with self.assertRaises(ValueError):
+                registry.add_person(make_student(1))
+
+            registry.save()
+            self.assertEqual(len(registry), 5)
+            self.assertEqual(sum(1 for _ in registry.people), 5)
+
+    def test_course_schedule_round_trips(self) -> None:
+        with UniversityStore(self.path) as store:
+            store.save_courses([Course("CS102", "Data Structures", 3, "Dr. Test", 10, "MON 09:00-11:00; WED 14:00-15:30")])
+        with UniversityStore(self.path) as store:
+            self.assertEqual(store.load_course("CS101").schedule, ())
+            self.assertEqual([str(m) for m in store.load_course("CS102").schedule],
+                             ["MON 09:00-11:00", "WED 14:00-15:30"])
+
+
+if __name__ == "__main__":
+    unittest.main()
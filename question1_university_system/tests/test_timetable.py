@@ -0,0 +1,62 @@
+"""
+test_timetable.py
+
+Tests for timetable parsing, masks and semester_clashes().
+
+Run from question1_university_system/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from course import Course  # noqa: E402
+from registry import UniversityRegistry  # noqa: E402
+from student import Student  # noqa: E402
+from timetable import Clash, Meeting, mask_to_meetings, parse_schedule, schedule_mask, semester_clashes  # noqa: E402
+
+
+class TimetableTest(unittest.TestCase):
+    def test_schedule_mask_round_trips_slot_aligned_meetings(self) -> None:
+        meetings = parse_schedule("mon 09:00-11:00; WED 14:00-15:30")
+        self.assertEqual(meetings, (Meeting("MON", "09:00", "11:00"), Meeting("WED", "14:00", "15:30")))
+        self.assertEqual(mask_to_meetings(schedule_mask(meetings)), list(meetings))
+        # Partial slots are busy: 09:10-09:40 covers 09:00-10:00
+        self.assertEqual(mask_to_meetings(schedule_mask(parse_schedule("TUE 09:10-09:40"))),
+                         [Meeting("TUE", "09:00", "10:00")])
+
+    def test_invalid_meetings_are_rejected(self) -> None:
+        for text in ("MON 11:00-09:00", "XYZ 09:00-10:00", "MON 9-10", "MON 09:00-24:30"):
+            with self.assertRaises(ValueError):
+                parse_schedule(text)
+
+    def test_semester_clashes_reports_every_overlapping_course(self) -> None:
+        registry = UniversityRegistry()
+        for code, schedule in (
+            ("CS101", "MON 09:00-10:00"),
+            ("CS102", "MON 10:00-11:00"),
+            ("CS103", "MON 09:30-10:30"),
+            ("CS104", "TUE 09:00-10:00"),
+            ("CS105", "TUE 09:00-09:30"),
+        ):
+            registry.add_course(Course(code, code, 3, "Dr. Test", 10, schedule))
+        registry.add_person(Student("Student 0", "P000", "s0@stu.edu", "0700000000",
+                                    "STU000", "BSc Computer Science", "2026-02-20"))
+        registry.enroll("STU000", "CS101")
+
+        clashes = semester_clashes(registry, [
+            ("STU000", "CS102"), ("STU000", "cs103"), ("STU000", "CS104"), ("STU000", "CS105"),
+            ("STU999", "CS101"), ("STU000", "XX999"),
+        ])
+        self.assertEqual(clashes, [
+            Clash("STU000", "CS103", "CS101", "MON 09:30-10:00"),
+            Clash("STU000", "CS103", "CS102", "MON 10:00-10:30"),
+            Clash("STU000", "CS105", "CS104", "TUE 09:00-09:30"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
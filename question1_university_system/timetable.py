@@ -0,0 +1,165 @@
+"""
+timetable.py
+
+Weekly timetable slots and clash detection.
+
+A course's meetings (e.g. "MON 09:00-11:00; WED 14:00-15:30") are turned into
+a bitmask over the week, one bit per SLOT_MINUTES slot. A student's busy mask
+is the OR of the masks of their enrolled courses, so checking a new course
+for clashes is a single AND, independent of how many courses are involved.
+semester_clashes() validates a whole batch of enrollments the same way and
+reports every clash.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from registry import UniversityRegistry
+
+DAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+
+
+class Meeting(NamedTuple):
+    """One weekly session: day (MON–SUN) and start/end times ("HH:MM")."""
+
+    day: str
+    start: str
+    end: str
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.start}-{self.end}"
+
+
+class Clash(NamedTuple):
+    """A requested course that overlaps one the student already holds."""
+
+    student_id: str
+    course_code: str
+    conflicts_with: str
+    overlap: str
+
+
+def _minutes(hhmm: str) -> int:
+    try:
+        hours, minutes = hhmm.split(":")
+        total = int(hours) * 60 + int(minutes)
+    except ValueError:
+        raise ValueError(f"Invalid time '{hhmm}', expected HH:MM.") from None
+    if not (0 <= total <= 24 * 60) or not (0 <= int(minutes) < 60):
+        raise ValueError(f"Invalid time '{hhmm}', expected HH:MM.")
+    return total
+
+
+def _hhmm(slot: int) -> str:
+    minutes = slot * SLOT_MINUTES
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_meeting(text: str) -> Meeting:
+    """Parse "MON 09:00-11:00"."""
+    try:
+        day, times = text.split()
+        start, end = times.split("-")
+    except ValueError:
+        raise ValueError(f"Invalid meeting '{text}', expected e.g. 'MON 09:00-11:00'.") from None
+
+    day = day.upper()
+    if day not in DAYS:
+        raise ValueError(f"Invalid day '{day}', expected one of {', '.join(DAYS)}.")
+    if _minutes(start) >= _minutes(end):
+        raise ValueError(f"Meeting '{text}' must end after it starts.")
+    return Meeting(day, start, end)
+
+
+def parse_schedule(schedule: str | Iterable[str | Meeting] | None) -> tuple[Meeting, ...]:
+    """Accept "MON 09:00-11:00; WED 09:00-10:00", a list of such strings, or Meetings."""
+    if not schedule:
+        return ()
+    if isinstance(schedule, str):
+        schedule = [part for part in schedule.split(";") if part.strip()]
+    return tuple(m if isinstance(m, Meeting) else parse_meeting(m.strip()) for m in schedule)
+
+
+def format_schedule(meetings: Iterable[Meeting]) -> str:
+    return "; ".join(str(m) for m in meetings)
+
+
+def meeting_mask(meeting: Meeting) -> int:
+    # Partial slots count as busy: start rounds down, end rounds up
+    first = _minutes(meeting.start) // SLOT_MINUTES
+    last = -(-_minutes(meeting.end) // SLOT_MINUTES)
+    offset = DAYS.index(meeting.day) * SLOTS_PER_DAY
+    return ((1 << (last - first)) - 1) << (offset + first)
+
+
+def schedule_mask(meetings: Iterable[Meeting]) -> int:
+    mask = 0
+    for meeting in meetings:
+        mask |= meeting_mask(meeting)
+    return mask
+
+
+def mask_to_meetings(mask: int) -> list[Meeting]:
+    """Decode a mask back into contiguous meetings (slot-aligned)."""
+    meetings = []
+    for day_index, day in enumerate(DAYS):
+        bits = (mask >> (day_index * SLOTS_PER_DAY)) & DAY_MASK
+        slot = 0
+        while bits:
+            # Jump over the free slots, then over the run of busy ones
+            skip = (bits & -bits).bit_length() - 1
+            bits >>= skip
+            run = (~bits & (bits + 1)).bit_length() - 1
+            bits >>= run
+            meetings.append(Meeting(day, _hhmm(slot + skip), _hhmm(slot + skip + run)))
+            slot += skip + run
+    return meetings
+
+
+def semester_clashes(registry: UniversityRegistry, requests: Iterable[tuple[str, str]]) -> list[Clash]:
+    """
+    Check a semester's (student_id, course_code) enrollments against each
+    student's current timetable and against the earlier requests in the batch.
+    Returns one Clash per requested course and held course it overlaps;
+    clashing requests are not counted as held for later checks. Unknown students or courses are skipped (bulk_enroll reports them).
+    """
+    masks: dict[str, int] = {}
+    busy: dict[str, int] = {}
+    held: dict[str, list[tuple[str, int]]] = {}
+    clashes: list[Clash] = []
+
+    for student_id, course_code in requests:
+        code = course_code.strip().upper()
+        if student_id not in busy:
+            try:
+                student = registry.get_student(student_id)
+            except ValueError:
+                continue
+            busy[student_id] = student.busy_mask
+            held[student_id] = list(student.iter_schedule())
+
+        mask = masks.get(code)
+        if mask is None:
+            try:
+                mask = masks[code] = registry.get_course(code).schedule_mask
+            except ValueError:
+                continue
+
+        if mask & busy[student_id]:
+            # Only on a hit: find the held courses it overlaps (at most a semester's worth)
+            for other, other_mask in held[student_id]:
+                overlap = mask & other_mask
+                if overlap:
+                    clashes.append(Clash(student_id, code, other, format_schedule(mask_to_meetings(overlap))))
+            continue
+
+        busy[student_id] |= mask
+        held[student_id].append((code, mask))
+
+    return clashes
@@ -21,21 +21,31 @@ Bonus (+2): Retry logic with 3 attempts
 
 Output:
 question2_data_analysis/data/raw_books_data.csv
+
+Options (for offline load tests against mock_server.py):
+    --base-url URL   site to scrape (default: $BOOKS_BASE_URL or http://books.toscrape.com/)
+    --pages N        catalogue pages to scrape (default: 10)
+    --delay MIN MAX  seconds to wait between requests (default: 1 2)
+    --snapshot       also record this run in the snapshot store (snapshots.py)
 """
 
+import argparse
 import csv
+import math
 import os
 import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
 
-BASE_URL = "http://books.toscrape.com/"
-CATALOGUE_URL = urljoin(BASE_URL, "catalogue/")
-PAGE_URL = urljoin(BASE_URL, "catalogue/page-{}.html")
+from tracing import traced
+
+BASE_URL = os.environ.get("BOOKS_BASE_URL", "http://books.toscrape.com/")
 
 OUTPUT_CSV = "question2_data_analysis/data/raw_books_data.csv"
 
@@ -44,35 +54,77 @@ HEADERS = {"User-Agent": "Mozilla/5.0"}
 TIMEOUT = (5, 20)  # connect timeout, read timeout (prevents hanging)
 MAX_RETRIES = 3
 PAGES_TO_SCRAPE = 10  # 10 pages ≈ 200 books
+DELAY_RANGE = (1.0, 2.0)  # seconds between requests
+MAX_RETRY_AFTER = 30  # cap on a server's Retry-After (seconds)
+DEFAULT_RETRY_AFTER = 1.0  # when Retry-After is missing or unreadable
 
 RATING_MAP = {"One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5}
 
 
-def sleep_polite() -> None:
-    """Requirement: 1–2 second delay between requests."""
-    time.sleep(random.uniform(1, 2))
+def sleep_polite(delay_range: tuple[float, float] = DELAY_RANGE) -> None:
+    """Requirement: 1–2 second delay between requests (DELAY_RANGE)."""
+    low, high = delay_range
+    if high > 0:
+        time.sleep(random.uniform(low, high))
+
+
+def retry_after_seconds(value: Optional[str]) -> float:
+    """Seconds asked for by a Retry-After header: delta-seconds or an HTTP-date."""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return max(seconds, 0.0) if math.isfinite(seconds) else DEFAULT_RETRY_AFTER
+
+
+def catalogue_url(base_url: str) -> str:
+    return urljoin(base_url, "catalogue/")
+
+
+def page_url(base_url: str, page: int) -> str:
+    return urljoin(base_url, f"catalogue/page-{page}.html")
 
 
-def request_with_retry(session: requests.Session, url: str) -> Optional[requests.Response]:
+@traced
+def request_with_retry(
+    session: requests.Session, url: str, delay_range: tuple[float, float] = DELAY_RANGE
+) -> Optional[requests.Response]:
     """Bonus: retry logic (3 attempts)."""
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             resp = session.get(url, headers=HEADERS, timeout=TIMEOUT)
+            if resp.status_code == 429 and attempt < MAX_RETRIES:
+                # Rate limited: wait as long as the server asks before the next attempt
+                wait = min(retry_after_seconds(resp.headers.get("Retry-After")), MAX_RETRY_AFTER)
+                print(f"[WARN] Attempt {attempt}/{MAX_RETRIES} rate limited for {url}; retrying in {wait:.0f}s")
+                time.sleep(wait)
+                continue
             resp.raise_for_status()
             return resp
         except requests.RequestException as e:
             print(f"[WARN] Attempt {attempt}/{MAX_RETRIES} failed for {url}: {e}")
             if attempt < MAX_RETRIES:
-                sleep_polite()
+                sleep_polite(delay_range)
             else:
                 return None
     return None
 
 
-def extract_category(session: requests.Session, product_url: str) -> str:
+@traced
+def extract_category(
+    session: requests.Session, product_url: str, delay_range: tuple[float, float] = DELAY_RANGE
+) -> str:
     """Extract category from product detail page breadcrumb."""
-    resp = request_with_retry(session, product_url)
-    sleep_polite()
+    resp = request_with_retry(session, product_url, delay_range)
+    sleep_polite(delay_range)
 
     if resp is None:
         return "Unknown"
@@ -89,16 +141,19 @@ def extract_category(session: requests.Session, product_url: str) -> str:
     return "Unknown"
 
 
-def scrape_books() -> list[dict]:
+@traced
+def scrape_books(
+    base_url: str = BASE_URL, pages: int = PAGES_TO_SCRAPE, delay_range: tuple[float, float] = DELAY_RANGE
+) -> list[dict]:
     books: list[dict] = []
 
     with requests.Session() as session:
-        for page in range(1, PAGES_TO_SCRAPE + 1):
-            url = PAGE_URL.format(page)
-            print(f"[INFO] Scraping page {page}/{PAGES_TO_SCRAPE} -> {url}")
+        for page in range(1, pages + 1):
+            url = page_url(base_url, page)
+            print(f"[INFO] Scraping page {page}/{pages} -> {url}")
 
-            resp = request_with_retry(session, url)
-            sleep_polite()
+            resp = request_with_retry(session, url, delay_range)
+            sleep_polite(delay_range)
 
             if resp is None:
                 print(f"[ERROR] Skipping page {page} (failed after retries).")
@@ -120,9 +175,9 @@ def scrape_books() -> list[dict]:
                         rating = RATING_MAP.get(rating_word, 0)
 
                         rel_link = product.select_one("h3 a")["href"]
-                        product_url = urljoin(CATALOGUE_URL, rel_link)
+                        product_url = urljoin(catalogue_url(base_url), rel_link)
 
-                        category = extract_category(session, product_url)
+                        category = extract_category(session, product_url, delay_range)
 
                         books.append(
                             {
@@ -131,6 +186,7 @@ def scrape_books() -> list[dict]:
                                 "rating": rating,
                                 "category": category,
                                 "availability": availability,
+                                "product_url": product_url,
                             }
                         )
 
@@ -145,29 +201,57 @@ def scrape_books() -> list[dict]:
     return books
 
 
-def save_to_csv(data: list[dict]) -> None:
+@traced
+def save_to_csv(data: list[dict], path: str = OUTPUT_CSV) -> None:
     if not data:
         print("[ERROR] No data scraped. CSV not created.")
         return
 
-    os.makedirs("question2_data_analysis/data", exist_ok=True)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
     # IMPORTANT: utf-8-sig helps Excel show £ correctly (no Â£)
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8-sig") as f:
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
         writer = csv.DictWriter(
-            f, fieldnames=["title", "price_gbp", "rating", "category", "availability"]
+            f, fieldnames=["title", "price_gbp", "rating", "category", "availability", "product_url"]
         )
         writer.writeheader()
         writer.writerows(data)
 
-    print(f"[SUCCESS] Saved {len(data)} books -> {OUTPUT_CSV}")
+    print(f"[SUCCESS] Saved {len(data)} books -> {path}")
 
 
-if __name__ == "__main__":
-    scraped_books = scrape_books()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape books from books.toscrape.com (or a mock of it).")
+    parser.add_argument("--base-url", default=BASE_URL, help="site root (default: $BOOKS_BASE_URL or the live site)")
+    parser.add_argument("--pages", type=int, default=PAGES_TO_SCRAPE, help="catalogue pages to scrape")
+    parser.add_argument("--delay", type=float, nargs=2, metavar=("MIN", "MAX"), default=DELAY_RANGE,
+                        help="seconds to wait between requests (default: 1 2)")
+    parser.add_argument("--output", default=OUTPUT_CSV, help="CSV to write")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="record the run in the snapshot store for price/stock history")
+    return parser.parse_args(argv)
+
+
+@traced
+def main(argv=None):
+    args = parse_args(argv)
+
+    scraped_books = scrape_books(args.base_url, args.pages, tuple(args.delay))
     print(f"[INFO] Total books scraped: {len(scraped_books)}")
 
     if len(scraped_books) < 100:
         print("[WARNING] Less than 100 books scraped. Increase PAGES_TO_SCRAPE.")
 
-    save_to_csv(scraped_books)
\ No newline at end of file
+    save_to_csv(scraped_books, args.output)
+
+    if args.snapshot and scraped_books:
+        # Imported here so plain scrapes do not load numpy/pandas
+        from snapshots import SnapshotStore
+
+        run = SnapshotStore().record(scraped_books)
+        print(f"[SAVED] Snapshot run {run['run']}: {run['added']} new, {run['removed']} gone, "
+              f"{run['price_changes']} price and {run['stock_changes']} stock changes")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -18,17 +18,21 @@ Also prints before/after statistics for report documentation.
 import pandas as pd
 import os
 
+from tracing import traced
+
 # File paths
 RAW_FILE = "question2_data_analysis/data/raw_books_data.csv"
 CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
 
 
+@traced
 def load_data():
     print("\n[INFO] Loading raw dataset...")
     df = pd.read_csv(RAW_FILE)
     return df
 
 
+@traced
 def report_basic_stats(df, stage="Before Cleaning"):
     print(f"\n========== {stage} ==========")
     print("\nShape:", df.shape)
@@ -37,6 +41,7 @@ def report_basic_stats(df, stage="Before Cleaning"):
     print("\nDuplicate Rows:", df.duplicated().sum())
 
 
+@traced
 def clean_price(df):
     print("\n[INFO] Cleaning price column...")
     df["price_gbp"] = (
@@ -49,24 +54,28 @@ def clean_price(df):
     return df
 
 
+@traced
 def clean_rating(df):
     print("\n[INFO] Validating rating column...")
     df["rating"] = pd.to_numeric(df["rating"], errors="coerce")
     return df
 
 
+@traced
 def handle_missing(df):
     print("\n[INFO] Handling missing values...")
     df = df.dropna()
     return df
 
 
+@traced
 def remove_duplicates(df):
     print("\n[INFO] Removing duplicate rows...")
     df = df.drop_duplicates()
     return df
 
 
+@traced
 def create_price_category(df):
     print("\n[INFO] Creating price_category column...")
 
@@ -82,18 +91,21 @@ def create_price_category(df):
     return df
 
 
+@traced
 def create_in_stock(df):
     print("\n[INFO] Creating in_stock boolean column...")
     df["in_stock"] = df["availability"].str.contains("In stock", case=False)
     return df
 
 
+@traced
 def save_cleaned_data(df):
     os.makedirs("question2_data_analysis/data", exist_ok=True)
     df.to_csv(CLEAN_FILE, index=False)
     print(f"\n[SUCCESS] Cleaned dataset saved to: {CLEAN_FILE}")
 
 
+@traced
 def main():
     df = load_data()
 
@@ -24,10 +24,13 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from tracing import traced
+
 CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
 OUT_DIR = "question2_data_analysis/data"
 
 
+@traced
 def load_data() -> pd.DataFrame:
     print("[INFO] Loading cleaned dataset...")
     df = pd.read_csv(CLEAN_FILE)
@@ -47,6 +50,7 @@ def load_data() -> pd.DataFrame:
     return df
 
 
+@traced
 def descriptive_stats(df: pd.DataFrame) -> None:
     print("\n================ DESCRIPTIVE STATISTICS (5 marks) ================\n")
 
@@ -97,6 +101,7 @@ def descriptive_stats(df: pd.DataFrame) -> None:
     print(f"\n[INFO] Saved: avg_price_top5_categories.csv, rating_distribution.csv")
 
 
+@traced
 def iqr_outliers(df: pd.DataFrame) -> pd.DataFrame:
     prices = df["price_gbp"]
     q1 = prices.quantile(0.25)
@@ -110,6 +115,7 @@ def iqr_outliers(df: pd.DataFrame) -> pd.DataFrame:
     return outliers, (q1, q3, iqr, lower, upper)
 
 
+@traced
 def inferential_stats(df: pd.DataFrame) -> None:
     print("\n================ INFERENTIAL STATISTICS (5 marks) ================\n")
 
@@ -166,6 +172,7 @@ def inferential_stats(df: pd.DataFrame) -> None:
         print("   - Conclusion: Fail to reject H0. No evidence of a price difference (α=0.05).")
 
 
+@traced
 def main():
     df = load_data()
     print(f"[INFO] Rows available for analysis: {len(df)}")
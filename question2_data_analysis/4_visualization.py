@@ -9,22 +9,134 @@ Creates 4 visualizations (Rubric-aligned + Polished):
 4) Bar Chart (Matplotlib): Average rating by category (top 8)
 
 Outputs saved in: question2_data_analysis/visualizations/
+
+Interactive HTML export modes (--html-mode):
+- standalone: every chart embeds the full plotly.js library (default, opens offline)
+- shared: a single plotly-<version>.min.js is written once next to the charts and
+  each chart only references it, so per-chart files carry just their (typed-array)
+  trace data. The file is named after the installed plotly version, so an upgrade
+  writes a new bundle instead of reusing one that no longer matches the traces.
+Use --dashboard to also combine all charts into one dashboard.html page.
+
+Box plot modes (--box-mode):
+- raw: every price row is sent to the browser and Plotly computes the quartiles
+- precomputed: quartiles, whiskers and IQR outliers are computed here per category
+  (reusing 3_analysis.iqr_outliers), so the chart holds only the summaries
+
+Use --charts to render only some charts. Plotting libraries are imported lazily,
+only for the charts requested, and Matplotlib always uses the headless Agg backend,
+e.g. `--charts histogram` never imports plotly.
 """
 
+import argparse
+import importlib
 import os
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
+
+from tracing import traced
 
 CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
 OUT_DIR = "question2_data_analysis/visualizations"
 
+HTML_MODES = ("standalone", "shared")
+BOX_MODES = ("raw", "precomputed")
+PLOTLY_BUNDLE = "plotly-{version}.min.js"
+DASHBOARD_FILE = "dashboard.html"
+
 
 def ensure_out_dir():
     os.makedirs(OUT_DIR, exist_ok=True)
 
 
+@traced
+def load_pyplot():
+    """Import pyplot on first use with the non-interactive Agg backend (no display needed)."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+@traced
+def load_plotly_express():
+    """Import plotly.express on first use (it pulls in a large dependency tree)."""
+    import plotly.express as px
+
+    return px
+
+
+def plotly_bundle_name() -> str:
+    """File name of the shared bundle for the installed plotly version."""
+    import plotly
+
+    return PLOTLY_BUNDLE.format(version=plotly.__version__)
+
+
+def ensure_plotly_bundle() -> str:
+    """Write the shared plotly.js bundle once per plotly version (reused by every chart in shared mode)."""
+    from plotly.offline import get_plotlyjs
+
+    bundle_path = os.path.join(OUT_DIR, plotly_bundle_name())
+    if not os.path.exists(bundle_path):
+        with open(bundle_path, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+    return bundle_path
+
+
+def write_interactive_html(fig, filename: str, html_mode: str = "standalone") -> str:
+    """
+    Save a Plotly figure as HTML.
+
+    plotly>=6 serialises numeric numpy arrays as base64 typed arrays, so in shared
+    mode the chart file is only the layout + encoded trace data.
+    """
+    if html_mode not in HTML_MODES:
+        raise ValueError(f"html_mode must be one of {HTML_MODES}, got {html_mode!r}")
+
+    out_path = os.path.join(OUT_DIR, filename)
+    if html_mode == "shared":
+        bundle_path = ensure_plotly_bundle()
+        fig.write_html(out_path, include_plotlyjs=os.path.basename(bundle_path))
+    else:
+        fig.write_html(out_path)
+    return out_path
+
+
+@traced
+def write_dashboard(figs: list, images: list[str]) -> str:
+    """Combine interactive figures and static PNG charts into one page using the shared bundle."""
+    bundle_path = ensure_plotly_bundle()
+
+    sections = [
+        f'<section><img src="{os.path.basename(img)}" style="max-width:100%"></section>'
+        for img in images
+    ]
+    sections += [
+        f"<section>{fig.to_html(full_html=False, include_plotlyjs=False)}</section>"
+        for fig in figs
+    ]
+
+    html = (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        '<meta charset="utf-8">\n'
+        "<title>Books Data Dashboard</title>\n"
+        f'<script src="{os.path.basename(bundle_path)}"></script>\n'
+        "</head>\n<body>\n"
+        + "\n".join(sections)
+        + "\n</body>\n</html>\n"
+    )
+
+    out_path = os.path.join(OUT_DIR, DASHBOARD_FILE)
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"[SAVED] {out_path} (Dashboard)")
+    return out_path
+
+
+@traced
 def load_data() -> pd.DataFrame:
     df = pd.read_csv(CLEAN_FILE)
 
@@ -39,9 +151,11 @@ def load_data() -> pd.DataFrame:
 # -------------------------------------------------
 # 1) Histogram (Matplotlib) – Price + mean line
 # -------------------------------------------------
-def plot_histogram_price(df: pd.DataFrame) -> None:
+@traced
+def plot_histogram_price(df: pd.DataFrame) -> str:
     ensure_out_dir()
 
+    plt = load_pyplot()
     mean_price = df["price_gbp"].mean()
 
     plt.figure(figsize=(10, 6))
@@ -59,42 +173,133 @@ def plot_histogram_price(df: pd.DataFrame) -> None:
     plt.savefig(out_path, dpi=200)
     plt.close()
     print(f"[SAVED] {out_path}")
+    return out_path
 
 
 # -------------------------------------------------
 # 2) Interactive Box Plot (Plotly) – Top 5 categories
 # -------------------------------------------------
-def plot_interactive_boxplot_top5(df: pd.DataFrame) -> None:
+@traced
+def box_summary_by_category(df: pd.DataFrame, categories: list[str]):
+    """
+    Compute box-plot statistics per category with the same IQR rule as 3_analysis.
+
+    Returns (summary, outliers): one summary row per category with q1/median/q3 and
+    whiskers (most extreme prices inside the 1.5*IQR fences), plus the outlier rows.
+    """
+    iqr_outliers = importlib.import_module("3_analysis").iqr_outliers
+
+    summary_rows = []
+    outlier_frames = []
+    sub = df[df["category"].isin(categories)]
+    groups = dict(tuple(sub.groupby("category", sort=False)))
+
+    for cat in categories:
+        group = groups[cat]
+        outliers, (q1, q3, iqr, lower, upper) = iqr_outliers(group)
+        inside = group["price_gbp"][group["price_gbp"].between(lower, upper)]
+
+        summary_rows.append(
+            {
+                "category": cat,
+                "q1": q1,
+                "median": group["price_gbp"].median(),
+                "q3": q3,
+                "lowerfence": inside.min(),
+                "upperfence": inside.max(),
+                "mean": group["price_gbp"].mean(),
+            }
+        )
+        outlier_frames.append(outliers)
+
+    summary = pd.DataFrame(summary_rows)
+    outliers = pd.concat(outlier_frames) if outlier_frames else df.iloc[0:0]
+    return summary, outliers
+
+
+def build_precomputed_boxplot(df: pd.DataFrame, categories: list[str]):
+    """Box plot built from server-side summaries: O(categories + outliers) points."""
+    import plotly.graph_objects as go
+
+    summary, outliers = box_summary_by_category(df, categories)
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Box(
+            x=summary["category"],
+            q1=summary["q1"],
+            median=summary["median"],
+            q3=summary["q3"],
+            lowerfence=summary["lowerfence"],
+            upperfence=summary["upperfence"],
+            mean=summary["mean"],
+            name="Price",
+            boxpoints=False,
+        )
+    )
+    if not outliers.empty:
+        fig.add_trace(
+            go.Scatter(
+                x=outliers["category"],
+                y=outliers["price_gbp"],
+                mode="markers",
+                name="Outliers",
+                hovertext=outliers["title"] if "title" in outliers else None,
+            )
+        )
+
+    fig.update_layout(
+        title="Price Comparison Across Top 5 Categories (Interactive)",
+        xaxis_title="Category",
+        yaxis_title="Price (£)",
+        showlegend=False,
+    )
+    return fig
+
+
+@traced
+def plot_interactive_boxplot_top5(
+    df: pd.DataFrame, html_mode: str = "standalone", box_mode: str = "raw"
+):
     ensure_out_dir()
 
     top5 = df["category"].value_counts().head(5).index.tolist()
-    sub = df[df["category"].isin(top5)].copy()
 
-    fig = px.box(
-        sub,
-        x="category",
-        y="price_gbp",
-        points="outliers",
-        title="Price Comparison Across Top 5 Categories (Interactive)",
-        labels={"category": "Category", "price_gbp": "Price (£)"}
-    )
+    if box_mode == "precomputed":
+        fig = build_precomputed_boxplot(df, top5)
+    else:
+        px = load_plotly_express()
+        sub = df[df["category"].isin(top5)].copy()
+
+        fig = px.box(
+            sub,
+            x="category",
+            y="price_gbp",
+            points="outliers",
+            title="Price Comparison Across Top 5 Categories (Interactive)",
+            labels={"category": "Category", "price_gbp": "Price (£)"}
+        )
     fig.update_layout(template="plotly_white")
 
-    out_path = os.path.join(OUT_DIR, "2_boxplot_price_top5_categories_interactive.html")
-    fig.write_html(out_path)
+    out_path = write_interactive_html(
+        fig, "2_boxplot_price_top5_categories_interactive.html", html_mode
+    )
     print(f"[SAVED] {out_path} (Interactive)")
+    return fig
 
 
 # -------------------------------------------------
 # 3) Interactive Scatter (Plotly) – Price vs Rating + regression + jitter
 # -------------------------------------------------
-def plot_interactive_scatter_price_vs_rating(df: pd.DataFrame) -> None:
+@traced
+def plot_interactive_scatter_price_vs_rating(df: pd.DataFrame, html_mode: str = "standalone"):
     ensure_out_dir()
 
     # Jitter ratings slightly so points don't stack perfectly at 1,2,3,4,5
     df = df.copy()
     df["rating_jitter"] = df["rating"] + np.random.uniform(-0.08, 0.08, size=len(df))
 
+    px = load_plotly_express()
     fig = px.scatter(
         df,
         x="rating_jitter",
@@ -107,15 +312,18 @@ def plot_interactive_scatter_price_vs_rating(df: pd.DataFrame) -> None:
     )
     fig.update_layout(template="plotly_white")
 
-    out_path = os.path.join(OUT_DIR, "3_scatter_price_vs_rating_interactive.html")
-    fig.write_html(out_path)
+    out_path = write_interactive_html(
+        fig, "3_scatter_price_vs_rating_interactive.html", html_mode
+    )
     print(f"[SAVED] {out_path} (Interactive)")
+    return fig
 
 
 # -------------------------------------------------
 # 4) Bar Chart (Matplotlib) – Avg rating top 8 categories
 # -------------------------------------------------
-def plot_bar_avg_rating_top8(df: pd.DataFrame) -> None:
+@traced
+def plot_bar_avg_rating_top8(df: pd.DataFrame) -> str:
     ensure_out_dir()
 
     top8 = df["category"].value_counts().head(8).index.tolist()
@@ -127,6 +335,7 @@ def plot_bar_avg_rating_top8(df: pd.DataFrame) -> None:
         .reindex(top8)
     )
 
+    plt = load_pyplot()
     plt.figure(figsize=(11, 6))
     plt.bar(avg_rating.index, avg_rating.values, alpha=0.85, edgecolor="black")
 
@@ -141,18 +350,55 @@ def plot_bar_avg_rating_top8(df: pd.DataFrame) -> None:
     plt.savefig(out_path, dpi=200)
     plt.close()
     print(f"[SAVED] {out_path}")
+    return out_path
+
+
+CHARTS = ("histogram", "boxplot", "scatter", "bar")
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create book data visualizations.")
+    parser.add_argument(
+        "--charts", nargs="+", choices=CHARTS, default=list(CHARTS),
+        help="charts to render (default: all); only the libraries they need are imported",
+    )
+    parser.add_argument(
+        "--html-mode", choices=HTML_MODES, default="standalone",
+        help="standalone: embed plotly.js in every chart; shared: one plotly-<version>.min.js for all charts",
+    )
+    parser.add_argument(
+        "--dashboard", action="store_true",
+        help="also combine all charts into visualizations/dashboard.html (uses the shared bundle)",
+    )
+    parser.add_argument(
+        "--box-mode", choices=BOX_MODES, default="raw",
+        help="raw: send every price row to Plotly; precomputed: send only per-category box statistics",
+    )
+    return parser.parse_args(argv)
+
+
+@traced
+def main(argv=None):
+    args = parse_args(argv)
+
     df = load_data()
     print(f"[INFO] Rows used for visualization: {len(df)}")
 
-    plot_histogram_price(df)
-    plot_interactive_boxplot_top5(df)
-    plot_interactive_scatter_price_vs_rating(df)
-    plot_bar_avg_rating_top8(df)
-
-    print("\n[SUCCESS] All visualizations created.")
+    figs = []
+    images = []
+    if "histogram" in args.charts:
+        images.append(plot_histogram_price(df))
+    if "boxplot" in args.charts:
+        figs.append(plot_interactive_boxplot_top5(df, args.html_mode, args.box_mode))
+    if "scatter" in args.charts:
+        figs.append(plot_interactive_scatter_price_vs_rating(df, args.html_mode))
+    if "bar" in args.charts:
+        images.append(plot_bar_avg_rating_top8(df))
+
+    if args.dashboard:
+        write_dashboard(figs, images)
+
+    print(f"\n[SUCCESS] Visualizations created: {', '.join(args.charts)}.")
     print("Open interactive charts from:")
     print(f"  {OUT_DIR}")
 
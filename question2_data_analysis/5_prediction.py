@@ -13,18 +13,48 @@ Evaluation:
 - Mean Absolute Error (MAE)
 
 Outputs interpretation of feature importance.
+
+Feature encodings (--encoding):
+- dense:   one-hot category columns in a dense DataFrame (original behaviour)
+- sparse:  one-hot category columns kept as a CSR matrix end-to-end
+           (LinearRegression solves sparse input with scipy's lsqr)
+- hashing: category hashed into a fixed number of sparse columns (the width
+           does not grow with the number of categories; an unseen category
+           shares a column with whatever training categories hash there)
+
+Title features (--title hashing|vocab) append TF-IDF title n-grams and
+series/volume columns from title_features.py (sparse). The featurizer is
+fitted on the training split only, so the test titles do not shape the IDF
+weights or the vocabulary. With that many columns per ~200 rows the model
+becomes Ridge(alpha=TITLE_ALPHA) instead of plain least squares.
+
+The fitted encoder + model are saved as one versioned artifact
+(question2_data_analysis/models/price_model.joblib) that price_model.py
+loads for batch/online predictions (rating + category models only).
 """
 
+import argparse
+
 import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction import FeatureHasher
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.metrics import r2_score, mean_absolute_error
 from sklearn.preprocessing import OneHotEncoder
 
+from price_model import MODEL_FILE, save_artifact
+from title_features import MODES as TITLE_MODES, TitleFeaturizer
+from tracing import traced
 
 CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
 
+ENCODINGS = ("dense", "sparse", "hashing")
+HASH_FEATURES = 2 ** 10
+TITLE_ALPHA = 1.0
+
 
+@traced
 def load_data():
     df = pd.read_csv(CLEAN_FILE)
 
@@ -36,31 +66,84 @@ def load_data():
     return df
 
 
-def build_model(df):
+@traced
+def encode_features(df, encoding="dense", n_hash_features=HASH_FEATURES, title_featurizer=None):
+    """
+    Build the design matrix [rating | category features | title features].
+    Title features are added with an already fitted title_featurizer.
+    Returns (X_final, encoder, feature_names).
+    """
+    if title_featurizer is not None:
+        X_final, encoder, feature_names = encode_features(df, encoding, n_hash_features)
+        X_final = add_title_features(X_final, df["title"], title_featurizer)
+        return X_final, encoder, [*feature_names, *title_featurizer.feature_names()]
+
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {ENCODINGS}, got {encoding!r}")
+
     # Features
     X = df[["rating", "category"]]
-    y = df["price_gbp"]
 
-    # One-hot encode category
-    encoder = OneHotEncoder(drop="first", sparse_output=False)
-    category_encoded = encoder.fit_transform(X[["category"]])
+    if encoding == "dense":
+        # One-hot encode category
+        encoder = OneHotEncoder(drop="first", sparse_output=False)
+        category_encoded = encoder.fit_transform(X[["category"]])
+
+        encoded_df = pd.DataFrame(
+            category_encoded,
+            columns=encoder.get_feature_names_out(["category"])
+        )
+
+        # Combine rating + encoded category
+        X_final = pd.concat([X[["rating"]].reset_index(drop=True),
+                             encoded_df.reset_index(drop=True)], axis=1)
+        return X_final, encoder, list(X_final.columns)
+
+    if encoding == "sparse":
+        encoder = OneHotEncoder(drop="first", sparse_output=True)
+        category_encoded = encoder.fit_transform(X[["category"]])
+        category_names = list(encoder.get_feature_names_out(["category"]))
+    else:
+        encoder = FeatureHasher(
+            n_features=n_hash_features, input_type="string", alternate_sign=False
+        )
+        # Hash each distinct category once, then gather rows by category code
+        codes, uniques = pd.factorize(X["category"])
+        category_encoded = encoder.transform([[c] for c in uniques])[codes]
+        category_names = [f"category_hash_{i}" for i in range(n_hash_features)]
 
-    encoded_df = pd.DataFrame(
-        category_encoded,
-        columns=encoder.get_feature_names_out(["category"])
-    )
+    rating = sparse.csr_matrix(X[["rating"]].to_numpy(dtype=float))
+    X_final = sparse.hstack([rating, category_encoded], format="csr")
+    return X_final, encoder, ["rating", *category_names]
+
+
+def add_title_features(X, titles, featurizer):
+    title_encoded = featurizer.transform_parallel(titles.fillna(""))
+    return sparse.hstack([sparse.csr_matrix(X, dtype=float), title_encoded], format="csr")
 
-    # Combine rating + encoded category
-    X_final = pd.concat([X[["rating"]].reset_index(drop=True),
-                         encoded_df.reset_index(drop=True)], axis=1)
+
+@traced
+def build_model(df, encoding="dense", n_hash_features=HASH_FEATURES, title_mode=None):
+    y = df["price_gbp"]
+    X_final, encoder, feature_names = encode_features(df, encoding, n_hash_features)
 
     # Train-test split
     X_train, X_test, y_train, y_test = train_test_split(
         X_final, y, test_size=0.2, random_state=42
     )
 
+    if title_mode is not None:
+        # Same split of the titles; the featurizer only learns from the training rows
+        titles_train, titles_test = train_test_split(
+            df["title"].fillna(""), test_size=0.2, random_state=42
+        )
+        featurizer = TitleFeaturizer(mode=title_mode).fit([titles_train])
+        X_train = add_title_features(X_train, titles_train, featurizer)
+        X_test = add_title_features(X_test, titles_test, featurizer)
+        feature_names = [*feature_names, *featurizer.feature_names()]
+
     # Model
-    model = LinearRegression()
+    model = LinearRegression() if title_mode is None else Ridge(alpha=TITLE_ALPHA)
     model.fit(X_train, y_train)
 
     # Predictions
@@ -70,9 +153,10 @@ def build_model(df):
     r2 = r2_score(y_test, y_pred)
     mae = mean_absolute_error(y_test, y_pred)
 
-    return model, r2, mae, X_final.columns
+    return model, r2, mae, feature_names, encoder
 
 
+@traced
 def interpret_model(model, feature_names):
     coefficients = pd.Series(model.coef_, index=feature_names)
 
@@ -87,17 +171,33 @@ def interpret_model(model, feature_names):
 
     if strongest_feature == "rating":
         print("This suggests rating has the strongest linear relationship with price.")
-    else:
+    elif strongest_feature.startswith("category"):
         print("This suggests category has stronger influence than rating on price.")
+    else:
+        print("This suggests the title carries more price signal than rating or category.")
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Train the book price model.")
+    parser.add_argument("--encoding", choices=ENCODINGS, default="dense",
+                        help="category feature encoding (default: dense one-hot)")
+    parser.add_argument("--hash-features", type=int, default=HASH_FEATURES,
+                        help="number of hashed category columns for --encoding hashing")
+    parser.add_argument("--title", choices=TITLE_MODES, default=None,
+                        help="add TF-IDF title n-gram + series features (default: off)")
+    return parser.parse_args(argv)
+
+
+@traced
+def main(argv=None):
+    args = parse_args(argv)
+
     print("Loading cleaned dataset...")
     df = load_data()
 
     print(f"Dataset size: {len(df)} books")
 
-    model, r2, mae, feature_names = build_model(df)
+    model, r2, mae, feature_names, encoder = build_model(df, args.encoding, args.hash_features, args.title)
 
     print("\nModel Evaluation Results")
     print("-------------------------")
@@ -106,6 +206,15 @@ def main():
 
     interpret_model(model, feature_names)
 
+    if args.title is not None:
+        print("\n[INFO] Title models are not saved: price_model.py serves rating + category models only.")
+    else:
+        save_artifact(
+            model, encoder, feature_names, {"r2": r2, "mae": mae, "n_rows": len(df)},
+            encoding="hashing" if args.encoding == "hashing" else "onehot",
+        )
+        print(f"\n[SAVED] Model artifact -> {MODEL_FILE}")
+
     print("\n[SUCCESS] Predictive analysis completed.")
 
 
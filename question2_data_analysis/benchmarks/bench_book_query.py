@@ -0,0 +1,135 @@
+"""
+bench_book_query.py
+
+Latency benchmark for book_query.py against the pattern the analysis
+scripts use today (load the cleaned CSV, then filter with boolean masks).
+
+A synthetic cleaned catalogue of --rows books is written to a temporary CSV.
+The script then reports:
+- the one-off cost of reading the CSV, building the index, and loading it
+  back from the joblib cache
+- per-query latency for category, rating, price-range and combined filters
+  (BookIndex vs boolean masks on an already-loaded DataFrame), checking
+  that both give the same rows
+- top-N category aggregates (cached) vs a pandas groupby per request
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_book_query.py
+    python question2_data_analysis/benchmarks/bench_book_query.py --rows 5000000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from book_query import BookIndex  # noqa: E402
+from synthetic_books import CATEGORIES, category_weights  # noqa: E402
+
+REPEATS = 50
+
+
+def synthetic_cleaned(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    price = rng.uniform(10, 60, n_rows).round(2)
+    in_stock = rng.random(n_rows) > 0.05
+    return pd.DataFrame({
+        "title": [f"Book {i}" for i in range(n_rows)],
+        "price_gbp": price,
+        "rating": rng.integers(1, 6, n_rows),
+        "category": np.array(CATEGORIES, dtype=object)[
+            rng.choice(len(CATEGORIES), n_rows, p=category_weights(len(CATEGORIES)))
+        ],
+        "availability": np.where(in_stock, "In stock", "Out of stock"),
+        "price_category": np.where(price < 20, "Budget", np.where(price <= 40, "Mid-range", "Premium")),
+        "in_stock": in_stock,
+    })
+
+
+def timed(fn, repeats: int = REPEATS) -> tuple[float, object]:
+    """Mean milliseconds per call, plus the last result."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats * 1e3, result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark indexed book queries against DataFrame masks.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix="bench_book_query_")
+    path = os.path.join(workdir, "cleaned_books_data.csv")
+    synthetic_cleaned(args.rows).to_csv(path, index=False)
+    common = CATEGORIES[0]
+    rare = CATEGORIES[-1]
+
+    try:
+        start = time.perf_counter()
+        df = pd.read_csv(path)
+        read_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        BookIndex.load(path, cache_dir=os.path.join(workdir, "cache"))
+        build_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        index = BookIndex.load(path, cache_dir=os.path.join(workdir, "cache"))
+        cached_ms = (time.perf_counter() - start) * 1e3
+        print(f"[INFO] {args.rows:,} books: read CSV {read_ms:.0f} ms | read + build index {build_ms:.0f} ms | "
+              f"load cached index {cached_ms:.0f} ms\n")
+
+        queries = {
+            f"category={rare}": (dict(category=rare), df["category"] == rare),
+            f"category={common}": (dict(category=common), df["category"] == common),
+            "rating=5": (dict(rating=5), df["rating"] == 5),
+            "price 20.00-20.50": (dict(min_price=20.0, max_price=20.5), df["price_gbp"].between(20.0, 20.5)),
+            f"{common} + rating 4 + price 10-30 + in stock": (
+                dict(category=common, rating=4, min_price=10.0, max_price=30.0, in_stock=True),
+                (df["category"] == common) & (df["rating"] == 4) & df["price_gbp"].between(10.0, 30.0) & df["in_stock"],
+            ),
+        }
+        masks = {
+            f"category={rare}": lambda: df[df["category"] == rare],
+            f"category={common}": lambda: df[df["category"] == common],
+            "rating=5": lambda: df[df["rating"] == 5],
+            "price 20.00-20.50": lambda: df[df["price_gbp"].between(20.0, 20.5)],
+            f"{common} + rating 4 + price 10-30 + in stock": lambda: df[
+                (df["category"] == common) & (df["rating"] == 4) & df["price_gbp"].between(10.0, 30.0) & df["in_stock"]
+            ],
+        }
+
+        print(f"{'query':<48} | {'rows':>8} | {'index ms':>9} | {'mask ms':>8} | {'speedup':>7}")
+        print("-" * 92)
+        mismatches = 0
+        for name, (filters, expected) in queries.items():
+            index_ms, positions = timed(lambda: index.query(**filters))
+            mask_ms, _ = timed(masks[name])
+            mismatches += not np.array_equal(positions.index.to_numpy(), np.flatnonzero(expected.to_numpy()))
+            print(f"{name[:48]:<48} | {len(positions):>8,} | {index_ms:9.3f} | {mask_ms:8.3f} | {mask_ms / index_ms:6.1f}x")
+
+        top_ms, top = timed(lambda: index.top_categories(5, "avg_price"))
+        groupby_ms, _ = timed(lambda: df.groupby("category")["price_gbp"].mean().nlargest(5), repeats=5)
+        print(f"\n[INFO] Top-5 categories by average price: {top_ms:.3f} ms cached vs {groupby_ms:.1f} ms groupby "
+              f"({', '.join(top['category'])})")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if mismatches:
+        print(f"[WARN] {mismatches} queries returned different rows than the DataFrame masks")
+        sys.exit(1)
+    print("\n[SUCCESS] Indexed queries match the DataFrame masks.")
+
+
+if __name__ == "__main__":
+    main()
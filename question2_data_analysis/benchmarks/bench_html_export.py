@@ -0,0 +1,72 @@
+"""
+bench_html_export.py
+
+Compares interactive chart output of 4_visualization.py in "standalone" mode
+(plotly.js embedded in every file) against "shared" mode (one plotly-<version>.min.js +
+lightweight per-chart files).
+
+Reports bytes on disk per chart and the total a browser has to download/parse
+when opening both charts. Browser load time is dominated by parsing plotly.js,
+so the shared total (bundle parsed once, cached across charts) is the relevant
+comparison. The shared export is also repeated with --box-mode precomputed to
+show the box plot shrinking to per-category summaries.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_html_export.py
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+viz = importlib.import_module("4_visualization")
+
+CHART_FILES = [
+    "2_boxplot_price_top5_categories_interactive.html",
+    "3_scatter_price_vs_rating_interactive.html",
+]
+
+
+def export(df, html_mode: str, out_dir: str, box_mode: str = "raw") -> dict:
+    viz.OUT_DIR = out_dir
+    start = time.perf_counter()
+    viz.plot_interactive_boxplot_top5(df, html_mode, box_mode)
+    viz.plot_interactive_scatter_price_vs_rating(df, html_mode)
+    elapsed = time.perf_counter() - start
+
+    sizes = {name: os.path.getsize(os.path.join(out_dir, name)) for name in CHART_FILES}
+    bundle = os.path.join(out_dir, viz.plotly_bundle_name())
+    if os.path.exists(bundle):
+        sizes[os.path.basename(bundle)] = os.path.getsize(bundle)
+    return {"sizes": sizes, "export_seconds": elapsed}
+
+
+def main():
+    df = viz.load_data()
+    print(f"[INFO] Rows used: {len(df)}\n")
+
+    results = {}
+    for mode in viz.HTML_MODES:
+        with tempfile.TemporaryDirectory() as tmp:
+            results[mode] = export(df, mode, tmp)
+    with tempfile.TemporaryDirectory() as tmp:
+        results["shared+precomputed"] = export(df, "shared", tmp, box_mode="precomputed")
+
+    for mode, res in results.items():
+        total = sum(res["sizes"].values())
+        print(f"{mode} (export {res['export_seconds']:.2f}s, total {total / 1024:.1f} KiB)")
+        for name, size in res["sizes"].items():
+            print(f"   - {name}: {size / 1024:.1f} KiB")
+
+    standalone = sum(results["standalone"]["sizes"].values())
+    shared = sum(results["shared"]["sizes"].values())
+    per_chart = sum(results["shared"]["sizes"][n] for n in CHART_FILES)
+    print(f"\nShared mode is {standalone / shared:.1f}x smaller in total;")
+    print(f"per-chart payload after the bundle is cached: {per_chart / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
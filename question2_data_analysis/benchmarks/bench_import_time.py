@@ -0,0 +1,77 @@
+"""
+bench_import_time.py
+
+Import-time benchmark for 4_visualization.py using `python -X importtime`.
+
+Runs the script once per chart selection and reports the total import time,
+the slowest top-level imports, and whether plotly / statsmodels were imported.
+Rendering only the histogram must not import plotly at all.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_import_time.py
+"""
+
+import subprocess
+import sys
+
+SCRIPT = "question2_data_analysis/4_visualization.py"
+
+SELECTIONS = [
+    ["histogram"],
+    ["bar"],
+    ["boxplot"],
+    ["histogram", "boxplot", "scatter", "bar"],
+]
+
+HEAVY_PACKAGES = ("plotly", "statsmodels", "matplotlib", "scipy")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parse `-X importtime` lines into (module, self_us, cumulative_us)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        # one separator space after "|", then two spaces per nesting level
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2].rstrip()[1:]
+        rows.append((name, self_us, cumulative_us))
+    return rows
+
+
+def run(charts: list[str]) -> list[tuple[str, int, int]]:
+    cmd = [sys.executable, "-X", "importtime", SCRIPT, "--charts", *charts]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def main():
+    histogram_imports = None
+
+    for charts in SELECTIONS:
+        rows = run(charts)
+        top_level = [r for r in rows if not r[0].startswith(" ")]
+        total_ms = sum(r[2] for r in top_level) / 1000
+        imported = {r[0].strip().split(".")[0] for r in rows}
+
+        print(f"--charts {' '.join(charts)}")
+        print(f"   - total import time: {total_ms:.0f} ms ({len(rows)} modules)")
+        for pkg in HEAVY_PACKAGES:
+            print(f"   - {pkg:<11}: {'imported' if pkg in imported else 'not imported'}")
+        for name, _, cumulative in sorted(top_level, key=lambda r: r[2], reverse=True)[:5]:
+            print(f"     {cumulative / 1000:8.1f} ms  {name.strip()}")
+        print()
+
+        if charts == ["histogram"]:
+            histogram_imports = imported
+
+    if histogram_imports is not None and "plotly" in histogram_imports:
+        print("[FAIL] Rendering only the histogram imported plotly.")
+        sys.exit(1)
+    print("[OK] Rendering only the histogram avoids plotly entirely.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+bench_pipeline.py
+
+End-to-end benchmark of the books pipeline on synthetic catalogues.
+
+For each size, synthetic_books.py writes a raw_books_data.csv into a
+temporary workspace that mirrors the repository layout, and each stage
+(cleaning, analysis, visualization, prediction) runs there through its own
+main(). Every stage is timed, then run again under tracemalloc for its peak
+traced memory. Results are appended to a JSON history and compared with
+the previous run of the same size. Stages whose cost per row grows more than
+SCALING_WARN times between consecutive sizes are flagged.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_pipeline.py
+    python question2_data_analysis/benchmarks/bench_pipeline.py --rows 1000 100000 1000000 --stages cleaning prediction
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from synthetic_books import generate_books_csv  # noqa: E402
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pipeline_history.json")
+RAW_FILE = "question2_data_analysis/data/raw_books_data.csv"
+DEFAULT_ROWS = (1_000, 10_000, 100_000)
+SCALING_WARN = 2.0
+WARM_UP_ROWS = 200
+
+# stage name -> (module, argv for main(); None for modules whose main() takes no arguments)
+STAGES = {
+    "cleaning": ("2_data_cleaning", None),
+    "analysis": ("3_analysis", None),
+    "visualization": ("4_visualization", []),
+    "prediction": ("5_prediction", []),
+}
+
+
+def run_stage(name: str) -> None:
+    module_name, argv = STAGES[name]
+    module = importlib.import_module(module_name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if argv is None:
+            module.main()
+        else:
+            module.main(argv)
+
+
+def measure(name: str, memory: bool) -> dict:
+    start = time.perf_counter()
+    run_stage(name)
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        run_stage(name)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_mb": peak_mb}
+
+
+@contextlib.contextmanager
+def workspace(n_rows: int):
+    """Temporary directory with a synthetic raw CSV at the repository-relative path, used as cwd."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_books_csv(os.path.join(tmp, RAW_FILE), n_rows)
+        # Stages use repository-relative paths; run them inside the workspace
+        os.chdir(tmp)
+        try:
+            yield os.path.join(tmp, RAW_FILE)
+        finally:
+            os.chdir(cwd)
+
+
+def warm_up(stages: list[str]) -> None:
+    """Run every stage once on a tiny catalogue so imports are not timed."""
+    with workspace(WARM_UP_ROWS):
+        for name in stages:
+            run_stage(name)
+
+
+def run_size(n_rows: int, stages: list[str], memory: bool) -> dict:
+    start = time.perf_counter()
+    with workspace(n_rows) as raw_file:
+        print(f"\n[INFO] {n_rows:,} rows generated in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(raw_file) / 1e6:.1f} MB)")
+        results = {}
+        for name in stages:
+            result = results[name] = measure(name, memory)
+            result["us_per_row"] = result["seconds"] / n_rows * 1e6
+            peak = f"{result['peak_mb']:9.1f} MB" if result["peak_mb"] is not None else ""
+            print(f"  {name:<14} {result['seconds']:8.3f}s  {result['us_per_row']:8.2f} µs/row  {peak}")
+    return results
+
+
+def load_history(path: str) -> list:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def previous_run(history: list, n_rows: int) -> dict | None:
+    for entry in reversed(history):
+        if entry["rows"] == n_rows:
+            return entry
+    return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the books pipeline on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS), help="catalogue sizes")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run of each stage")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON file the results are appended to")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    history = load_history(args.history)
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    warm_up(args.stages)
+    runs = []
+    for n_rows in sorted(args.rows):
+        stages = run_size(n_rows, args.stages, not args.no_memory)
+
+        before = previous_run(history, n_rows)
+        for name, result in stages.items():
+            if before and name in before["stages"]:
+                change = result["seconds"] / before["stages"][name]["seconds"] - 1
+                print(f"  {name:<14} vs previous run ({before['timestamp']}): {change:+.1%}")
+
+        runs.append({"timestamp": timestamp, "python": platform.python_version(), "rows": n_rows, "stages": stages})
+
+    for smaller, larger in zip(runs, runs[1:]):
+        for name in args.stages:
+            growth = larger["stages"][name]["us_per_row"] / smaller["stages"][name]["us_per_row"]
+            if growth > SCALING_WARN:
+                print(f"[WARN] {name}: cost per row grew {growth:.1f}x from "
+                      f"{smaller['rows']:,} to {larger['rows']:,} rows")
+
+    history.extend(runs)
+    with open(args.history, "w") as f:
+        json.dump(history, f, indent=2)
+    print(f"\n[SAVED] Results appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
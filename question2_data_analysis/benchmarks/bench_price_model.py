@@ -0,0 +1,133 @@
+"""
+bench_price_model.py
+
+Latency / throughput benchmark for the persisted price model (price_model.py).
+
+Reports:
+- single-book latency of PricePredictor.predict_one (mean, p50, p99 in µs)
+- vectorized batch throughput of predict_batch (rows/sec) for growing batch sizes
+- the same single-book prediction through sklearn (encoder.transform + model.predict)
+  for reference
+- request latency / throughput of the local HTTP serving mode (GET /predict)
+
+Run from the repository root (after 5_prediction.py has saved the artifact):
+    python question2_data_analysis/benchmarks/bench_price_model.py
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from http.server import ThreadingHTTPServer
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from price_model import MODEL_FILE, PricePredictor, load_artifact, make_handler  # noqa: E402
+
+CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
+
+SINGLE_CALLS = 100_000
+BATCH_SIZES = [1_000, 100_000, 1_000_000, 5_000_000]
+HTTP_REQUESTS = 2_000
+
+
+def bench_single(predictor: PricePredictor, categories: list[str]) -> None:
+    rng = np.random.default_rng(0)
+    ratings = rng.integers(1, 6, SINGLE_CALLS).tolist()
+    cats = [categories[i] for i in rng.integers(0, len(categories), SINGLE_CALLS)]
+
+    timings = np.empty(SINGLE_CALLS)
+    clock = time.perf_counter_ns
+    for i in range(SINGLE_CALLS):
+        start = clock()
+        predictor.predict_one(ratings[i], cats[i])
+        timings[i] = clock() - start
+
+    timings /= 1000
+    print(f"predict_one ({SINGLE_CALLS:,} calls)")
+    print(f"   - mean: {timings.mean():.2f} µs | p50: {np.percentile(timings, 50):.2f} µs"
+          f" | p99: {np.percentile(timings, 99):.2f} µs")
+
+
+def bench_sklearn_single(artifact: dict, category: str, calls: int = 1_000) -> None:
+    encoder, model = artifact["encoder"], artifact["model"]
+    if artifact.get("encoding", "onehot") == "hashing":
+        row = [[category]]
+    else:
+        row = pd.DataFrame({"category": [category]})
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        # model was fitted on a DataFrame; the ndarray here triggers a feature-name warning
+        warnings.simplefilter("ignore")
+        for _ in range(calls):
+            encoded = encoder.transform(row)
+            if sparse.issparse(encoded):
+                encoded = encoded.toarray()
+            X = np.hstack([[[4.0]], encoded])
+            model.predict(X)
+    elapsed = (time.perf_counter() - start) / calls * 1e6
+    print(f"sklearn transform+predict (reference): {elapsed:.1f} µs per book")
+
+
+def bench_batch(predictor: PricePredictor, categories: list[str]) -> None:
+    rng = np.random.default_rng(1)
+    print("\npredict_batch")
+    for n in BATCH_SIZES:
+        ratings = rng.integers(1, 6, n)
+        cats = np.asarray(categories, dtype=object)[rng.integers(0, len(categories), n)]
+
+        start = time.perf_counter()
+        predictor.predict_batch(ratings, cats)
+        elapsed = time.perf_counter() - start
+        print(f"   - {n:>10,} rows: {elapsed * 1000:8.1f} ms ({n / elapsed:,.0f} rows/sec)")
+
+
+def bench_http(predictor: PricePredictor, category: str) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(predictor))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/predict?" + urlencode(
+        {"rating": 4, "category": category}
+    )
+    timings = np.empty(HTTP_REQUESTS)
+    try:
+        for i in range(HTTP_REQUESTS):
+            start = time.perf_counter()
+            with urlopen(url) as resp:
+                json.loads(resp.read())
+            timings[i] = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    timings *= 1000
+    print(f"\nHTTP GET /predict ({HTTP_REQUESTS:,} sequential requests)")
+    print(f"   - p50: {np.percentile(timings, 50):.2f} ms | p99: {np.percentile(timings, 99):.2f} ms"
+          f" | {HTTP_REQUESTS / (timings.sum() / 1000):,.0f} req/sec")
+
+
+def main():
+    artifact = load_artifact(MODEL_FILE)
+    predictor = PricePredictor.from_artifact(artifact)
+    categories = pd.read_csv(CLEAN_FILE, usecols=["category"])["category"].astype(str).str.strip()
+    categories = categories.unique().tolist()
+    print(f"[INFO] Model artifact v{artifact['artifact_version']} created {artifact['created_at']}"
+          f" ({len(categories)} categories)\n")
+
+    bench_single(predictor, categories)
+    bench_sklearn_single(artifact, categories[0])
+    bench_batch(predictor, categories)
+    bench_http(predictor, categories[0])
+
+
+if __name__ == "__main__":
+    main()
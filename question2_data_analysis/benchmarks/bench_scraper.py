@@ -0,0 +1,114 @@
+"""
+bench_scraper.py
+
+Offline load test of 1_scraper.py against mock_server.py.
+
+The mock server runs on a background thread on a free local port. The
+scraper then crawls it with the polite delay turned off, once for each
+fault profile (clean, server errors, rate limiting). Every run reports
+pages/sec, books/sec and requests/sec. It also checks that the scraped
+titles, prices and categories match what the mock generated, so a retry
+bug shows up as a failure rather than a fast number.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_scraper.py
+    python question2_data_analysis/benchmarks/bench_scraper.py --pages 50 --latency-ms 20
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from mock_server import MockConfig, make_book, server_url, start_server  # noqa: E402
+
+scraper = importlib.import_module("1_scraper")
+
+NO_DELAY = (0.0, 0.0)
+
+# name -> (error_rate, rate_limit_rate)
+PROFILES = {
+    "clean": (0.0, 0.0),
+    "errors": (0.05, 0.0),
+    "rate_limited": (0.0, 0.05),
+}
+
+
+def check_books(books: list[dict], config: MockConfig) -> int:
+    """Count scraped books that differ from what the mock served."""
+    mismatches = 0
+    for book_id, row in enumerate(books, start=1):
+        expected = make_book(book_id, config.seed)
+        if (row["title"] != expected.title
+                or row["price_gbp"] != f"£{expected.price:.2f}"
+                or row["category"] != expected.category):
+            mismatches += 1
+    return mismatches
+
+
+def run_profile(name: str, args) -> dict:
+    error_rate, rate_limit_rate = PROFILES[name]
+    config = MockConfig(pages=args.pages, latency_ms=args.latency_ms, error_rate=error_rate,
+                        rate_limit_rate=rate_limit_rate, retry_after=0)
+    server = start_server(config)
+    try:
+        # One listing request per page plus one product request per book
+        requests_made = args.pages * (1 + config.per_page)
+        with contextlib.redirect_stdout(io.StringIO()) as log:
+            start = time.perf_counter()
+            books = scraper.scrape_books(server_url(server), args.pages, NO_DELAY)
+            seconds = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    lines = log.getvalue().splitlines()
+    return {
+        "profile": name,
+        "books": len(books),
+        "expected": args.pages * config.per_page,
+        "mismatches": check_books(books, config),
+        "retries": sum("[WARN] Attempt" in line for line in lines),
+        "seconds": seconds,
+        "pages_per_sec": args.pages / seconds,
+        "books_per_sec": len(books) / seconds,
+        "requests_per_sec": requests_made / seconds,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the scraper against the local mock site.")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print(f"[INFO] Scraping {args.pages} mock pages per profile (latency {args.latency_ms:g} ms, no delay)")
+    print(f"{'profile':<14}{'books':>8}{'retries':>9}{'seconds':>10}{'pages/s':>10}{'books/s':>10}{'req/s':>10}")
+    failed = False
+    for name in args.profiles:
+        r = run_profile(name, args)
+        print(f"{r['profile']:<14}{r['books']:>8}{r['retries']:>9}{r['seconds']:>10.2f}"
+              f"{r['pages_per_sec']:>10.1f}{r['books_per_sec']:>10.1f}{r['requests_per_sec']:>10.1f}")
+        if r["books"] != r["expected"] or r["mismatches"]:
+            print(f"[WARN] {name}: expected {r['expected']} books, got {r['books']} "
+                  f"({r['mismatches']} mismatched)")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    print("[SUCCESS] Every profile scraped the full mock catalogue.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+bench_snapshots.py
+
+Benchmark of snapshots.py against the naive approach of keeping every
+scrape run as a full CSV and diffing / filtering those.
+
+A synthetic catalogue of --rows books is "re-scraped" --runs times. In each
+run a share of prices move, some books flip stock status, and a few are
+delisted or newly listed. For every run the script measures:
+- record:  SnapshotStore.record() (hash join + delta append) vs writing the
+           run's CSV and merging it with the previous CSV to find changes
+- disk:    partition + change-log bytes vs CSV bytes
+Afterwards it times price-history lookups for random titles (indexed change
+log vs a boolean mask over all runs in memory) and the "went out of stock"
+query, and checks both approaches return the same answers.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_snapshots.py
+    python question2_data_analysis/benchmarks/bench_snapshots.py --rows 1000000 --runs 10
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from snapshots import SnapshotStore  # noqa: E402
+from synthetic_books import CATEGORIES, TITLE_WORDS  # noqa: E402
+
+PRICE_CHANGE_RATE = 0.02
+STOCK_FLIP_RATE = 0.01
+CHURN_RATE = 0.005
+QUERIES = 200
+
+
+def base_catalogue(n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    words = np.array(TITLE_WORDS, dtype=object)
+    ids = np.arange(n_rows).astype(str).astype(object)
+    titles = "The " + words[rng.integers(0, len(words), n_rows)] + " of " + words[rng.integers(0, len(words), n_rows)] + " " + ids
+    return pd.DataFrame({
+        "title": titles,
+        "price": rng.uniform(10, 60, n_rows).round(2),
+        "rating": rng.integers(1, 6, n_rows),
+        "category": np.array(CATEGORIES, dtype=object)[rng.integers(0, len(CATEGORIES), n_rows)],
+        "in_stock": rng.random(n_rows) > 0.05,
+        "product_url": "http://books.toscrape.com/catalogue/book_" + ids + "/index.html",
+    })
+
+
+def next_run(books: pd.DataFrame, rng: np.random.Generator, next_id: int) -> pd.DataFrame:
+    books = books.copy()
+    moved = rng.random(len(books)) < PRICE_CHANGE_RATE
+    books.loc[moved, "price"] = (books.loc[moved, "price"] * rng.uniform(0.8, 1.2, moved.sum())).round(2)
+    flipped = rng.random(len(books)) < STOCK_FLIP_RATE
+    books.loc[flipped, "in_stock"] = ~books.loc[flipped, "in_stock"]
+
+    n_churn = int(len(books) * CHURN_RATE)
+    books = books.drop(index=books.index[rng.choice(len(books), n_churn, replace=False)])
+    fresh = base_catalogue(n_churn, rng)
+    ids = np.arange(next_id, next_id + n_churn).astype(str).astype(object)
+    fresh["title"] = fresh["title"].str.replace(r"\d+$", "", regex=True) + ids
+    fresh["product_url"] = "http://books.toscrape.com/catalogue/book_" + ids + "/index.html"
+    return pd.concat([books, fresh], ignore_index=True)
+
+
+def as_scraped(books: pd.DataFrame) -> pd.DataFrame:
+    """The columns 1_scraper.py writes."""
+    return pd.DataFrame({
+        "title": books["title"],
+        "price_gbp": "£" + books["price"].map("{:.2f}".format),
+        "rating": books["rating"],
+        "category": books["category"],
+        "availability": np.where(books["in_stock"], "In stock", "Out of stock"),
+        "product_url": books["product_url"],
+    })
+
+
+def csv_diff(prev_path: str, cur_path: str) -> tuple[int, int]:
+    """Naive change detection: reload both CSVs and merge them on the URL."""
+    prev = pd.read_csv(prev_path)
+    cur = pd.read_csv(cur_path)
+    both = cur.merge(prev, on="product_url", suffixes=("", "_prev"))
+    return int((both["price_gbp"] != both["price_gbp_prev"]).sum()), \
+        int((both["availability"] != both["availability_prev"]).sum())
+
+
+def dir_bytes(path: str, suffix: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path) if f.endswith(suffix))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the snapshot store against CSV diffs.")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = np.random.default_rng(args.seed)
+    workdir = tempfile.mkdtemp(prefix="bench_snapshots_")
+    store = SnapshotStore(os.path.join(workdir, "store"))
+    csv_dir = os.path.join(workdir, "csv")
+    os.makedirs(csv_dir)
+
+    print(f"[INFO] {args.rows:,} books x {args.runs} runs\n")
+    print(f"{'run':>4} | {'record s':>9} | {'csv+diff s':>10} | {'price chg':>9} | {'stock chg':>9} | {'match':>5}")
+    print("-" * 62)
+
+    books = base_catalogue(args.rows, rng)
+    next_id = args.rows
+    history_frames = []
+    mismatches = 0
+    start_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    try:
+        for run in range(args.runs):
+            if run:
+                books = next_run(books, rng, next_id)
+                next_id += int(args.rows * CHURN_RATE)
+            scraped = as_scraped(books)
+
+            start = time.perf_counter()
+            entry = store.record(scraped, start_time + timedelta(days=run))
+            record_s = time.perf_counter() - start
+
+            cur_path = os.path.join(csv_dir, f"run-{run:05d}.csv")
+            start = time.perf_counter()
+            scraped.to_csv(cur_path, index=False)
+            expected = csv_diff(os.path.join(csv_dir, f"run-{run - 1:05d}.csv"), cur_path) if run else (0, 0)
+            naive_s = time.perf_counter() - start
+
+            match = expected == (entry["price_changes"], entry["stock_changes"])
+            mismatches += not match
+            print(f"{run:>4} | {record_s:9.3f} | {naive_s:10.3f} | {entry['price_changes']:>9,} | "
+                  f"{entry['stock_changes']:>9,} | {'yes' if match else 'NO':>5}")
+            history_frames.append(books[["title", "price", "in_stock"]].assign(run=run))
+
+        store_mb = dir_bytes(store.root, ".npz") / 1024 ** 2
+        csv_mb = dir_bytes(csv_dir, ".csv") / 1024 ** 2
+        print(f"\n[INFO] On disk: snapshot store {store_mb:.1f} MB vs run CSVs {csv_mb:.1f} MB")
+
+        # Price history: indexed lookup vs masking every run held in memory
+        all_runs = pd.concat(history_frames, ignore_index=True)
+        titles = books["title"].to_numpy()[rng.integers(0, len(books), QUERIES)]
+        reopened = SnapshotStore(store.root)
+        start = time.perf_counter()
+        indexed = [reopened.price_history(title=t) for t in titles]
+        indexed_ms = (time.perf_counter() - start) / QUERIES * 1e3
+        start = time.perf_counter()
+        scanned = [all_runs[all_runs["title"] == t] for t in titles]
+        scan_ms = (time.perf_counter() - start) / QUERIES * 1e3
+        for hist, rows in zip(indexed, scanned):
+            # The scan sees every run; the change log keeps only the runs where the price moved
+            prices = rows["price"].to_numpy()
+            changes = 1 + int((prices[1:] != prices[:-1]).sum())
+            mismatches += len(hist) != changes
+        print(f"[INFO] Price history: {indexed_ms:.2f} ms/query indexed vs {scan_ms:.2f} ms/query scanning "
+              f"{len(all_runs):,} rows")
+
+        start = time.perf_counter()
+        gone = reopened.went_out_of_stock()
+        print(f"[INFO] Went out of stock in the last run: {len(gone):,} books in "
+              f"{(time.perf_counter() - start) * 1e3:.1f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if mismatches:
+        print(f"[WARN] {mismatches} results differ between the store and the CSV baseline")
+        sys.exit(1)
+    print("\n[SUCCESS] Snapshot store deltas and histories match the CSV baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+bench_sparse_model.py
+
+Memory / fit-time benchmark for the category encodings in 5_prediction.py
+(dense one-hot vs sparse CSR one-hot vs feature hashing) as the number of
+categories grows.
+
+For each configuration the script times encode_features() + LinearRegression.fit
+and records the tracemalloc peak. Dense runs whose design matrix would exceed
+DENSE_LIMIT_GB are skipped and reported with their estimated size.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_sparse_model.py
+"""
+
+import importlib
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+prediction = importlib.import_module("5_prediction")
+
+N_ROWS = 200_000
+CATEGORY_COUNTS = [10, 100, 1_000, 5_000]
+DENSE_LIMIT_GB = 1.0
+
+
+def synthetic_books(n_rows: int, n_categories: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    categories = np.array([f"Category {i}" for i in range(n_categories)], dtype=object)
+    return pd.DataFrame(
+        {
+            "rating": rng.integers(1, 6, n_rows),
+            "category": categories[rng.integers(0, n_categories, n_rows)],
+            "price_gbp": rng.uniform(10, 60, n_rows).round(2),
+        }
+    )
+
+
+def run(df: pd.DataFrame, encoding: str) -> tuple[float, float, float]:
+    """Return (encode_seconds, fit_seconds, peak_mb)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    X, _, _ = prediction.encode_features(df, encoding)
+    encoded = time.perf_counter()
+    LinearRegression().fit(X, df["price_gbp"])
+    fitted = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return encoded - start, fitted - encoded, peak / 1024 ** 2
+
+
+def main():
+    print(f"[INFO] {N_ROWS:,} rows per run\n")
+    print(f"{'categories':>10} | {'encoding':<8} | {'encode s':>9} | {'fit s':>8} | {'peak MB':>9}")
+    print("-" * 57)
+
+    for n_categories in CATEGORY_COUNTS:
+        df = synthetic_books(N_ROWS, n_categories)
+        for encoding in prediction.ENCODINGS:
+            dense_gb = N_ROWS * n_categories * 8 / 1024 ** 3
+            if encoding == "dense" and dense_gb > DENSE_LIMIT_GB:
+                print(f"{n_categories:>10} | {encoding:<8} | skipped (dense matrix ≈ {dense_gb:.1f} GB)")
+                continue
+            encode_s, fit_s, peak_mb = run(df, encoding)
+            print(f"{n_categories:>10} | {encoding:<8} | {encode_s:9.3f} | {fit_s:8.3f} | {peak_mb:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+bench_title_features.py
+
+Throughput benchmark for title_features.py at millions of titles.
+
+Titles are synthesised from the scraped ones (random word prefixes, volume
+numbers and "(Series #n)" suffixes, so the vocabulary keeps growing with the
+row count). transform() featurizes each distinct title once, so the share
+of distinct titles is printed next to the timings. For each size and mode
+the script times:
+- fit:       streamed partial_fit over CHUNK_ROWS chunks + finalize
+- transform: one process vs transform_parallel() on all cores
+and checks that the parallel matrix equals the serial one.
+
+Run from the repository root:
+    python question2_data_analysis/benchmarks/bench_title_features.py
+    python question2_data_analysis/benchmarks/bench_title_features.py --sizes 1000000 5000000 --modes hashing
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from synthetic_books import TITLE_WORDS  # noqa: E402
+from title_features import CHUNK_ROWS, CLEAN_FILE, MODES, TitleFeaturizer  # noqa: E402
+
+DEFAULT_SIZES = (100_000, 1_000_000)
+SERIES_RATE = 0.2
+VOLUME_RATE = 0.1
+
+
+def synthetic_titles(n_rows: int, seed: int = 42) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(CLEAN_FILE, usecols=["title"])["title"].dropna().to_numpy(dtype=object)
+    words = np.array(TITLE_WORDS, dtype=object)
+
+    titles = (
+        words[rng.integers(0, len(words), n_rows)] + " " + words[rng.integers(0, len(words), n_rows)]
+        + " " + base[rng.integers(0, len(base), n_rows)]
+    )
+    volume = rng.random(n_rows) < VOLUME_RATE
+    titles[volume] += ", Vol. " + rng.integers(1, 20, volume.sum()).astype(str).astype(object)
+    series = rng.random(n_rows) < SERIES_RATE
+    titles[series] += (
+        " (" + words[rng.integers(0, len(words), series.sum())]
+        + " Saga #" + rng.integers(1, 12, series.sum()).astype(str).astype(object) + ")"
+    )
+    return pd.Series(titles, dtype=str)
+
+
+def run(titles: pd.Series, mode: str, n_jobs: int) -> dict:
+    start = time.perf_counter()
+    featurizer = TitleFeaturizer(mode=mode).fit(
+        titles.iloc[i:i + CHUNK_ROWS] for i in range(0, len(titles), CHUNK_ROWS)
+    )
+    fitted = time.perf_counter()
+    serial = featurizer.transform_parallel(titles, n_jobs=1)
+    serial_s = time.perf_counter() - fitted
+
+    start_parallel = time.perf_counter()
+    parallel = featurizer.transform_parallel(titles, n_jobs=n_jobs)
+    parallel_s = time.perf_counter() - start_parallel
+
+    return {
+        "fit_s": fitted - start,
+        "serial_s": serial_s,
+        "parallel_s": parallel_s,
+        "columns": serial.shape[1],
+        "matrix_mb": (serial.data.nbytes + serial.indices.nbytes + serial.indptr.nbytes) / 1024 ** 2,
+        "identical": (serial != parallel).nnz == 0,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark title feature extraction.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--jobs", type=int, default=-1, help="workers for the parallel transform")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"[INFO] {os.cpu_count()} CPUs, chunks of {CHUNK_ROWS:,} titles\n")
+    print(f"{'titles':>10} | {'distinct':>8} | {'mode':<7} | {'fit s':>7} | {'1 proc s':>8} | {'parallel s':>10} | "
+          f"{'titles/s (par)':>14} | {'columns':>8} | {'CSR MB':>7}")
+    print("-" * 105)
+
+    mismatched = False
+    for n_rows in args.sizes:
+        titles = synthetic_titles(n_rows)
+        distinct = titles.nunique() / n_rows
+        for mode in args.modes:
+            r = run(titles, mode, args.jobs)
+            print(f"{n_rows:>10,} | {distinct:>8.0%} | {mode:<7} | {r['fit_s']:7.2f} | {r['serial_s']:8.2f} | {r['parallel_s']:10.2f} | "
+                  f"{n_rows / r['parallel_s']:14,.0f} | {r['columns']:8,} | {r['matrix_mb']:7.1f}")
+            if not r["identical"]:
+                print(f"[WARN] Parallel and serial {mode} matrices differ for {n_rows:,} titles")
+                mismatched = True
+
+    if mismatched:
+        sys.exit(1)
+    print("\n[SUCCESS] Parallel transforms match the single-process result.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+book_query.py
+
+Indexed queries over cleaned_books_data.csv, as a library, CLI or local HTTP API.
+
+BookIndex reads the cleaned CSV once and precomputes:
+- a category index and a rating index: row positions grouped by value
+  (category matched after strip + lower, like category_norm in 3_analysis.py)
+- a price index: row positions sorted by price, so a price range is two
+  binary searches
+- per-category aggregates (books, average price / rating, share in stock);
+  top-N rankings over them are cached per (n, metric, order)
+
+A query starts from the most selective index and checks only those rows
+against the remaining filters, so lookups stay in the sub-millisecond to
+millisecond range instead of rescanning the whole DataFrame. The built index
+is cached on disk (joblib.Memory) until the CSV changes.
+
+Usage (from the repository root):
+    python question2_data_analysis/book_query.py books --category Poetry --min-price 20 --max-price 40
+    python question2_data_analysis/book_query.py top --n 5 --by avg_price
+    python question2_data_analysis/book_query.py serve --port 8002
+        GET /books?category=Poetry&rating=5&min_price=10&max_price=30&in_stock=true&limit=20
+        GET /categories/top?n=5&by=avg_price
+"""
+
+import argparse
+import json
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+from joblib import Memory
+
+CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
+CACHE_DIR = "question2_data_analysis/.cache/book_index"
+
+RANKINGS = ("books", "avg_price", "avg_rating", "in_stock_share")
+MAX_RATING = 5
+DEFAULT_LIMIT = 20
+
+
+def group_positions(codes: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row positions ordered by group (positions[bounds[g]:bounds[g + 1]] belong to group g)."""
+    positions = np.argsort(codes, kind="stable")
+    bounds = np.zeros(n_groups + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=n_groups), out=bounds[1:])
+    return positions, bounds
+
+
+def normalize_category(category: str) -> str:
+    return str(category).strip().lower()
+
+
+def check_count(name: str, value: int) -> int:
+    """Row counts (limit, n) must be >= 0: a negative slice would drop rows from the end."""
+    if value < 0:
+        raise ValueError(f"{name} must be >= 0, got {value}")
+    return value
+
+
+class BookIndex:
+    """Read-only cleaned book table with category, rating and price indexes."""
+
+    def __init__(self, df: pd.DataFrame):
+        df = df.dropna(subset=["price_gbp", "rating", "category"]).reset_index(drop=True)
+        self.books = df
+        self.price = pd.to_numeric(df["price_gbp"], errors="coerce").to_numpy(dtype=float)
+        self.rating = pd.to_numeric(df["rating"], errors="coerce").to_numpy(dtype=np.int64)
+        if "in_stock" in df:
+            self.in_stock = df["in_stock"].astype(str).str.lower().isin(["true", "1"]).to_numpy()
+        else:
+            self.in_stock = df["availability"].astype(str).str.contains("In stock", case=False).to_numpy()
+
+        codes, names = pd.factorize(df["category"].astype(str).str.strip().str.lower())
+        self.category_codes = codes
+        self._category_lookup = {name: code for code, name in enumerate(names)}
+        self._category_positions, self._category_bounds = group_positions(codes, len(names))
+        self._rating_positions, self._rating_bounds = group_positions(
+            np.clip(self.rating, 0, MAX_RATING), MAX_RATING + 1
+        )
+        self._price_order = np.argsort(self.price, kind="stable")
+        self._sorted_price = self.price[self._price_order]
+
+        # Display name = first spelling seen for each normalised category
+        first_rows = self._category_positions[self._category_bounds[:-1]]
+        books = np.bincount(codes, minlength=len(names))
+        self.category_stats = pd.DataFrame({
+            "category": df["category"].astype(str).str.strip().to_numpy()[first_rows],
+            "books": books,
+            "avg_price": np.bincount(codes, weights=self.price, minlength=len(names)) / books,
+            "avg_rating": np.bincount(codes, weights=self.rating, minlength=len(names)) / books,
+            "in_stock_share": np.bincount(codes, weights=self.in_stock, minlength=len(names)) / books,
+        })
+        self._top_cache = {}
+
+    @classmethod
+    def from_csv(cls, path: str = CLEAN_FILE) -> "BookIndex":
+        return cls(pd.read_csv(path))
+
+    @classmethod
+    def load(cls, path: str = CLEAN_FILE, cache_dir: str = CACHE_DIR) -> "BookIndex":
+        """Index for `path`, reused from the on-disk cache while the CSV is unchanged."""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No cleaned dataset at {path}. Run 2_data_cleaning.py first.")
+        stat = os.stat(path)
+        build = Memory(cache_dir, verbose=0).cache(_build_index) if cache_dir else _build_index
+        return build(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    def __len__(self) -> int:
+        return len(self.books)
+
+    # ---------- index lookups (sorted row positions) ----------
+
+    def category_positions(self, category: str) -> np.ndarray:
+        code = self._category_lookup.get(normalize_category(category))
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self._category_positions[self._category_bounds[code]:self._category_bounds[code + 1]]
+
+    def rating_positions(self, rating: int) -> np.ndarray:
+        if not 0 <= rating <= MAX_RATING:
+            return np.empty(0, dtype=np.int64)
+        return self._rating_positions[self._rating_bounds[rating]:self._rating_bounds[rating + 1]]
+
+    def price_positions(self, min_price: float = None, max_price: float = None) -> np.ndarray:
+        lo = 0 if min_price is None else np.searchsorted(self._sorted_price, min_price, side="left")
+        hi = len(self.price) if max_price is None else np.searchsorted(self._sorted_price, max_price, side="right")
+        return np.sort(self._price_order[lo:hi])
+
+    # ---------- queries ----------
+
+    def query_positions(self, category: str = None, rating: int = None, min_price: float = None,
+                        max_price: float = None, in_stock: bool = None) -> np.ndarray:
+        """Row positions (in file order) matching every given filter."""
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError(f"min_price ({min_price}) is greater than max_price ({max_price})")
+
+        # Candidate sizes are known before materialising anything: start from the smallest
+        candidates = []
+        if category is not None:
+            code = self._category_lookup.get(normalize_category(category), -1)
+            size = 0 if code < 0 else self._category_bounds[code + 1] - self._category_bounds[code]
+            candidates.append((size, "category"))
+        if rating is not None:
+            size = self._rating_bounds[rating + 1] - self._rating_bounds[rating] if 0 <= rating <= MAX_RATING else 0
+            candidates.append((size, "rating"))
+        if min_price is not None or max_price is not None:
+            lo = 0 if min_price is None else np.searchsorted(self._sorted_price, min_price, side="left")
+            hi = len(self.price) if max_price is None else np.searchsorted(self._sorted_price, max_price, side="right")
+            candidates.append((hi - lo, "price"))
+
+        if not candidates:
+            positions = np.arange(len(self.books))
+            driver = None
+        else:
+            driver = min(candidates)[1]
+            if driver == "category":
+                positions = self.category_positions(category)
+            elif driver == "rating":
+                positions = self.rating_positions(rating)
+            else:
+                positions = self.price_positions(min_price, max_price)
+
+        mask = np.ones(len(positions), dtype=bool)
+        if category is not None and driver != "category":
+            mask &= self.category_codes[positions] == self._category_lookup.get(normalize_category(category), -1)
+        if rating is not None and driver != "rating":
+            mask &= self.rating[positions] == rating
+        if driver != "price":
+            if min_price is not None:
+                mask &= self.price[positions] >= min_price
+            if max_price is not None:
+                mask &= self.price[positions] <= max_price
+        if in_stock is not None:
+            mask &= self.in_stock[positions] == in_stock
+        return positions[mask]
+
+    def query(self, limit: int = None, **filters) -> pd.DataFrame:
+        """Matching books (see query_positions for the filters), at most `limit` rows."""
+        positions = self.query_positions(**filters)
+        if limit is not None:
+            check_count("limit", limit)
+        return self.books.iloc[positions[:limit]]
+
+    def top_categories(self, n: int = 5, by: str = "books", ascending: bool = False) -> pd.DataFrame:
+        """Top-N categories by an aggregate; each (n, by, ascending) is computed once."""
+        if by not in RANKINGS:
+            raise ValueError(f"by must be one of {RANKINGS}, got {by!r}")
+        # Any n past the number of categories gives the same table: keeps the cache bounded
+        n = min(check_count("n", n), len(self.category_stats))
+        key = (n, by, ascending)
+        if key not in self._top_cache:
+            ranked = self.category_stats.sort_values([by, "category"], ascending=[ascending, True], kind="stable")
+            self._top_cache[key] = ranked.head(n).reset_index(drop=True)
+        return self._top_cache[key].copy()
+
+
+def _build_index(path, size, mtime):
+    # size/mtime only take part in the cache key: any change to the CSV rebuilds
+    return BookIndex.from_csv(path)
+
+
+def records(df: pd.DataFrame) -> list[dict]:
+    """JSON-ready rows (numpy scalars -> Python types)."""
+    return json.loads(df.to_json(orient="records"))
+
+
+def parse_filters(params: dict) -> tuple[dict, int]:
+    """Query-string values -> (query filters, limit); raises ValueError on bad input."""
+    def first(name):
+        return params[name][0] if name in params else None
+
+    filters = {
+        "category": first("category"),
+        "rating": int(first("rating")) if first("rating") is not None else None,
+        "min_price": float(first("min_price")) if first("min_price") is not None else None,
+        "max_price": float(first("max_price")) if first("max_price") is not None else None,
+        "in_stock": None,
+    }
+    if first("in_stock") is not None:
+        value = first("in_stock").lower()
+        if value not in ("true", "false", "1", "0"):
+            raise ValueError(f"in_stock must be true or false, got {value!r}")
+        filters["in_stock"] = value in ("true", "1")
+    limit = check_count("limit", int(first("limit"))) if first("limit") is not None else DEFAULT_LIMIT
+    return filters, limit
+
+
+def parse_top(params: dict) -> tuple[int, str, bool]:
+    """Query-string values -> top_categories() arguments; raises ValueError on bad input."""
+    n = check_count("n", int(params.get("n", ["5"])[0]))
+    by = params.get("by", ["books"])[0]
+    if by not in RANKINGS:
+        raise ValueError(f"by must be one of {RANKINGS}, got {by!r}")
+    return n, by, params.get("order", ["desc"])[0] == "asc"
+
+
+def make_handler(index: BookIndex):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            try:
+                if url.path == "/books":
+                    filters, limit = parse_filters(params)
+                    positions = index.query_positions(**filters)
+                    books = index.books.iloc[positions[:limit]]
+                    self._send_json(200, {"count": len(positions), "books": records(books)})
+                elif url.path == "/categories/top":
+                    self._send_json(200, {"categories": records(index.top_categories(*parse_top(params)))})
+                else:
+                    self._send_json(404, {"error": "not found"})
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+
+        def log_message(self, format, *args):
+            pass
+
+    return QueryHandler
+
+
+def serve(index: BookIndex, host: str = "127.0.0.1", port: int = 8002) -> None:
+    server = ThreadingHTTPServer((host, port), make_handler(index))
+    print(f"[INFO] Serving {len(index)} books on http://{host}:{port}/books and /categories/top (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the cleaned book dataset through precomputed indexes.")
+    parser.add_argument("--input", default=CLEAN_FILE, help="cleaned CSV")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_books = sub.add_parser("books", help="list books matching filters")
+    p_books.add_argument("--category")
+    p_books.add_argument("--rating", type=int)
+    p_books.add_argument("--min-price", type=float)
+    p_books.add_argument("--max-price", type=float)
+    p_books.add_argument("--in-stock", choices=("true", "false"))
+    p_books.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+
+    p_top = sub.add_parser("top", help="top-N categories by an aggregate")
+    p_top.add_argument("--n", type=int, default=5)
+    p_top.add_argument("--by", choices=RANKINGS, default="books")
+    p_top.add_argument("--ascending", action="store_true")
+
+    p_serve = sub.add_parser("serve", help="run a local HTTP query server")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8002)
+
+    args = parser.parse_args(argv)
+    for name in ("limit", "n"):
+        if getattr(args, name, 0) < 0:
+            parser.error(f"--{name} must be >= 0")
+    start = time.perf_counter()
+    index = BookIndex.load(args.input)
+    load_ms = (time.perf_counter() - start) * 1e3
+
+    if args.command == "books":
+        start = time.perf_counter()
+        positions = index.query_positions(
+            category=args.category, rating=args.rating, min_price=args.min_price, max_price=args.max_price,
+            in_stock=None if args.in_stock is None else args.in_stock == "true",
+        )
+        query_ms = (time.perf_counter() - start) * 1e3
+        print(f"[INFO] {len(positions)} matching books (index loaded in {load_ms:.1f} ms, query {query_ms:.3f} ms)")
+        if len(positions):
+            columns = ["title", "price_gbp", "rating", "category", "availability"]
+            print(index.books.iloc[positions[:args.limit]][columns].to_string(index=False))
+    elif args.command == "top":
+        print(index.top_categories(args.n, args.by, args.ascending).to_string(index=False))
+    elif args.command == "serve":
+        serve(index, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
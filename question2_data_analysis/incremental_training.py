@@ -0,0 +1,159 @@
+"""
+incremental_training.py
+
+Out-of-core training for the book price model (5_prediction.py).
+
+The cleaned dataset is streamed in chunks, so memory stays O(chunk + categories)
+however large the catalogue is:
+1) First pass: build the category vocabulary (sorted, like OneHotEncoder).
+2) Second pass: accumulate the normal equations XᵀX and Xᵀy for the design
+   [intercept | rating | one-hot category (first category dropped)].
+   Because the one-hot columns are mutually exclusive, XᵀX is assembled from
+   per-category counts/sums (np.bincount) instead of materialising X.
+3) Solve XᵀX β = Xᵀy.
+
+On data that fits in memory the coefficients match LinearRegression fitted on
+the same rows (use --verify to check).
+
+Usage (from the repository root):
+    python question2_data_analysis/incremental_training.py --chunksize 50000 --verify
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
+CHUNK_SIZE = 100_000
+USECOLS = ["price_gbp", "rating", "category"]
+
+
+def read_chunks(path: str = CLEAN_FILE, chunksize: int = CHUNK_SIZE):
+    """Yield cleaned chunks with the same dtype handling as 5_prediction.load_data()."""
+    for chunk in pd.read_csv(path, usecols=USECOLS, chunksize=chunksize):
+        chunk["price_gbp"] = pd.to_numeric(chunk["price_gbp"], errors="coerce")
+        chunk["rating"] = pd.to_numeric(chunk["rating"], errors="coerce")
+        chunk["category"] = chunk["category"].astype(str).str.strip()
+        yield chunk.dropna(subset=USECOLS)
+
+
+def build_vocabulary(path: str = CLEAN_FILE, chunksize: int = CHUNK_SIZE) -> list[str]:
+    """First pass: the fixed, sorted category vocabulary."""
+    vocabulary: set[str] = set()
+    for chunk in read_chunks(path, chunksize):
+        vocabulary.update(chunk["category"].unique())
+    return sorted(vocabulary)
+
+
+class NormalEquations:
+    """Running sufficient statistics for [intercept | rating | one-hot(drop first)]."""
+
+    def __init__(self, vocabulary: list[str]) -> None:
+        self.vocabulary = list(vocabulary)
+        k = len(self.vocabulary)
+
+        self.n = 0
+        self.sum_r = 0.0
+        self.sum_rr = 0.0
+        self.sum_y = 0.0
+        self.sum_ry = 0.0
+        self.count_k = np.zeros(k)
+        self.sum_r_k = np.zeros(k)
+        self.sum_y_k = np.zeros(k)
+
+    def partial_fit(self, chunk: pd.DataFrame) -> None:
+        codes = pd.Index(self.vocabulary).get_indexer(chunk["category"])
+        if (codes < 0).any():
+            unknown = sorted(set(chunk["category"][codes < 0]))
+            raise ValueError(f"Categories not in the fixed vocabulary: {unknown[:5]}")
+
+        r = chunk["rating"].to_numpy(dtype=float)
+        y = chunk["price_gbp"].to_numpy(dtype=float)
+        k = len(self.vocabulary)
+
+        self.n += len(chunk)
+        self.sum_r += r.sum()
+        self.sum_rr += r @ r
+        self.sum_y += y.sum()
+        self.sum_ry += r @ y
+        self.count_k += np.bincount(codes, minlength=k)
+        self.sum_r_k += np.bincount(codes, weights=r, minlength=k)
+        self.sum_y_k += np.bincount(codes, weights=y, minlength=k)
+
+    def system(self) -> tuple[np.ndarray, np.ndarray]:
+        """Assemble XᵀX and Xᵀy (category 0 is the dropped baseline)."""
+        k = len(self.vocabulary)
+        p = 2 + (k - 1)
+
+        XtX = np.zeros((p, p))
+        XtX[0, 0] = self.n
+        XtX[0, 1] = XtX[1, 0] = self.sum_r
+        XtX[1, 1] = self.sum_rr
+        XtX[0, 2:] = XtX[2:, 0] = self.count_k[1:]
+        XtX[1, 2:] = XtX[2:, 1] = self.sum_r_k[1:]
+        XtX[2:, 2:] = np.diag(self.count_k[1:])
+
+        Xty = np.concatenate([[self.sum_y, self.sum_ry], self.sum_y_k[1:]])
+        return XtX, Xty
+
+    def solve(self) -> tuple[float, pd.Series]:
+        """Return (intercept, coefficients) named like 5_prediction's features."""
+        XtX, Xty = self.system()
+        beta = np.linalg.lstsq(XtX, Xty, rcond=None)[0]
+
+        names = ["rating"] + [f"category_{c}" for c in self.vocabulary[1:]]
+        return float(beta[0]), pd.Series(beta[1:], index=names)
+
+
+def fit_incremental(path: str = CLEAN_FILE, chunksize: int = CHUNK_SIZE):
+    vocabulary = build_vocabulary(path, chunksize)
+    equations = NormalEquations(vocabulary)
+    for chunk in read_chunks(path, chunksize):
+        equations.partial_fit(chunk)
+    intercept, coefs = equations.solve()
+    return intercept, coefs, equations.n
+
+
+def verify_against_in_memory(path: str, intercept: float, coefs: pd.Series) -> bool:
+    """Fit LinearRegression on the full (small) dataset and compare coefficients."""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import OneHotEncoder
+
+    df = pd.concat(read_chunks(path), ignore_index=True)
+    encoder = OneHotEncoder(drop="first", sparse_output=False)
+    X = np.column_stack([df["rating"].to_numpy(dtype=float), encoder.fit_transform(df[["category"]])])
+    model = LinearRegression().fit(X, df["price_gbp"])
+
+    max_diff = max(abs(model.intercept_ - intercept), np.abs(model.coef_ - coefs.to_numpy()).max())
+    ok = np.isclose(model.intercept_, intercept) and np.allclose(model.coef_, coefs.to_numpy())
+    print(f"\nIn-memory LinearRegression check: max |Δ| = {max_diff:.2e} -> {'MATCH' if ok else 'MISMATCH'}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the price model out-of-core.")
+    parser.add_argument("--file", default=CLEAN_FILE, help="cleaned books CSV")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--verify", action="store_true",
+                        help="compare with an in-memory LinearRegression fit (small data only)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    intercept, coefs, n_rows = fit_incremental(args.file, args.chunksize)
+    elapsed = time.perf_counter() - start
+    print(f"[INFO] Trained on {n_rows:,} rows in chunks of {args.chunksize:,} ({elapsed:.2f}s)")
+
+    print(f"\nIntercept: {intercept:.4f}")
+    print("\nFeature Coefficients:")
+    print(coefs.sort_values(key=abs, ascending=False))
+
+    if args.verify and not verify_against_in_memory(args.file, intercept, coefs):
+        raise SystemExit(1)
+
+    print("\n[SUCCESS] Incremental training completed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+mock_server.py
+
+Local stand-in for books.toscrape.com, for load-testing 1_scraper.py offline.
+
+Serves catalogue listing pages (/catalogue/page-N.html) and product pages
+(/catalogue/<slug>_<id>/index.html) with the same markup the scraper reads:
+article.product_pod, p.star-rating, p.price_color, p.instock.availability
+and ul.breadcrumb. Books are generated deterministically from their id, so
+any number of pages can be served without storing data. Latency, random
+500 errors and 429 rate limiting (with Retry-After) are configurable.
+--revision N serves the same catalogue with some prices and stock levels
+changed, so successive scrapes give snapshots.py something to track.
+
+Usage (from the repository root):
+    python question2_data_analysis/mock_server.py --pages 500 --latency-ms 20 --error-rate 0.02 --rate-limit-rate 0.01
+    python question2_data_analysis/1_scraper.py --base-url http://127.0.0.1:8001/ --pages 50 --delay 0 0
+"""
+
+import argparse
+import html
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+from synthetic_books import CATEGORIES, TITLE_WORDS
+
+RATING_WORDS = ("One", "Two", "Three", "Four", "Five")
+PAGE_PATH = re.compile(r"^/catalogue/page-(\d+)\.html$")
+PRODUCT_PATH = re.compile(r"^/catalogue/[a-z0-9-]+_(\d+)/index\.html$")
+# Per revision: share of books whose price moves, and whose stock status flips
+REVISION_PRICE_RATE = 0.10
+REVISION_STOCK_RATE = 0.05
+
+
+class MockConfig(NamedTuple):
+    pages: int = 50
+    per_page: int = 20
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    seed: int = 42
+    revision: int = 0
+
+
+class MockBook(NamedTuple):
+    book_id: int
+    title: str
+    price: float
+    rating: int
+    category: str
+    in_stock: bool
+
+    @property
+    def slug(self) -> str:
+        return f"{re.sub(r'[^a-z0-9]+', '-', self.title.lower()).strip('-')}_{self.book_id}"
+
+
+def make_book(book_id: int, seed: int = 42, revision: int = 0) -> MockBook:
+    rng = random.Random(seed * 1_000_003 + book_id)
+    title = f"The {rng.choice(TITLE_WORDS)} of {rng.choice(TITLE_WORDS)} {book_id}"
+    book = MockBook(
+        book_id, title, round(rng.uniform(10.0, 60.0), 2), rng.randint(1, 5),
+        rng.choice(CATEGORIES), rng.random() > 0.05,
+    )
+    for rev in range(1, revision + 1):
+        rng = random.Random((seed * 1_000_003 + book_id) * 7919 + rev)
+        if rng.random() < REVISION_PRICE_RATE:
+            book = book._replace(price=round(book.price * rng.uniform(0.8, 1.2), 2))
+        if rng.random() < REVISION_STOCK_RATE:
+            book = book._replace(in_stock=not book.in_stock)
+    return book
+
+
+def availability_text(book: MockBook) -> str:
+    return "In stock" if book.in_stock else "Out of stock"
+
+
+def render_listing(page: int, config: MockConfig) -> str:
+    first = (page - 1) * config.per_page + 1
+    articles = []
+    for book_id in range(first, first + config.per_page):
+        book = make_book(book_id, config.seed, config.revision)
+        title = html.escape(book.title, quote=True)
+        articles.append(f"""
+<li class="col-xs-6 col-sm-4 col-md-3 col-lg-3">
+  <article class="product_pod">
+    <div class="image_container"><a href="{book.slug}/index.html"><img src="../media/cache/{book.book_id}.jpg" alt="{title}" class="thumbnail"></a></div>
+    <p class="star-rating {RATING_WORDS[book.rating - 1]}">
+      <i class="icon-star"></i><i class="icon-star"></i><i class="icon-star"></i><i class="icon-star"></i><i class="icon-star"></i>
+    </p>
+    <h3><a href="{book.slug}/index.html" title="{title}">{html.escape(book.title[:30])}...</a></h3>
+    <div class="product_price">
+      <p class="price_color">£{book.price:.2f}</p>
+      <p class="instock availability"><i class="icon-ok"></i> {availability_text(book)}</p>
+    </div>
+  </article>
+</li>""")
+
+    pager = f'<li class="current">Page {page} of {config.pages}</li>'
+    if page < config.pages:
+        pager += f'<li class="next"><a href="page-{page + 1}.html">next</a></li>'
+    return f"""<!DOCTYPE html>
+<html lang="en-us"><head><meta charset="utf-8"><title>All products | Books to Scrape - Sandbox</title></head>
+<body><div class="page_inner"><section>
+<ol class="row">{"".join(articles)}
+</ol>
+<ul class="pager">{pager}</ul>
+</section></div></body></html>"""
+
+
+def render_product(book: MockBook) -> str:
+    title = html.escape(book.title)
+    category = html.escape(book.category)
+    return f"""<!DOCTYPE html>
+<html lang="en-us"><head><meta charset="utf-8"><title>{title} | Books to Scrape - Sandbox</title></head>
+<body><div class="page_inner">
+<ul class="breadcrumb">
+  <li><a href="../../index.html">Home</a></li>
+  <li><a href="../category/books_1/index.html">Books</a></li>
+  <li><a href="../category/books/{category.lower().replace(" ", "-")}_2/index.html">{category}</a></li>
+  <li class="active">{title}</li>
+</ul>
+<article class="product_page"><div class="col-sm-6 product_main">
+  <h1>{title}</h1>
+  <p class="price_color">£{book.price:.2f}</p>
+  <p class="instock availability"><i class="icon-ok"></i> {availability_text(book)}</p>
+  <p class="star-rating {RATING_WORDS[book.rating - 1]}"></p>
+</div></article>
+</div></body></html>"""
+
+
+def make_handler(config: MockConfig):
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+
+    class MockBooksHandler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: str, headers: dict | None = None) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            with rng_lock:
+                delay = max(config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms), 0.0)
+                roll = rng.random()
+            if delay:
+                time.sleep(delay / 1000)
+
+            if roll < config.rate_limit_rate:
+                self._send(429, "Too Many Requests", {"Retry-After": str(config.retry_after)})
+                return
+            if roll < config.rate_limit_rate + config.error_rate:
+                self._send(500, "Internal Server Error")
+                return
+
+            path = self.path.split("?", 1)[0]
+            if path in ("/", "/index.html", "/catalogue/", "/catalogue/index.html"):
+                self._send(200, render_listing(1, config))
+                return
+
+            match = PAGE_PATH.match(path)
+            if match and 1 <= int(match.group(1)) <= config.pages:
+                self._send(200, render_listing(int(match.group(1)), config))
+                return
+
+            match = PRODUCT_PATH.match(path)
+            if match and 1 <= int(match.group(1)) <= config.pages * config.per_page:
+                self._send(200, render_product(make_book(int(match.group(1)), config.seed, config.revision)))
+                return
+
+            self._send(404, "Not Found")
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockBooksHandler
+
+
+def start_server(config: MockConfig = MockConfig(), host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the server on a background thread (port 0 picks a free port); call shutdown() to stop."""
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/"
+
+
+def serve(config: MockConfig, host: str = "127.0.0.1", port: int = 8001) -> None:
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    print(f"[INFO] Mock books.toscrape.com on http://{host}:{port}/ "
+          f"({config.pages} pages x {config.per_page} books, Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local mock of books.toscrape.com.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--pages", type=int, default=MockConfig._field_defaults["pages"], help="number of catalogue pages")
+    parser.add_argument("--per-page", type=int, default=MockConfig._field_defaults["per_page"], help="books per page")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random +/- variation of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--revision", type=int, default=0, help="catalogue revision (changes prices / stock)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = MockConfig(
+        args.pages, args.per_page, args.latency_ms, args.jitter_ms, args.error_rate,
+        args.rate_limit_rate, args.retry_after, args.seed, args.revision,
+    )
+    serve(config, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+price_model.py
+
+Persisted price model and low-latency prediction API for 5_prediction.py.
+
+The fitted OneHotEncoder + LinearRegression are stored together as one
+versioned artifact. PricePredictor loads it once and folds the model into
+an intercept, a rating coefficient and a per-category lookup table, so:
+- predict_one() is a dict lookup + two float ops (microseconds)
+- predict_batch() is fully vectorized with NumPy (millions of rows)
+
+Hashed-category models resolve categories through the stored
+FeatureHasher. The last UNSEEN_CACHE_SIZE results are kept in an LRU cache,
+so a server fed arbitrary category names does not grow without bound.
+
+Usage (from the repository root):
+    python question2_data_analysis/price_model.py predict --rating 4 --category Poetry
+    python question2_data_analysis/price_model.py serve --port 8000
+        GET  /predict?rating=4&category=Poetry
+        POST /predict   [{"rating": 4, "category": "Poetry"}, ...]
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+ARTIFACT_VERSION = 1
+MODEL_DIR = "question2_data_analysis/models"
+MODEL_FILE = os.path.join(MODEL_DIR, "price_model.joblib")
+UNSEEN_CACHE_SIZE = 1024
+
+
+ENCODINGS = ("onehot", "hashing")
+
+
+def save_artifact(
+    model, encoder, feature_names, metrics: dict, path: str = MODEL_FILE, encoding: str = "onehot"
+) -> str:
+    """Save encoder + model (+ metadata) as a single versioned artifact."""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {ENCODINGS}, got {encoding!r}")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    artifact = {
+        "artifact_version": ARTIFACT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "sklearn_version": sklearn.__version__,
+        "features": ["rating", "category"],
+        "encoding": encoding,
+        "feature_names": list(feature_names),
+        "encoder": encoder,
+        "model": model,
+        "metrics": metrics,
+    }
+    joblib.dump(artifact, path)
+    return path
+
+
+def load_artifact(path: str = MODEL_FILE) -> dict:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No model artifact at {path}. Run 5_prediction.py first.")
+
+    artifact = joblib.load(path)
+    version = artifact.get("artifact_version")
+    if version != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported model artifact version {version} (expected {ARTIFACT_VERSION})."
+        )
+    return artifact
+
+
+class PricePredictor:
+    """
+    Linear price model folded into lookup tables.
+
+    Unknown categories are passed to `unseen_category` (if given), whose
+    results are LRU-cached (UNSEEN_CACHE_SIZE entries); otherwise they fall
+    back to the baseline (dropped) category, i.e. they contribute 0 to the
+    prediction.
+    """
+
+    def __init__(
+        self,
+        intercept: float,
+        rating_coef: float,
+        category_coefs: dict[str, float],
+        unseen_category=None,
+    ) -> None:
+        self.intercept = float(intercept)
+        self.rating_coef = float(rating_coef)
+        self.category_coefs = dict(category_coefs)
+        self.unseen_category = lru_cache(maxsize=UNSEEN_CACHE_SIZE)(unseen_category) if unseen_category else None
+
+    @classmethod
+    def from_artifact(cls, artifact: dict) -> "PricePredictor":
+        model = artifact["model"]
+        encoder = artifact["encoder"]
+        coefs = pd.Series(model.coef_, index=artifact["feature_names"])
+
+        if artifact.get("encoding", "onehot") == "hashing":
+            hashed_coefs = coefs.drop("rating").to_numpy()
+
+            def hashed_category(category: str) -> float:
+                return float((encoder.transform([[category]]) @ hashed_coefs)[0])
+
+            return cls(model.intercept_, coefs["rating"], {}, hashed_category)
+
+        categories = encoder.categories_[0]
+        drop_idx = encoder.drop_idx_[0] if encoder.drop_idx_ is not None else None
+        category_coefs = {}
+        for i, cat in enumerate(categories):
+            if i == drop_idx:
+                category_coefs[cat] = 0.0
+            else:
+                category_coefs[cat] = float(coefs[f"category_{cat}"])
+
+        return cls(model.intercept_, coefs["rating"], category_coefs)
+
+    @classmethod
+    def load(cls, path: str = MODEL_FILE) -> "PricePredictor":
+        return cls.from_artifact(load_artifact(path))
+
+    def category_coef(self, category: str) -> float:
+        coef = self.category_coefs.get(category)
+        if coef is None:
+            return 0.0 if self.unseen_category is None else self.unseen_category(category)
+        return coef
+
+    def predict_one(self, rating: float, category: str) -> float:
+        coef = self.category_coefs.get(category)
+        if coef is None:
+            coef = self.category_coef(category)
+        return self.intercept + self.rating_coef * rating + coef
+
+    def predict_batch(self, ratings, categories) -> np.ndarray:
+        ratings = np.asarray(ratings, dtype=float)
+        codes, uniques = pd.factorize(np.asarray(categories, dtype=object))
+
+        # Trailing 0.0 serves code -1 (missing category)
+        lookup = np.fromiter(
+            (self.category_coef(c) for c in uniques), dtype=float, count=len(uniques)
+        )
+        lookup = np.append(lookup, 0.0)
+
+        return self.intercept + self.rating_coef * ratings + lookup[codes]
+
+
+def make_handler(predictor: PricePredictor):
+    class PredictHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                params = parse_qs(url.query)
+                rating = float(params["rating"][0])
+                if not np.isfinite(rating):
+                    raise ValueError("rating must be a finite number")
+                # Categories are stripped in training (5_prediction.py) too
+                category = params["category"][0].strip()
+            except (KeyError, ValueError) as e:
+                self._send_json(400, {"error": f"expected rating and category: {e}"})
+                return
+            self._send_json(200, {"price_gbp": predictor.predict_one(rating, category)})
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                rows = json.loads(self.rfile.read(length))
+                # dtype=float turns null into NaN: reject it with the non-numeric ratings
+                ratings = np.asarray([row["rating"] for row in rows], dtype=float)
+                if ratings.ndim != 1 or not np.isfinite(ratings).all():
+                    raise ValueError("ratings must be finite numbers")
+                categories = [str(row["category"]).strip() for row in rows]
+                prices = predictor.predict_batch(ratings, categories)
+            except (KeyError, TypeError, ValueError) as e:
+                self._send_json(400, {"error": f"expected a list of {{rating, category}}: {e}"})
+                return
+            self._send_json(200, {"price_gbp": prices.tolist()})
+
+        def log_message(self, format, *args):
+            pass
+
+    return PredictHandler
+
+
+def serve(predictor: PricePredictor, host: str = "127.0.0.1", port: int = 8000) -> None:
+    server = ThreadingHTTPServer((host, port), make_handler(predictor))
+    print(f"[INFO] Serving price predictions on http://{host}:{port}/predict (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the persisted book price model.")
+    parser.add_argument("--model", default=MODEL_FILE, help="path to the model artifact")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_predict = sub.add_parser("predict", help="predict a single book price")
+    p_predict.add_argument("--rating", type=float, required=True)
+    p_predict.add_argument("--category", required=True)
+
+    p_serve = sub.add_parser("serve", help="run a local HTTP prediction server")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8000)
+
+    args = parser.parse_args(argv)
+    predictor = PricePredictor.load(args.model)
+
+    if args.command == "predict":
+        price = predictor.predict_one(args.rating, args.category.strip())
+        print(f"Predicted price: £{price:.2f}")
+    elif args.command == "serve":
+        serve(predictor, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+snapshots.py
+
+Snapshot store for price and availability changes across scrape runs.
+
+Every run of 1_scraper.py --snapshot (or `snapshots.py record`) is stored as a
+compact columnar partition, keyed by a 64-bit hash of the product URL path
+(so a mirror or a mock on another host maps to the same books), or of the
+title for CSVs scraped before product_url was recorded:
+    data/snapshots/run-00003.npz   key | price_pence | rating | in_stock
+Strings that rarely change (title, URL, category) are stored once per book,
+in an append-only catalog segment written by the run that first saw it
+(catalog-00003.npz), instead of in every partition.
+
+On record, the new run is hash-joined with the previous partition
+(pd.Index.get_indexer on the keys). Only the row-level deltas are written,
+as that run's change segment (changes-00003.npz):
+    added / removed books, price changes, stock changes
+so recording costs the size of one run, not of the whole history. The
+manifest is written last (temp file + rename): files of a run that crashed
+before it are simply overwritten by the next record.
+
+Queries merge the segments into one change log sorted by key, so a price
+history is one searchsorted slice, not a scan over every run. Title lookups
+go through a sorted title-hash index over the catalog, and "went out of
+stock" is a slice of a (run, kind) index over the change log.
+
+Usage (from the repository root):
+    python question2_data_analysis/snapshots.py record --input question2_data_analysis/data/raw_books_data.csv
+    python question2_data_analysis/snapshots.py runs
+    python question2_data_analysis/snapshots.py history --title "A Light in the Attic"
+    python question2_data_analysis/snapshots.py out-of-stock --since 0
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_DIR = "question2_data_analysis/data/snapshots"
+RAW_FILE = "question2_data_analysis/data/raw_books_data.csv"
+MANIFEST_FILE = "manifest.json"
+
+# Change kinds stored in the change segments
+ADDED, REMOVED, PRICE, STOCK = range(4)
+KINDS = ("added", "removed", "price", "stock")
+MISSING_PRICE = -1
+
+PARTITION_COLUMNS = ("key", "price_pence", "rating", "in_stock")
+CHANGE_COLUMNS = ("key", "run", "kind", "price_pence", "in_stock")
+CATALOG_COLUMNS = ("key", "title", "url", "category", "title_hash")
+
+
+def hash_strings(values) -> np.ndarray:
+    """Stable 64-bit hashes (same across processes and runs)."""
+    return pd.util.hash_array(np.asarray(values, dtype=object))
+
+
+def product_keys(urls) -> np.ndarray:
+    """Key = hash of the URL without scheme and host."""
+    paths = pd.Series(urls, dtype=str).str.replace(r"^[A-Za-z][A-Za-z0-9+.-]*://[^/]*", "", regex=True)
+    return hash_strings(paths.to_numpy(dtype=object))
+
+
+def title_hashes(titles) -> np.ndarray:
+    return hash_strings(pd.Series(titles, dtype=str).str.strip().str.lower().to_numpy(dtype=object))
+
+
+def normalize_books(books) -> pd.DataFrame:
+    """Scraped rows (dicts or a raw/cleaned DataFrame) -> one row per product key."""
+    df = pd.DataFrame(books)
+    if df.empty:
+        raise ValueError("no books to record")
+
+    title = df["title"].astype(str)
+    url = df["product_url"].fillna("").astype(str) if "product_url" in df else pd.Series("", index=df.index)
+    key = np.where(url != "", product_keys(url), hash_strings(title.to_numpy(dtype=object)))
+
+    price = pd.to_numeric(
+        df["price_gbp"].astype(str).str.replace("£", "", regex=False).str.replace("Â", "", regex=False),
+        errors="coerce",
+    )
+    if "in_stock" in df:
+        in_stock = df["in_stock"].astype(str).str.lower().isin(["true", "1"])
+    else:
+        in_stock = df["availability"].astype(str).str.contains("In stock", case=False)
+
+    rows = pd.DataFrame({
+        "key": key.astype(np.uint64),
+        "price_pence": (price * 100).round().fillna(MISSING_PRICE).astype(np.int32),
+        "rating": pd.to_numeric(df["rating"], errors="coerce").fillna(0).astype(np.int8),
+        "in_stock": in_stock.to_numpy(dtype=bool),
+        "title": title,
+        "url": url,
+        "category": df["category"].astype(str) if "category" in df else "",
+    })
+    # Repeated listings of one product: the last one seen wins
+    return rows.drop_duplicates("key", keep="last").reset_index(drop=True)
+
+
+def _load_npz(path: str, columns) -> dict:
+    if not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        return {column: data[column] for column in columns}
+
+
+class SnapshotStore:
+    """Append-only store of scrape runs plus an indexed change log."""
+
+    def __init__(self, root: str = SNAPSHOT_DIR):
+        self.root = root
+        manifest = os.path.join(root, MANIFEST_FILE)
+        if os.path.exists(manifest):
+            with open(manifest, encoding="utf-8") as f:
+                self.runs = json.load(f)
+        else:
+            self.runs = []
+        self._catalog = None
+        self._catalog_keys = None
+        self._changes = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def partition(self, run: int = -1) -> dict:
+        """Columns of one run's partition (numpy arrays)."""
+        if not self.runs:
+            raise ValueError("snapshot store is empty")
+        return _load_npz(self._path(self.runs[run]["file"]), PARTITION_COLUMNS)
+
+    @property
+    def catalog(self) -> dict:
+        """All catalog segments, sorted by key, plus a title-hash order for title lookups."""
+        if self._catalog is None:
+            segments = [
+                _load_npz(self._path(run["catalog"]), CATALOG_COLUMNS) for run in self.runs if run.get("catalog")
+            ]
+            if segments:
+                merged = {column: np.concatenate([seg[column] for seg in segments]) for column in CATALOG_COLUMNS}
+                order = np.argsort(merged["key"], kind="stable")
+                # A key is written once, but keep the first entry if older stores repeated it
+                order = order[np.r_[True, np.diff(merged["key"][order]) != 0]]
+                self._catalog = {column: values[order] for column, values in merged.items()}
+            else:
+                self._catalog = {
+                    "key": np.empty(0, np.uint64), "title": np.empty(0, str), "url": np.empty(0, str),
+                    "category": np.empty(0, str), "title_hash": np.empty(0, np.uint64),
+                }
+            self._catalog["title_order"] = np.argsort(self._catalog["title_hash"], kind="stable")
+        return self._catalog
+
+    @property
+    def catalog_keys(self) -> np.ndarray:
+        """Sorted keys of every catalogued book (reads only the key column of each segment)."""
+        if self._catalog_keys is None:
+            if self._catalog is not None:
+                self._catalog_keys = self._catalog["key"]
+            else:
+                self._catalog_keys = np.unique(np.concatenate([
+                    np.empty(0, np.uint64),
+                    *(_load_npz(self._path(run["catalog"]), ("key",))["key"] for run in self.runs if run.get("catalog")),
+                ]))
+        return self._catalog_keys
+
+    @property
+    def changes(self) -> dict:
+        """Every run's change segment, merged and sorted by key (then run, kind)."""
+        if self._changes is None:
+            segments = [_load_npz(self._path(run["changes"]), CHANGE_COLUMNS) for run in self.runs]
+            if segments:
+                merged = {column: np.concatenate([seg[column] for seg in segments]) for column in CHANGE_COLUMNS}
+                order = np.lexsort((merged["kind"], merged["run"], merged["key"]))
+                self._changes = {column: values[order] for column, values in merged.items()}
+            else:
+                self._changes = {
+                    "key": np.empty(0, np.uint64), "run": np.empty(0, np.int32), "kind": np.empty(0, np.int8),
+                    "price_pence": np.empty(0, np.int32), "in_stock": np.empty(0, bool),
+                }
+            self._index_changes()
+        return self._changes
+
+    def _index_changes(self) -> None:
+        """Secondary (run, kind) index over the key-sorted log: order + sorted run/kind codes."""
+        log = self._changes
+        codes = log["run"].astype(np.int64) * len(KINDS) + log["kind"]
+        log["by_run"] = np.argsort(codes, kind="stable")
+        log["run_kind"] = codes[log["by_run"]]
+
+    def _rows_for(self, first_run: int, last_run: int, kind: int = None) -> np.ndarray:
+        """Change-log rows recorded in runs first_run..last_run (of one kind, or all kinds)."""
+        log = self.changes
+        first, last = (0, len(KINDS) - 1) if kind is None else (kind, kind)
+        lo = np.searchsorted(log["run_kind"], first_run * len(KINDS) + first, side="left")
+        hi = np.searchsorted(log["run_kind"], last_run * len(KINDS) + last, side="right")
+        rows = log["by_run"][lo:hi]
+        return rows if kind is None or first_run == last_run else rows[log["kind"][rows] == kind]
+
+    # ---------- writing ----------
+
+    def record(self, books, scraped_at: datetime = None) -> dict:
+        """Store one scrape run and append its deltas against the previous run."""
+        current = normalize_books(books)
+        scraped_at = scraped_at or datetime.now(timezone.utc)
+        run = len(self.runs)
+        os.makedirs(self.root, exist_ok=True)
+
+        key = current["key"].to_numpy(np.uint64)
+        price = current["price_pence"].to_numpy(np.int32)
+        in_stock = current["in_stock"].to_numpy(bool)
+
+        if self.runs:
+            previous = self.partition()
+            # Hash join on the product key, in both directions
+            matches = pd.Index(previous["key"]).get_indexer(key)
+            added = matches < 0
+            removed = pd.Index(key).get_indexer(previous["key"]) < 0
+            matched = np.flatnonzero(~added)
+            prev_rows = matches[matched]
+            price_changed = matched[price[matched] != previous["price_pence"][prev_rows]]
+            stock_changed = matched[in_stock[matched] != previous["in_stock"][prev_rows]]
+        else:
+            previous = None
+            added = np.ones(len(key), dtype=bool)
+            removed = np.zeros(0, dtype=bool)
+            price_changed = stock_changed = np.empty(0, dtype=np.int64)
+
+        new_rows = np.flatnonzero(added)
+        delta_key = [key[new_rows], key[price_changed], key[stock_changed]]
+        delta_kind = [np.full(len(new_rows), ADDED), np.full(len(price_changed), PRICE),
+                      np.full(len(stock_changed), STOCK)]
+        delta_price = [price[new_rows], price[price_changed], price[stock_changed]]
+        delta_stock = [in_stock[new_rows], in_stock[price_changed], in_stock[stock_changed]]
+        if previous is not None and removed.any():
+            delta_key.append(previous["key"][removed])
+            delta_kind.append(np.full(int(removed.sum()), REMOVED))
+            delta_price.append(previous["price_pence"][removed])
+            delta_stock.append(np.zeros(int(removed.sum()), dtype=bool))
+
+        delta_key = np.concatenate(delta_key)
+        changes_file = f"changes-{run:05d}.npz"
+        np.savez(
+            self._path(changes_file), key=delta_key, run=np.full(len(delta_key), run, dtype=np.int32),
+            kind=np.concatenate(delta_kind).astype(np.int8), price_pence=np.concatenate(delta_price).astype(np.int32),
+            in_stock=np.concatenate(delta_stock).astype(bool),
+        )
+        self._changes = None
+        # A book can drop out of a run and come back: only never-seen keys get a catalog entry
+        unseen = new_rows[~np.isin(key[new_rows], self.catalog_keys, assume_unique=True)]
+        entry = {
+            "run": run,
+            "scraped_at": scraped_at.isoformat(),
+            "file": f"run-{run:05d}.npz",
+            "rows": len(key),
+            "added": int(added.sum()),
+            "removed": int(removed.sum()),
+            "price_changes": len(price_changed),
+            "stock_changes": len(stock_changed),
+            "changes": changes_file,
+            "catalog": self._write_catalog_segment(run, current.iloc[unseen]),
+        }
+        # Numeric columns (random 64-bit keys barely compress) are stored uncompressed
+        np.savez(
+            self._path(entry["file"]), key=key, price_pence=price,
+            rating=current["rating"].to_numpy(np.int8), in_stock=in_stock,
+        )
+        self._write_manifest([*self.runs, entry])
+        self.runs.append(entry)
+        return entry
+
+    def _write_manifest(self, runs: list) -> None:
+        """Replace the manifest atomically: the run only exists once every file it lists is written."""
+        path = self._path(MANIFEST_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(runs, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _write_catalog_segment(self, run: int, books: pd.DataFrame):
+        """Store the strings of books first seen in this run; returns the file name (None if no new books)."""
+        if books.empty:
+            return None
+        name = f"catalog-{run:05d}.npz"
+        np.savez_compressed(
+            self._path(name),
+            key=books["key"].to_numpy(np.uint64),
+            title=books["title"].to_numpy(dtype=str),
+            url=books["url"].to_numpy(dtype=str),
+            category=books["category"].to_numpy(dtype=str),
+            title_hash=title_hashes(books["title"]),
+        )
+        self._catalog = None
+        self._catalog_keys = np.union1d(self.catalog_keys, books["key"].to_numpy(np.uint64))
+        return name
+
+    # ---------- queries ----------
+
+    def _catalog_rows(self, keys: np.ndarray) -> np.ndarray:
+        catalog_keys = self.catalog["key"]
+        rows = np.searchsorted(catalog_keys, keys)
+        rows[rows >= len(catalog_keys)] = 0
+        return rows
+
+    def keys_for(self, title: str = None, url: str = None) -> np.ndarray:
+        """Product keys for a URL, or for every product with this title (case-insensitive)."""
+        if url is not None:
+            return product_keys([url])
+        if title is None:
+            raise ValueError("pass a title or a url")
+        catalog = self.catalog
+        sorted_hashes = catalog["title_hash"][catalog["title_order"]]
+        target = title_hashes([title])[0]
+        lo = np.searchsorted(sorted_hashes, target, side="left")
+        hi = np.searchsorted(sorted_hashes, target, side="right")
+        return catalog["key"][catalog["title_order"][lo:hi]]
+
+    def _changes_frame(self, rows: np.ndarray) -> pd.DataFrame:
+        log = self.changes
+        keys = log["key"][rows]
+        catalog_rows = self._catalog_rows(keys)
+        runs = log["run"][rows]
+        price = log["price_pence"][rows]
+        return pd.DataFrame({
+            "run": runs,
+            "scraped_at": [self.runs[r]["scraped_at"] for r in runs],
+            "title": self.catalog["title"][catalog_rows],
+            "change": np.array(KINDS)[log["kind"][rows]],
+            "price_gbp": np.where(price == MISSING_PRICE, np.nan, price / 100),
+            "in_stock": log["in_stock"][rows],
+            "url": self.catalog["url"][catalog_rows],
+        })
+
+    def history(self, title: str = None, url: str = None) -> pd.DataFrame:
+        """Every recorded change (first seen, price, stock, removal) of the matching products."""
+        log_keys = self.changes["key"]
+        keys = np.unique(self.keys_for(title, url))
+        lo = np.searchsorted(log_keys, keys, side="left")
+        hi = np.searchsorted(log_keys, keys, side="right")
+        rows = np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)]) if len(keys) else np.empty(0, int)
+        return self._changes_frame(rows.astype(np.int64))
+
+    def price_history(self, title: str = None, url: str = None) -> pd.DataFrame:
+        history = self.history(title, url)
+        return history[history["change"].isin(["added", "price"])].reset_index(drop=True)
+
+    def went_out_of_stock(self, since: int = None) -> pd.DataFrame:
+        """Books whose stock flipped to out of stock in runs after `since` (default: the latest run)."""
+        since = len(self.runs) - 2 if since is None else since
+        rows = self._rows_for(since + 1, len(self.runs) - 1, STOCK)
+        return self._changes_frame(rows[~self.changes["in_stock"][rows]])
+
+    def run_changes(self, run: int = -1) -> pd.DataFrame:
+        """All deltas recorded by one run."""
+        run = self.runs[run]["run"]
+        return self._changes_frame(np.sort(self._rows_for(run, run)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Record scrape runs and query price / stock history.")
+    parser.add_argument("--root", default=SNAPSHOT_DIR, help="snapshot directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="store a raw (or cleaned) CSV as a new run")
+    record.add_argument("--input", default=RAW_FILE)
+    record.add_argument("--at", help="scrape time as ISO-8601 (default: now)")
+
+    sub.add_parser("runs", help="list recorded runs")
+
+    history = sub.add_parser("history", help="price and stock history of a book")
+    history.add_argument("--title")
+    history.add_argument("--url")
+
+    stock = sub.add_parser("out-of-stock", help="books that went out of stock")
+    stock.add_argument("--since", type=int, help="only runs after this one (default: the latest run)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = SnapshotStore(args.root)
+
+    if args.command == "record":
+        scraped_at = datetime.fromisoformat(args.at) if args.at else None
+        run = store.record(pd.read_csv(args.input), scraped_at)
+        print(f"[SAVED] Run {run['run']} ({run['rows']} books): {run['added']} new, {run['removed']} gone, "
+              f"{run['price_changes']} price and {run['stock_changes']} stock changes")
+    elif args.command == "runs":
+        print(pd.DataFrame(store.runs).drop(columns=["file", "changes", "catalog"]).to_string(index=False) if store.runs
+              else "[INFO] No runs recorded yet.")
+    elif args.command == "history":
+        history = store.history(args.title, args.url)
+        print(history.drop(columns="url").to_string(index=False) if len(history) else "[INFO] No matching book.")
+    else:
+        gone = store.went_out_of_stock(args.since)
+        print(f"[INFO] {len(gone)} books went out of stock")
+        if len(gone):
+            print(gone[["run", "scraped_at", "title", "price_gbp"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+synthetic_books.py
+
+Generates synthetic raw_books_data.csv files of any size (10^3 – 10^8 rows)
+for load-testing the pipeline.
+
+Rows follow the scraped schema (title, price_gbp, rating, category,
+availability) and its quirks: prices such as "£51.77" between £10 and £60,
+1–5 star ratings, the books.toscrape.com category list with a skewed
+popularity, a UTF-8 BOM, mis-decoded "Â£" prices, missing values and exact
+duplicate rows. Rows are generated and appended in chunks, so memory stays
+flat for very large files.
+
+Usage (from the repository root):
+    python question2_data_analysis/synthetic_books.py --rows 1000000
+    python question2_data_analysis/synthetic_books.py --rows 100000 --out /tmp/raw_books_data.csv
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+OUTPUT_CSV = "question2_data_analysis/data/synthetic_raw_books_data.csv"
+CHUNK_ROWS = 1_000_000
+
+CATEGORIES = (
+    "Default", "Nonfiction", "Sequential Art", "Add a comment", "Fiction", "Young Adult", "Fantasy",
+    "Romance", "Mystery", "Food and Drink", "Childrens", "Historical Fiction", "Classics", "Poetry",
+    "History", "Womens Fiction", "Horror", "Science Fiction", "Science", "Music", "Business",
+    "Thriller", "Philosophy", "Humor", "Biography", "Travel", "Religion", "Autobiography",
+    "Spirituality", "Christian Fiction", "Art", "Psychology", "New Adult", "Sports and Games",
+    "Self Help", "Contemporary", "Health", "Christian", "Historical", "Politics", "Short Stories",
+    "Suspense", "Paranormal", "Novels", "Adult Fiction", "Parenting", "Cultural", "Crime",
+    "Academic", "Erotica",
+)
+TITLE_WORDS = (
+    "Light", "Attic", "Velvet", "Objects", "Secret", "River", "Night", "Garden", "Shadow", "Queen",
+    "Empire", "Journey", "Stone", "Winter", "Silence", "Fire", "House", "Ocean", "Dream", "Letters",
+)
+AVAILABILITY = ("In stock", "Out of stock")
+
+
+def category_weights(n: int) -> np.ndarray:
+    """Zipf-like popularity: a few large categories and a long tail."""
+    weights = 1.0 / np.arange(1, n + 1) ** 0.8
+    return weights / weights.sum()
+
+
+def generate_chunk(
+    rng: np.random.Generator,
+    n_rows: int,
+    start_id: int,
+    dirty_rate: float,
+    missing_rate: float,
+    duplicate_rate: float,
+    out_of_stock_rate: float,
+) -> pd.DataFrame:
+    words = np.array(TITLE_WORDS, dtype=object)
+    title = (
+        "The " + words[rng.integers(0, len(words), n_rows)] + " of "
+        + words[rng.integers(0, len(words), n_rows)] + " #"
+        + np.arange(start_id, start_id + n_rows).astype(str).astype(object)
+    )
+
+    prices = rng.uniform(10.0, 60.0, n_rows)
+    price = np.char.mod("%.2f", prices).astype(object)
+    currency = np.where(rng.random(n_rows) < dirty_rate, "Â£", "£").astype(object)
+    price = currency + price
+
+    rating = rng.integers(1, 6, n_rows).astype(str).astype(object)
+    category = np.array(CATEGORIES, dtype=object)[
+        rng.choice(len(CATEGORIES), n_rows, p=category_weights(len(CATEGORIES)))
+    ]
+    availability = np.where(rng.random(n_rows) < out_of_stock_rate, AVAILABILITY[1], AVAILABILITY[0]).astype(object)
+
+    price[rng.random(n_rows) < missing_rate] = ""
+    rating[rng.random(n_rows) < missing_rate] = ""
+
+    df = pd.DataFrame(
+        {"title": title, "price_gbp": price, "rating": rating, "category": category, "availability": availability}
+    )
+
+    # Exact duplicates of earlier rows in the chunk, as repeated listings produce when scraping
+    n_duplicates = int(n_rows * duplicate_rate)
+    if n_duplicates:
+        targets = rng.choice(n_rows, n_duplicates, replace=False)
+        df.iloc[targets] = df.iloc[rng.integers(0, n_rows, n_duplicates)].to_numpy()
+    return df
+
+
+def generate_books_csv(
+    path: str,
+    n_rows: int,
+    seed: int = 42,
+    dirty_rate: float = 0.02,
+    missing_rate: float = 0.01,
+    duplicate_rate: float = 0.03,
+    out_of_stock_rate: float = 0.05,
+    chunk_rows: int = CHUNK_ROWS,
+) -> str:
+    rng = np.random.default_rng(seed)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    for start in range(0, max(n_rows, 1), chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        chunk = generate_chunk(rng, size, start, dirty_rate, missing_rate, duplicate_rate, out_of_stock_rate)
+        if start == 0:
+            # Same encoding as the scraper's output: UTF-8 with BOM
+            chunk.to_csv(path, index=False, encoding="utf-8-sig")
+        else:
+            chunk.to_csv(path, index=False, header=False, mode="a", encoding="utf-8")
+    return path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw books CSV.")
+    parser.add_argument("--rows", type=int, default=100_000, help="number of rows (default: 100,000)")
+    parser.add_argument("--out", default=OUTPUT_CSV, help=f"output CSV (default: {OUTPUT_CSV})")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dirty-rate", type=float, default=0.02, help="share of prices written as 'Â£'")
+    parser.add_argument("--missing-rate", type=float, default=0.01, help="share of missing prices / ratings")
+    parser.add_argument("--duplicate-rate", type=float, default=0.03, help="share of duplicate rows")
+    parser.add_argument("--out-of-stock-rate", type=float, default=0.05)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    generate_books_csv(
+        args.out, args.rows, args.seed, args.dirty_rate, args.missing_rate, args.duplicate_rate,
+        args.out_of_stock_rate,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"[SAVED] {args.rows:,} rows -> {args.out} "
+          f"({os.path.getsize(args.out) / 1e6:.1f} MB in {elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+test_book_query.py
+
+Tests for the indexed book queries in book_query.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from book_query import BookIndex, parse_filters, parse_top  # noqa: E402
+
+
+def books() -> pd.DataFrame:
+    return pd.DataFrame({
+        "title": [f"Book {i}" for i in range(8)],
+        "price_gbp": [10.0, 25.0, 40.0, 55.0, 12.5, 30.0, 30.0, np.nan],
+        "rating": [5, 3, 5, 1, 4, 5, 2, 3],
+        "category": ["Poetry", " poetry ", "POETRY", "Travel", "Travel", "Mystery", "Poetry", "Travel"],
+        "in_stock": [True, True, False, True, False, True, True, True],
+    })
+
+
+class BookIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = BookIndex(books())
+
+    def masked(self, mask) -> list[int]:
+        return np.flatnonzero(mask).tolist()
+
+    def test_rows_without_price_are_dropped(self) -> None:
+        self.assertEqual(len(self.index), 7)
+
+    def test_category_is_matched_after_strip_and_lower(self) -> None:
+        self.assertEqual(self.index.query_positions(category="  PoEtRy").tolist(), [0, 1, 2, 6])
+        self.assertEqual(self.index.query_positions(category="Sci-Fi").tolist(), [])
+        stats = self.index.category_stats.set_index("category")
+        self.assertEqual(stats.loc["Poetry", "books"], 4)
+
+    def test_combined_filters_match_boolean_masks(self) -> None:
+        df = self.index.books
+        cases = [
+            (dict(category="poetry", rating=5), (df["category"].str.strip().str.lower() == "poetry") & (df["rating"] == 5)),
+            (dict(min_price=20, max_price=40), df["price_gbp"].between(20, 40)),
+            (dict(rating=5, in_stock=True), (df["rating"] == 5) & df["in_stock"]),
+            (dict(category="travel", max_price=20), (df["category"] == "Travel") & (df["price_gbp"] <= 20)),
+        ]
+        for filters, expected in cases:
+            with self.subTest(filters=filters):
+                self.assertEqual(self.index.query_positions(**filters).tolist(), self.masked(expected))
+
+    def test_the_smallest_index_drives_the_query(self) -> None:
+        index = self.index
+        with mock.patch.object(index, "category_positions", wraps=index.category_positions) as by_category, \
+                mock.patch.object(index, "rating_positions", wraps=index.rating_positions) as by_rating, \
+                mock.patch.object(index, "price_positions", wraps=index.price_positions) as by_price:
+            # Mystery: 1 book, rating 5: 3 books, 10-60: every book
+            index.query_positions(category="mystery", rating=5, min_price=10, max_price=60)
+            self.assertEqual((by_category.called, by_rating.called, by_price.called), (True, False, False))
+            # rating 1: 1 book, Poetry: 4 books
+            index.query_positions(category="poetry", rating=1)
+            self.assertTrue(by_rating.called)
+            # 50-60: 1 book
+            index.query_positions(rating=5, min_price=50, max_price=60)
+            self.assertTrue(by_price.called)
+
+    def test_limit_and_n_are_validated(self) -> None:
+        self.assertEqual(len(self.index.query(limit=2, category="poetry")), 2)
+        self.assertEqual(len(self.index.query(limit=0)), 0)
+        with self.assertRaises(ValueError):
+            self.index.query(limit=-1)
+        with self.assertRaises(ValueError):
+            self.index.top_categories(-1)
+        with self.assertRaises(ValueError):
+            self.index.query_positions(min_price=30, max_price=20)
+        with self.assertRaises(ValueError):
+            parse_filters({"limit": ["-5"]})
+        with self.assertRaises(ValueError):
+            parse_top({"n": ["-1"]})
+
+    def test_top_categories_are_cached_and_bounded(self) -> None:
+        top = self.index.top_categories(2, "avg_price")
+        self.assertEqual(top["category"].tolist(), ["Travel", "Mystery"])
+        self.assertEqual(len(self.index.top_categories(10**9, "books")), 3)
+        self.index.top_categories(10**6, "books")
+        self.assertEqual(len(self.index._top_cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
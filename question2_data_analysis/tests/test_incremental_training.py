@@ -0,0 +1,81 @@
+"""
+test_incremental_training.py
+
+Tests for the out-of-core price model in incremental_training.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import OneHotEncoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from incremental_training import NormalEquations, build_vocabulary, fit_incremental  # noqa: E402
+
+
+def books(n: int = 250) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    category = rng.choice(["Poetry", "Travel", "Mystery", "History"], n)
+    rating = rng.integers(1, 6, n)
+    df = pd.DataFrame({
+        "title": [f"Book {i}" for i in range(n)],
+        "price_gbp": (12 + 2.5 * rating + (category == "Mystery") * 4 + rng.normal(0, 2, n)).round(2),
+        "rating": rating,
+        "category": [f" {c} " if i % 7 == 0 else c for i, c in enumerate(category)],
+    })
+    # Rows the cleaning in read_chunks() must drop
+    df.loc[[5, 50], "price_gbp"] = np.nan
+    df.loc[9, "rating"] = np.nan
+    return df
+
+
+class IncrementalTrainingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "books.csv")
+        self.df = books()
+        self.df.to_csv(self.path, index=False)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def in_memory_fit(self) -> LinearRegression:
+        df = self.df.dropna(subset=["price_gbp", "rating"])
+        encoder = OneHotEncoder(drop="first", sparse_output=False)
+        X = np.column_stack([df["rating"], encoder.fit_transform(df[["category"]].apply(lambda c: c.str.strip()))])
+        return LinearRegression().fit(X, df["price_gbp"])
+
+    def test_chunked_fit_matches_linear_regression(self) -> None:
+        expected = self.in_memory_fit()
+        for chunksize in (17, 1000):
+            with self.subTest(chunksize=chunksize):
+                intercept, coefs, n_rows = fit_incremental(self.path, chunksize)
+                self.assertEqual(n_rows, 247)
+                self.assertAlmostEqual(intercept, expected.intercept_)
+                np.testing.assert_allclose(coefs.to_numpy(), expected.coef_, atol=1e-9)
+                self.assertEqual(
+                    coefs.index.tolist(), ["rating", "category_Mystery", "category_Poetry", "category_Travel"]
+                )
+
+    def test_vocabulary_is_stripped_and_sorted(self) -> None:
+        self.assertEqual(build_vocabulary(self.path, 50), ["History", "Mystery", "Poetry", "Travel"])
+
+    def test_unknown_category_is_rejected(self) -> None:
+        equations = NormalEquations(["Poetry", "Travel"])
+        chunk = pd.DataFrame({"price_gbp": [10.0], "rating": [3.0], "category": ["Music"]})
+        with self.assertRaises(ValueError):
+            equations.partial_fit(chunk)
+        self.assertEqual(equations.n, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+test_mock_server.py
+
+Tests for the mock books.toscrape.com server in mock_server.py and the
+Retry-After handling of 1_scraper.py against it.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import importlib
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from io import StringIO
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mock_server import MockConfig, make_book, server_url, start_server  # noqa: E402
+
+scraper = importlib.import_module("1_scraper")
+
+NO_DELAY = (0.0, 0.0)
+
+
+class MockServer:
+    def __init__(self, **config) -> None:
+        self.server = start_server(MockConfig(**config))
+        self.url = server_url(self.server)
+
+    def __enter__(self) -> str:
+        return self.url
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def scrape(url: str, pages: int) -> list[dict]:
+    with redirect_stdout(StringIO()):
+        return scraper.scrape_books(url, pages, NO_DELAY)
+
+
+class MockServerScrapeTest(unittest.TestCase):
+    def test_scraper_reads_the_generated_books(self) -> None:
+        with MockServer(pages=3, per_page=4) as url:
+            books = scrape(url, 2)
+
+        self.assertEqual(len(books), 8)
+        for book_id, row in enumerate(books, start=1):
+            book = make_book(book_id)
+            self.assertEqual(row["title"], book.title)
+            self.assertEqual(row["price_gbp"], f"£{book.price:.2f}")
+            self.assertEqual(row["rating"], book.rating)
+            self.assertEqual(row["category"], book.category)
+            self.assertEqual(row["availability"], "In stock" if book.in_stock else "Out of stock")
+            self.assertTrue(row["product_url"].startswith(f"{url}catalogue/"))
+
+    def test_revisions_change_some_prices_and_stock(self) -> None:
+        base = [make_book(i) for i in range(1, 2001)]
+        revised = [make_book(i, revision=1) for i in range(1, 2001)]
+
+        self.assertEqual([b.title for b in base], [b.title for b in revised])
+        price_changes = sum(a.price != b.price for a, b in zip(base, revised))
+        stock_changes = sum(a.in_stock != b.in_stock for a, b in zip(base, revised))
+        self.assertAlmostEqual(price_changes / 2000, 0.10, delta=0.03)
+        self.assertAlmostEqual(stock_changes / 2000, 0.05, delta=0.02)
+        self.assertEqual(revised, [make_book(i, revision=1) for i in range(1, 2001)])
+
+    def test_unknown_paths_are_404(self) -> None:
+        with MockServer(pages=2) as url:
+            self.assertEqual(requests.get(f"{url}catalogue/page-3.html").status_code, 404)
+            self.assertEqual(requests.get(f"{url}catalogue/x_999/index.html").status_code, 404)
+            self.assertEqual(requests.get(f"{url}catalogue/page-2.html").status_code, 200)
+
+
+class RetryAfterTest(unittest.TestCase):
+    def test_retry_after_values(self) -> None:
+        later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)
+        cases = {
+            "5": 5.0,
+            "0.5": 0.5,
+            "-3": 0.0,
+            "inf": scraper.DEFAULT_RETRY_AFTER,
+            "nan": scraper.DEFAULT_RETRY_AFTER,
+            "soon": scraper.DEFAULT_RETRY_AFTER,
+            "": scraper.DEFAULT_RETRY_AFTER,
+            None: scraper.DEFAULT_RETRY_AFTER,
+            "Wed, 21 Oct 2015 07:28:00 GMT": 0.0,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(scraper.retry_after_seconds(value), expected)
+        self.assertAlmostEqual(scraper.retry_after_seconds(later), 120, delta=5)
+
+    def test_rate_limited_requests_wait_for_retry_after(self) -> None:
+        with MockServer(rate_limit_rate=1.0, retry_after=7) as url, requests.Session() as session:
+            with mock.patch.object(scraper.time, "sleep") as sleep, redirect_stdout(StringIO()):
+                resp = scraper.request_with_retry(session, f"{url}catalogue/page-1.html", NO_DELAY)
+
+        # Waits between attempts only; the last 429 is given up on
+        self.assertIsNone(resp)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [7.0] * (scraper.MAX_RETRIES - 1))
+
+    def test_retry_after_is_capped(self) -> None:
+        with MockServer(rate_limit_rate=1.0, retry_after=3600) as url, requests.Session() as session:
+            with mock.patch.object(scraper.time, "sleep") as sleep, redirect_stdout(StringIO()):
+                scraper.request_with_retry(session, f"{url}catalogue/page-1.html", NO_DELAY)
+
+        self.assertEqual(sleep.call_args_list[0].args[0], scraper.MAX_RETRY_AFTER)
+
+    def test_scrape_survives_server_errors(self) -> None:
+        with MockServer(pages=2, per_page=5, error_rate=0.2, seed=3) as url:
+            books = scrape(url, 2)
+
+        titles = [make_book(i, seed=3).title for i in range(1, 11)]
+        self.assertTrue({row["title"] for row in books} <= set(titles))
+        self.assertGreater(len(books), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
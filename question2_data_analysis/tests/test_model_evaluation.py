@@ -0,0 +1,75 @@
+"""
+test_model_evaluation.py
+
+Tests for the cross-validation harness in model_evaluation.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import model_evaluation  # noqa: E402
+from model_evaluation import PARAM_GRIDS, best_params, format_params, leaderboard, run_cv  # noqa: E402
+
+
+def books(n: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    category = rng.choice(["Poetry", "Travel", "Mystery"], n)
+    rating = rng.integers(1, 6, n).astype(float)
+    return pd.DataFrame({
+        "title": [f"Book {i}: Part {i % 3} (Series, #{i % 4 + 1})" for i in range(n)],
+        "rating": rating,
+        "category": category,
+        "price_gbp": 10 + 3 * rating + (category == "Travel") * 5 + rng.normal(0, 0.5, n),
+    })
+
+
+class RunCvTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.df = books()
+
+    def test_every_parameter_setting_is_scored_per_fold(self) -> None:
+        results = run_cv(self.df, ["rating+category"], ["linear", "ridge"], n_folds=3, n_jobs=1, cache_dir=None)
+
+        settings = 1 + len(ParameterGrid(PARAM_GRIDS["ridge"]))
+        self.assertEqual(len(results), 3 * settings)
+        self.assertEqual(results.groupby(["model", "params"])["fold"].nunique().tolist(), [3] * settings)
+        self.assertEqual(
+            sorted(results.loc[results["model"] == "ridge", "params"].unique()),
+            sorted(format_params(p) for p in ParameterGrid(PARAM_GRIDS["ridge"])),
+        )
+        self.assertEqual(results.loc[results["model"] == "linear", "params"].unique().tolist(), ["default"])
+
+    def test_best_params_picks_lowest_mean_mae(self) -> None:
+        results = run_cv(self.df, ["rating", "rating+category"], ["ridge"], n_folds=3, n_jobs=1, cache_dir=None)
+        board = leaderboard(results)
+        best = best_params(board)
+
+        self.assertEqual(len(best), 2)
+        for _, row in best.iterrows():
+            candidates = board[board["feature_set"] == row["feature_set"]]
+            self.assertEqual(row["mae_mean"], candidates["mae_mean"].min())
+        # Category is informative here, so it must beat rating alone
+        self.assertEqual(best.iloc[0]["feature_set"], "rating+category")
+
+    def test_cached_encoders_give_the_same_scores(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = run_cv(self.df, ["rating+category+title"], ["linear"], n_folds=2, n_jobs=1, cache_dir=cache_dir)
+            with mock.patch.object(model_evaluation, "make_encoder", side_effect=AssertionError("re-encoded")):
+                second = run_cv(self.df, ["rating+category+title"], ["linear"], n_folds=2, n_jobs=1, cache_dir=cache_dir)
+        pd.testing.assert_series_equal(first["mae"], second["mae"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+test_prediction.py
+
+Tests for the feature encodings in 5_prediction.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import importlib
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+prediction = importlib.import_module("5_prediction")
+
+
+def books(n: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    category = rng.choice(["Poetry", "Travel", "Mystery", "History", "Music"], n)
+    rating = rng.integers(1, 6, n).astype(float)
+    price = 15 + 2 * rating + (category == "Travel") * 6 + rng.normal(0, 1, n)
+    # Shuffled index, as after dropna: the encodings must not depend on it
+    return pd.DataFrame({"rating": rating, "category": category, "price_gbp": price}, index=rng.permutation(n))
+
+
+class EncodeFeaturesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.df = books()
+
+    def test_sparse_matches_dense_one_hot(self) -> None:
+        dense, _, dense_names = prediction.encode_features(self.df, "dense")
+        X, _, names = prediction.encode_features(self.df, "sparse")
+
+        self.assertEqual(X.format, "csr")
+        self.assertEqual(names, dense_names)
+        np.testing.assert_array_equal(X.toarray(), dense.to_numpy())
+
+    def test_hashing_width_is_fixed(self) -> None:
+        X, encoder, names = prediction.encode_features(self.df, "hashing", n_hash_features=16)
+
+        self.assertEqual(X.shape, (len(self.df), 17))
+        self.assertEqual(len(names), 17)
+        np.testing.assert_array_equal(X[:, 0].toarray().ravel(), self.df["rating"])
+        # One hashed category column per row
+        np.testing.assert_array_equal(X[:, 1:].sum(axis=1).A1, np.ones(len(self.df)))
+        travel = encoder.transform([["Travel"]]).toarray().ravel()
+        rows = np.flatnonzero(self.df["category"].to_numpy() == "Travel")
+        np.testing.assert_array_equal(X[rows, 1:].toarray(), np.tile(travel, (len(rows), 1)))
+
+    def test_encodings_fit_the_same_model(self) -> None:
+        y = self.df["price_gbp"]
+        dense, _, _ = prediction.encode_features(self.df, "dense")
+        X, _, _ = prediction.encode_features(self.df, "sparse")
+        expected = LinearRegression().fit(dense, y).predict(dense)
+
+        np.testing.assert_allclose(LinearRegression().fit(X, y).predict(X), expected, rtol=1e-6)
+        # Five categories in 2**10 columns: no collisions, so the fit is the same
+        hashed, _, _ = prediction.encode_features(self.df, "hashing")
+        np.testing.assert_allclose(LinearRegression().fit(hashed, y).predict(hashed), expected, rtol=1e-6)
+
+    def test_unknown_encoding_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            prediction.encode_features(self.df, "ordinal")
+
+
+if __name__ == "__main__":
+    unittest.main()
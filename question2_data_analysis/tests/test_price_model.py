@@ -0,0 +1,154 @@
+"""
+test_price_model.py
+
+Tests for the persisted price model and prediction server in price_model.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from urllib.parse import quote
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from price_model import ARTIFACT_VERSION, PricePredictor, load_artifact, make_handler, save_artifact  # noqa: E402
+
+prediction = importlib.import_module("5_prediction")
+
+CATEGORIES = ["Poetry", "Travel", "Mystery", "History"]
+
+
+def books(n: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    category = rng.choice(CATEGORIES, n)
+    rating = rng.integers(1, 6, n).astype(float)
+    offset = pd.Series(category).map({"Poetry": 0.0, "Travel": 8.0, "Mystery": -4.0, "History": 3.0})
+    price = 20 + 1.5 * rating + offset.to_numpy() + rng.normal(0, 1, n)
+    return pd.DataFrame({"rating": rating, "category": category, "price_gbp": price})
+
+
+def fit(df: pd.DataFrame, encoding: str):
+    X, encoder, feature_names = prediction.encode_features(df, encoding)
+    model = LinearRegression().fit(X, df["price_gbp"])
+    return model, encoder, feature_names, X
+
+
+class PricePredictorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.df = books()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "price_model.joblib")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def load(self, encoding: str) -> tuple[PricePredictor, np.ndarray]:
+        model, encoder, feature_names, X = fit(self.df, encoding)
+        save_artifact(
+            model, encoder, feature_names, {},
+            path=self.path, encoding="hashing" if encoding == "hashing" else "onehot",
+        )
+        return PricePredictor.load(self.path), model.predict(X)
+
+    def test_folded_model_matches_sklearn(self) -> None:
+        for encoding in ("dense", "sparse", "hashing"):
+            with self.subTest(encoding=encoding):
+                predictor, expected = self.load(encoding)
+                batch = predictor.predict_batch(self.df["rating"], self.df["category"])
+                np.testing.assert_allclose(batch, expected)
+                self.assertAlmostEqual(
+                    predictor.predict_one(self.df["rating"][0], self.df["category"][0]), expected[0]
+                )
+
+    def test_unseen_category_falls_back_to_baseline(self) -> None:
+        predictor, _ = self.load("dense")
+        baseline = predictor.intercept + predictor.rating_coef * 4
+        self.assertAlmostEqual(predictor.predict_one(4, "Sci-Fi"), baseline)
+        # None factorizes to code -1, which maps onto the trailing 0.0
+        np.testing.assert_allclose(predictor.predict_batch([4, 4], ["Sci-Fi", None]), [baseline, baseline])
+
+    def test_hashed_unseen_categories_are_cached(self) -> None:
+        predictor, _ = self.load("hashing")
+        for _ in range(3):
+            predictor.predict_one(4, "Sci-Fi")
+        info = predictor.unseen_category.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_artifact_version_is_checked(self) -> None:
+        model, encoder, feature_names, _ = fit(self.df, "dense")
+        save_artifact(model, encoder, feature_names, {"r2": 1.0}, path=self.path)
+        self.assertEqual(load_artifact(self.path)["artifact_version"], ARTIFACT_VERSION)
+
+        artifact = load_artifact(self.path)
+        artifact["artifact_version"] = ARTIFACT_VERSION + 1
+        joblib.dump(artifact, self.path)
+        with self.assertRaises(ValueError):
+            load_artifact(self.path)
+        with self.assertRaises(FileNotFoundError):
+            load_artifact(os.path.join(self.tmp.name, "missing.joblib"))
+        with self.assertRaises(ValueError):
+            save_artifact(model, encoder, feature_names, {}, path=self.path, encoding="dense")
+
+
+class PredictServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.predictor = PricePredictor(10.0, 2.0, {"Poetry": 0.0, "Travel": 5.0})
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(cls.predictor))
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def request(self, method: str, path: str, body=None) -> tuple[int, dict]:
+        conn = HTTPConnection(*self.server.server_address)
+        try:
+            payload = None if body is None else json.dumps(body)
+            conn.request(method, path, body=payload)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            conn.close()
+
+    def test_get_strips_category(self) -> None:
+        status, body = self.request("GET", f"/predict?rating=4&category={quote(' Travel ')}")
+        self.assertEqual((status, body), (200, {"price_gbp": 23.0}))
+
+    def test_get_rejects_bad_ratings(self) -> None:
+        for rating in ("nan", "inf", "-inf", "four"):
+            with self.subTest(rating=rating):
+                status, _ = self.request("GET", f"/predict?rating={rating}&category=Poetry")
+                self.assertEqual(status, 400)
+        self.assertEqual(self.request("GET", "/predict?rating=4")[0], 400)
+        self.assertEqual(self.request("GET", "/other")[0], 404)
+
+    def test_post_strips_categories(self) -> None:
+        rows = [{"rating": 4, "category": " Travel"}, {"rating": 1, "category": "Poetry "}]
+        self.assertEqual(self.request("POST", "/predict", rows), (200, {"price_gbp": [23.0, 12.0]}))
+
+    def test_post_rejects_bad_ratings(self) -> None:
+        for rating in (None, "nan", "Infinity", [1, 2], "four"):
+            with self.subTest(rating=rating):
+                status, _ = self.request("POST", "/predict", [{"rating": rating, "category": "Poetry"}])
+                self.assertEqual(status, 400)
+        self.assertEqual(self.request("POST", "/predict", [{"rating": 4}])[0], 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+test_snapshots.py
+
+Tests for the snapshot store and change log in snapshots.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import snapshots  # noqa: E402
+from snapshots import SnapshotStore  # noqa: E402
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def book(title: str, price: float, in_stock: bool = True, host: str = "http://books.toscrape.com") -> dict:
+    slug = title.lower().replace(" ", "-")
+    return {
+        "title": title,
+        "price_gbp": f"£{price:.2f}",
+        "rating": 3,
+        "category": "Poetry",
+        "availability": "In stock" if in_stock else "Out of stock",
+        "product_url": f"{host}/catalogue/{slug}/index.html",
+    }
+
+
+RUNS = [
+    [book("Alpha", 10), book("Beta", 20), book("Gamma", 30)],
+    # Alpha scraped from a mirror with a new price, Beta sold out, Gamma delisted, Delta new
+    [book("Alpha", 12, host="http://localhost:8000"), book("Beta", 20, False), book("Delta", 40)],
+    # Gamma listed again, Delta sold out, Beta back in stock
+    [book("Alpha", 12), book("Beta", 20), book("Gamma", 31), book("Delta", 40, False)],
+]
+
+
+class SnapshotStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.workdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.workdir.name, "snapshots")
+        store = SnapshotStore(self.root)
+        self.entries = [store.record(books, START + timedelta(days=i)) for i, books in enumerate(RUNS)]
+        # Queries go through a fresh store, read back from disk
+        self.store = SnapshotStore(self.root)
+
+    def tearDown(self) -> None:
+        self.workdir.cleanup()
+
+    def test_run_entries_count_the_deltas(self) -> None:
+        counts = [(e["added"], e["removed"], e["price_changes"], e["stock_changes"]) for e in self.entries]
+        self.assertEqual(counts, [(3, 0, 0, 0), (1, 1, 1, 1), (1, 0, 0, 2)])
+        self.assertEqual(len(self.store.runs), 3)
+
+    def test_history_joins_on_the_url_path(self) -> None:
+        history = self.store.history(title="alpha")
+        self.assertEqual(list(zip(history["run"], history["change"], history["price_gbp"])),
+                         [(0, "added", 10.0), (1, "price", 12.0)])
+        self.assertEqual(len(self.store.price_history(url="http://localhost:8000/catalogue/alpha/index.html")), 2)
+
+    def test_removed_then_re_added_book_is_catalogued_once(self) -> None:
+        history = self.store.history(title="Gamma")
+        self.assertEqual(list(zip(history["run"], history["change"])), [(0, "added"), (1, "removed"), (2, "added")])
+        self.assertEqual(history["price_gbp"].tolist(), [30.0, 30.0, 31.0])
+        self.assertEqual(sorted(self.store.catalog["title"].tolist()), ["Alpha", "Beta", "Delta", "Gamma"])
+        self.assertIsNone(self.store.runs[2]["catalog"])
+
+    def test_went_out_of_stock_slices_runs(self) -> None:
+        self.assertEqual(self.store.went_out_of_stock()["title"].tolist(), ["Delta"])
+        gone = self.store.went_out_of_stock(since=0)
+        self.assertEqual(sorted(zip(gone["run"], gone["title"])), [(1, "Beta"), (2, "Delta")])
+        self.assertEqual(len(self.store.went_out_of_stock(since=2)), 0)
+
+    def test_run_changes_and_rows_for(self) -> None:
+        changes = self.store.run_changes(1)
+        self.assertEqual(sorted(zip(changes["change"], changes["title"])),
+                         [("added", "Delta"), ("price", "Alpha"), ("removed", "Gamma"), ("stock", "Beta")])
+        self.assertEqual(len(self.store.run_changes()), 3)
+        self.assertEqual(len(self.store._rows_for(0, 2)), 10)
+        self.assertEqual(len(self.store._rows_for(1, 2, snapshots.STOCK)), 3)
+        self.assertEqual(len(self.store._rows_for(0, 0, snapshots.PRICE)), 0)
+
+    def test_run_that_crashed_before_the_manifest_is_overwritten(self) -> None:
+        with mock.patch.object(SnapshotStore, "_write_manifest", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.store.record([book("Alpha", 99), book("Epsilon", 5)], START + timedelta(days=3))
+        self.assertTrue(os.path.exists(os.path.join(self.root, "changes-00003.npz")))
+
+        store = SnapshotStore(self.root)
+        self.assertEqual(len(store.runs), 3)
+        self.assertEqual(len(store.history(title="Alpha")), 2)
+        entry = store.record([book("Alpha", 13), book("Beta", 20), book("Gamma", 31), book("Delta", 40, False)],
+                             START + timedelta(days=3))
+        self.assertEqual((entry["run"], entry["added"], entry["price_changes"]), (3, 0, 1))
+
+        store = SnapshotStore(self.root)
+        self.assertEqual(store.price_history(title="Alpha")["price_gbp"].tolist(), [10.0, 12.0, 13.0])
+        self.assertEqual(len(store.keys_for(title="Epsilon")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
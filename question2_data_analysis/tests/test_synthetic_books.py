@@ -0,0 +1,86 @@
+"""
+test_synthetic_books.py
+
+Tests for the synthetic raw books generator in synthetic_books.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from synthetic_books import CATEGORIES, generate_books_csv  # noqa: E402
+
+cleaning = importlib.import_module("2_data_cleaning")
+
+
+class SyntheticBooksTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def generate(self, name: str, n_rows: int, **kwargs) -> str:
+        return generate_books_csv(os.path.join(self.tmp.name, name), n_rows, **kwargs)
+
+    def test_chunks_append_rows_under_one_header(self) -> None:
+        path = self.generate("books.csv", 2_500, chunk_rows=1_000)
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        self.assertTrue(raw.startswith(b"\xef\xbb\xbf"))
+        self.assertEqual(raw.count(b"\xef\xbb\xbf"), 1)
+        self.assertEqual(raw.count(b"title,price_gbp"), 1)
+        df = pd.read_csv(path, encoding="utf-8-sig", keep_default_na=False)
+        self.assertEqual(list(df.columns), ["title", "price_gbp", "rating", "category", "availability"])
+        self.assertEqual(len(df), 2_500)
+        self.assertTrue(set(df["category"]) <= set(CATEGORIES))
+
+    def test_same_seed_same_file(self) -> None:
+        first = self.generate("a.csv", 500, seed=7)
+        second = self.generate("b.csv", 500, seed=7)
+        other = self.generate("c.csv", 500, seed=8)
+        with open(first, "rb") as a, open(second, "rb") as b, open(other, "rb") as c:
+            data = a.read()
+            self.assertEqual(data, b.read())
+            self.assertNotEqual(data, c.read())
+
+    def test_quirks_follow_the_requested_rates(self) -> None:
+        path = self.generate(
+            "books.csv", 20_000, dirty_rate=0.1, missing_rate=0.05, duplicate_rate=0.1, out_of_stock_rate=0.2
+        )
+        df = pd.read_csv(path, encoding="utf-8-sig", keep_default_na=False, dtype=str)
+
+        self.assertAlmostEqual(df["price_gbp"].str.startswith("Â£").mean(), 0.1 * 0.95, delta=0.01)
+        self.assertAlmostEqual((df["price_gbp"] == "").mean(), 0.05, delta=0.01)
+        self.assertAlmostEqual((df["availability"] == "Out of stock").mean(), 0.2, delta=0.01)
+        self.assertGreaterEqual(df.duplicated().mean(), 0.09)
+
+    def test_output_goes_through_the_cleaning_steps(self) -> None:
+        path = self.generate("books.csv", 2_000)
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        with redirect_stdout(StringIO()):
+            df = cleaning.clean_price(df)
+            df = cleaning.clean_rating(df)
+            df = cleaning.handle_missing(df)
+            df = cleaning.remove_duplicates(df)
+
+        self.assertFalse(df[["price_gbp", "rating"]].isna().any().any())
+        self.assertTrue(df["price_gbp"].between(10, 60).all())
+        self.assertTrue(df["rating"].between(1, 5).all())
+        self.assertFalse(df.duplicated().any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+test_title_features.py
+
+Tests for the TF-IDF title featurizer in title_features.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from title_features import STRUCTURED_FEATURES, TitleFeaturizer, load_or_fit, structured_features  # noqa: E402
+
+TITLES = [
+    "Lumberjanes, Vol. 1: Beware the Kitten Holy (Lumberjanes #1-4)",
+    "Lumberjanes, Vol. 2: Friendship to the Max (Lumberjanes #5-8)",
+    "The Secret Garden",
+    "The Secret of the Old Clock (Nancy Drew #1)",
+    "A Light in the Attic",
+    "The Secret Garden",
+    "Sapiens: A Brief History of Humankind",
+    "The Light of the Night Garden",
+]
+
+
+class StructuredFeaturesTest(unittest.TestCase):
+    def test_series_and_volume_are_parsed(self) -> None:
+        rows = pd.DataFrame(structured_features(pd.Series(TITLES)), columns=STRUCTURED_FEATURES)
+
+        self.assertEqual(
+            rows.loc[0, ["has_subtitle", "in_series", "series_number", "volume_number"]].tolist(), [1, 1, 1, 1]
+        )
+        self.assertEqual(rows.loc[3, ["in_series", "series_number", "volume_number"]].tolist(), [1, 1, 0])
+        self.assertEqual(rows.loc[2, ["has_subtitle", "in_series", "title_words"]].tolist(), [0, 0, 3])
+        self.assertEqual(rows.loc[6, ["has_subtitle", "in_series"]].tolist(), [1, 0])
+
+
+class TitleFeaturizerTest(unittest.TestCase):
+    def test_vocab_mode_matches_tfidf_vectorizer(self) -> None:
+        featurizer = TitleFeaturizer(mode="vocab", min_df=2).fit([TITLES])
+        expected = TfidfVectorizer(ngram_range=(1, 2), min_df=2)
+        dense = expected.fit_transform(TITLES).toarray()
+
+        names = featurizer.feature_names()[: -len(STRUCTURED_FEATURES)]
+        self.assertEqual(sorted(names), sorted(f"title_{t}" for t in expected.get_feature_names_out()))
+        order = [expected.vocabulary_[name[len("title_"):]] for name in names]
+        ngrams = featurizer.transform(TITLES)[:, : len(names)].toarray()
+        np.testing.assert_allclose(ngrams, dense[:, order])
+
+    def test_chunked_fit_matches_one_shot_fit(self) -> None:
+        for mode in ("hashing", "vocab"):
+            with self.subTest(mode=mode):
+                whole = TitleFeaturizer(mode=mode, n_features=256).fit([TITLES])
+                chunked = TitleFeaturizer(mode=mode, n_features=256).fit([TITLES[:3], TITLES[3:5], TITLES[5:]])
+                self.assertEqual(chunked.n_docs, len(TITLES))
+                self.assertEqual((whole.transform(TITLES) != chunked.transform(TITLES)).nnz, 0)
+
+    def test_hashing_width_and_unseen_words(self) -> None:
+        featurizer = TitleFeaturizer(mode="hashing", n_features=256).fit([TITLES])
+        X = featurizer.transform(["Completely Unseen Words"])
+
+        self.assertEqual(X.shape, (1, featurizer.n_columns))
+        self.assertEqual(featurizer.n_columns, 256 + len(STRUCTURED_FEATURES))
+        self.assertGreater(X[:, :256].nnz, 0)
+
+    def test_parallel_transform_matches_transform(self) -> None:
+        featurizer = TitleFeaturizer(mode="vocab", min_df=1).fit([TITLES])
+        titles = TITLES * 5
+        X = featurizer.transform_parallel(titles, n_jobs=2, chunk_rows=7)
+
+        self.assertEqual(X.shape[0], len(titles))
+        self.assertEqual((X != featurizer.transform(titles)).nnz, 0)
+
+    def test_transform_requires_fit(self) -> None:
+        with self.assertRaises(ValueError):
+            TitleFeaturizer().transform(TITLES)
+        with self.assertRaises(ValueError):
+            TitleFeaturizer(mode="bag")
+
+
+class LoadOrFitTest(unittest.TestCase):
+    def test_cache_is_invalidated_when_the_csv_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "books.csv")
+            cache_dir = os.path.join(tmp, "cache")
+            pd.DataFrame({"title": TITLES}).to_csv(path, index=False)
+
+            first = load_or_fit(path, cache_dir, chunk_rows=3, mode="vocab")
+            cached = load_or_fit(path, cache_dir, chunk_rows=3, mode="vocab")
+            pd.DataFrame({"title": TITLES + ["Another Book"]}).to_csv(path, index=False)
+            refit = load_or_fit(path, cache_dir, chunk_rows=3, mode="vocab")
+
+        self.assertEqual(first.n_docs, len(TITLES))
+        self.assertEqual(cached.vocabulary_, first.vocabulary_)
+        self.assertEqual(refit.n_docs, len(TITLES) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
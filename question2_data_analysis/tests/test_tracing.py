@@ -0,0 +1,141 @@
+"""
+test_tracing.py
+
+Tests for the per-stage spans and trace exports in tracing.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+Q2_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, Q2_DIR)
+
+import tracing  # noqa: E402
+from tracing import span, traced  # noqa: E402
+
+
+@traced
+def inner() -> None:
+    time.sleep(0.02)
+
+
+@traced(name="stage.outer")
+def outer() -> None:
+    time.sleep(0.01)
+    inner()
+
+
+class TracingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tracing.reset()
+        tracing.enable()
+
+    def tearDown(self) -> None:
+        tracing.finish()
+        tracing.reset()
+
+    def by_name(self) -> dict:
+        return {e["name"]: e for e in tracing.events()}
+
+    def test_disabled_tracing_records_nothing(self) -> None:
+        tracing.finish()
+        outer()
+        with span("block"):
+            pass
+        self.assertEqual(tracing.events(), [])
+
+    def test_nested_spans_form_a_call_tree(self) -> None:
+        outer()
+        spans = self.by_name()
+
+        self.assertEqual(list(spans), ["test_tracing.inner", "stage.outer"])
+        self.assertEqual(spans["test_tracing.inner"]["path"], "stage.outer;test_tracing.inner")
+        parent, child = spans["stage.outer"], spans["test_tracing.inner"]
+        self.assertGreaterEqual(parent["wall"], child["wall"] + 0.01)
+        self.assertAlmostEqual(parent["self"], parent["wall"] - child["wall"], places=9)
+
+    def test_span_is_recorded_when_the_block_raises(self) -> None:
+        with self.assertRaises(KeyError):
+            with span("failing"):
+                raise KeyError("boom")
+        with span("after"):
+            pass
+        self.assertEqual(self.by_name()["after"]["path"], "after")
+
+    def test_threads_keep_separate_stacks(self) -> None:
+        with span("main"):
+            worker = threading.Thread(target=inner)
+            worker.start()
+            worker.join()
+        spans = self.by_name()
+
+        self.assertEqual(spans["test_tracing.inner"]["path"], "test_tracing.inner")
+        self.assertNotEqual(spans["test_tracing.inner"]["tid"], spans["main"]["tid"])
+
+    def test_memory_peaks_nest(self) -> None:
+        tracing.finish()
+        tracing.enable(memory=True)
+        try:
+            with span("outer"):
+                with span("alloc"):
+                    block = bytearray(4 * 1024 * 1024)
+                    del block
+        finally:
+            tracing.tracemalloc.stop()
+        spans = self.by_name()
+
+        self.assertGreaterEqual(spans["alloc"]["mem_peak_kb"], 4 * 1024)
+        self.assertGreaterEqual(spans["outer"]["mem_peak_kb"], spans["alloc"]["mem_peak_kb"])
+
+    def test_exports(self) -> None:
+        outer()
+        outer()
+        with tempfile.TemporaryDirectory() as out_dir:
+            chrome = os.path.join(out_dir, "trace.json")
+            folded = os.path.join(out_dir, "trace.folded")
+            tracing.write_chrome_trace(chrome)
+            tracing.write_folded(folded)
+            with open(chrome, encoding="utf-8") as f:
+                trace = json.load(f)["traceEvents"]
+            with open(folded, encoding="utf-8") as f:
+                stacks = [line.split() for line in f]
+
+        self.assertEqual(len(trace), 4)
+        self.assertTrue(all(e["ph"] == "X" and e["dur"] > 0 for e in trace))
+        self.assertEqual([s for s, _ in stacks], ["stage.outer", "stage.outer;test_tracing.inner"])
+        # Self time of two inner calls of ~20 ms each
+        self.assertGreaterEqual(int(stacks[1][1]), 40_000)
+
+        rows = tracing.summary()
+        self.assertEqual([(r["name"], r["calls"]) for r in rows], [("stage.outer", 2), ("test_tracing.inner", 2)])
+
+    def test_trace_env_writes_trace_at_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as out_dir:
+            path = os.path.join(out_dir, "run.json")
+            code = (
+                "import sys\n"
+                f"sys.path.insert(0, {Q2_DIR!r})\n"
+                "from tracing import span\n"
+                "with span('stage'):\n"
+                "    pass\n"
+            )
+            env = {**os.environ, tracing.TRACE_ENV: path}
+            result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+            with open(path, encoding="utf-8") as f:
+                names = [e["name"] for e in json.load(f)["traceEvents"]]
+
+        self.assertEqual(names, ["stage"])
+        self.assertIn("[SAVED] Trace:", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+test_visualization.py
+
+Tests for the HTML export modes, precomputed box plot and lazy imports in
+4_visualization.py.
+
+Run from the repository root:
+    python -m pytest -q question2_data_analysis/tests
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+Q2_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, Q2_DIR)
+
+visualization = importlib.import_module("4_visualization")
+
+
+def books(seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    categories = np.repeat(["Poetry", "Travel", "Mystery", "History", "Fiction", "Music"], [30, 25, 20, 15, 10, 5])
+    price = rng.uniform(10, 60, len(categories)).round(2)
+    price[:2] = [150.0, 200.0]  # Poetry outliers
+    return pd.DataFrame({
+        "title": [f"Book {i}" for i in range(len(categories))],
+        "price_gbp": price,
+        "rating": rng.integers(1, 6, len(categories)),
+        "category": categories,
+        "availability": "In stock",
+    })
+
+
+class HtmlExportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.workdir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(visualization, "OUT_DIR", self.workdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.workdir.cleanup)
+
+    def test_shared_mode_writes_one_versioned_bundle(self) -> None:
+        import plotly
+
+        df = books()
+        standalone = visualization.plot_interactive_boxplot_top5(df, "standalone")
+        standalone_size = os.path.getsize(os.path.join(self.workdir.name, "2_boxplot_price_top5_categories_interactive.html"))
+        visualization.plot_interactive_boxplot_top5(df, "shared")
+        visualization.plot_interactive_scatter_price_vs_rating(df, "shared")
+        visualization.write_dashboard([standalone], [])
+
+        bundle = f"plotly-{plotly.__version__}.min.js"
+        self.assertEqual([f for f in os.listdir(self.workdir.name) if f.endswith(".js")], [bundle])
+        for name in ("2_boxplot_price_top5_categories_interactive.html", visualization.DASHBOARD_FILE):
+            with open(os.path.join(self.workdir.name, name), encoding="utf-8") as f:
+                html = f.read()
+            self.assertIn(f'src="{bundle}"', html)
+            self.assertLess(len(html), standalone_size / 10)
+
+    def test_unknown_html_mode_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            visualization.write_interactive_html(None, "chart.html", "inline")
+
+
+class PrecomputedBoxPlotTest(unittest.TestCase):
+    def test_summary_matches_the_iqr_rule(self) -> None:
+        df = books()
+        categories = ["Poetry", "Travel", "Mystery"]
+        summary, outliers = visualization.box_summary_by_category(df, categories)
+
+        self.assertEqual(summary["category"].tolist(), categories)
+        for row in summary.itertuples():
+            prices = df.loc[df["category"] == row.category, "price_gbp"]
+            q1, q3 = prices.quantile(0.25), prices.quantile(0.75)
+            inside = prices[prices.between(q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))]
+            self.assertEqual((row.q1, row.median, row.q3), (q1, prices.median(), q3))
+            self.assertEqual((row.lowerfence, row.upperfence), (inside.min(), inside.max()))
+        self.assertEqual(sorted(outliers["price_gbp"].tolist()), [150.0, 200.0])
+
+    def test_precomputed_figure_holds_only_summaries(self) -> None:
+        fig = visualization.build_precomputed_boxplot(books(), ["Poetry", "Travel"])
+        box, points = fig.data
+        self.assertEqual(len(box.q1), 2)
+        self.assertIsNone(box.y)
+        self.assertEqual(len(points.y), 2)
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_histogram_only_run_never_imports_plotly(self) -> None:
+        with tempfile.TemporaryDirectory() as out_dir:
+            csv_path = os.path.join(out_dir, "books.csv")
+            books().to_csv(csv_path, index=False)
+            code = (
+                "import importlib, sys\n"
+                f"sys.path.insert(0, {Q2_DIR!r})\n"
+                "v = importlib.import_module('4_visualization')\n"
+                "assert 'matplotlib' not in sys.modules and 'plotly' not in sys.modules\n"
+                f"v.OUT_DIR, v.CLEAN_FILE = {out_dir!r}, {csv_path!r}\n"
+                "v.main(['--charts', 'histogram'])\n"
+                "import matplotlib\n"
+                "print('plotly' in sys.modules, matplotlib.get_backend())\n"
+            )
+            result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+            self.assertEqual(result.stdout.strip().splitlines()[-1].lower(), "false agg")
+            self.assertTrue(any(f.endswith(".png") for f in os.listdir(out_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+"""
+title_features.py
+
+Sparse title features for the price model (5_prediction.py --title ...).
+
+Two n-gram encodings, both weighted by TF-IDF and L2-normalised per title:
+- hashing: word 1–2-grams hashed into a fixed number of columns. Only the
+           document frequencies are learnt, so memory does not grow with
+           the vocabulary and unseen words still land in a column.
+- vocab:   an explicit vocabulary of the most frequent n-grams (min_df,
+           max_features), readable feature names.
+
+Both append structured series/volume columns parsed from the title:
+    "Lumberjanes, Vol. 1: Beware the Kitten Holy (Lumberjanes #1-4)"
+    -> in_series=1, series_number=1, volume_number=1, has_subtitle=1
+
+Fitting streams the cleaned CSV in chunks (partial_fit per chunk), and the
+fitted featurizer is cached on disk with joblib.Memory, keyed on the CSV's
+size/mtime and the parameters. transform_parallel() splits large inputs into
+chunks that are transformed on all cores and stacked back into one CSR matrix.
+
+Usage (from the repository root):
+    python question2_data_analysis/title_features.py --mode vocab --top 20
+"""
+
+import argparse
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.preprocessing import normalize
+
+CLEAN_FILE = "question2_data_analysis/data/cleaned_books_data.csv"
+CACHE_DIR = "question2_data_analysis/.cache/title_features"
+
+MODES = ("hashing", "vocab")
+HASH_FEATURES = 2 ** 16
+VOCAB_SIZE = 2 ** 14
+NGRAM_RANGE = (1, 2)
+MIN_DF = 2
+CHUNK_ROWS = 100_000
+
+# "(Miss Peregrine’s Peculiar Children #3)", "(Lumberjanes #9-12)"
+SERIES_PATTERN = r"\([^)]*?#\s*\d+(?:-\d+)?\)"
+SERIES_NUMBER_PATTERN = r"#\s*(\d+)"
+VOLUME_PATTERN = r"(?i)\b(?:vol(?:ume)?\.?|book|part)\s*(\d+)"
+STRUCTURED_FEATURES = [
+    "title_length", "title_words", "has_subtitle", "in_series", "series_number", "volume_number",
+]
+
+
+def structured_features(titles: pd.Series) -> np.ndarray:
+    """Length / subtitle / series / volume columns, vectorized over the titles."""
+    titles = titles.astype(str)
+    return np.column_stack(
+        [
+            titles.str.len(),
+            titles.str.count(r"\S+"),
+            titles.str.contains(":", regex=False),
+            titles.str.contains(SERIES_PATTERN, regex=True),
+            pd.to_numeric(titles.str.extract(SERIES_NUMBER_PATTERN, expand=False), errors="coerce").fillna(0),
+            pd.to_numeric(titles.str.extract(VOLUME_PATTERN, expand=False), errors="coerce").fillna(0),
+        ]
+    ).astype(float)
+
+
+class TitleFeaturizer:
+    """TF-IDF title n-grams (+ series/volume columns), fitted incrementally."""
+
+    def __init__(self, mode: str = "hashing", n_features: int = HASH_FEATURES,
+                 max_features: int = VOCAB_SIZE, min_df: int = MIN_DF, ngram_range=NGRAM_RANGE):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.mode = mode
+        self.n_features = n_features
+        self.max_features = max_features
+        self.min_df = min_df
+        self.ngram_range = tuple(ngram_range)
+
+        self.n_docs = 0
+        self.doc_freq = np.zeros(n_features, dtype=np.int64) if mode == "hashing" else Counter()
+        self.vocabulary_ = None
+        self.idf_ = None
+
+    def _vectorizer(self):
+        if self.mode == "hashing":
+            return HashingVectorizer(
+                n_features=self.n_features, ngram_range=self.ngram_range,
+                alternate_sign=False, norm=None,
+            )
+        return CountVectorizer(ngram_range=self.ngram_range, vocabulary=self.vocabulary_)
+
+    def partial_fit(self, titles) -> "TitleFeaturizer":
+        """Accumulate document frequencies from one chunk of titles."""
+        # Tokenize each distinct title once; its n-grams count once per occurrence
+        codes, uniques = pd.factorize(pd.Series(titles, dtype=str))
+        occurrences = np.bincount(codes, minlength=len(uniques))
+        if self.mode == "hashing":
+            vectorizer = self._vectorizer()
+            counts = vectorizer.transform(pd.Series(uniques, dtype=str)).tocsr()
+        else:
+            vectorizer = CountVectorizer(ngram_range=self.ngram_range)
+            counts = vectorizer.fit_transform(pd.Series(uniques, dtype=str))
+        weights = np.repeat(occurrences, np.diff(counts.indptr))
+        doc_freq = np.bincount(counts.indices, weights=weights, minlength=counts.shape[1]).astype(np.int64)
+        if self.mode == "hashing":
+            self.doc_freq += doc_freq
+        else:
+            self.doc_freq.update(dict(zip(vectorizer.get_feature_names_out(), doc_freq.tolist())))
+        self.n_docs += len(codes)
+        self.idf_ = None
+        return self
+
+    def finalize(self) -> "TitleFeaturizer":
+        """Turn the accumulated counts into IDF weights (and the vocabulary in vocab mode)."""
+        if self.mode == "hashing":
+            doc_freq = self.doc_freq
+        else:
+            kept = [(term, df) for term, df in self.doc_freq.items() if df >= self.min_df]
+            kept.sort(key=lambda item: (-item[1], item[0]))
+            kept = kept[: self.max_features]
+            self.vocabulary_ = {term: i for i, (term, _) in enumerate(kept)}
+            doc_freq = np.array([df for _, df in kept], dtype=np.int64)
+        # Smoothed IDF, as sklearn's TfidfTransformer computes it
+        self.idf_ = np.log((1 + self.n_docs) / (1 + doc_freq)) + 1.0
+        return self
+
+    def fit(self, chunks) -> "TitleFeaturizer":
+        for titles in chunks:
+            self.partial_fit(titles)
+        return self.finalize()
+
+    def transform(self, titles) -> sparse.csr_matrix:
+        if self.idf_ is None:
+            raise ValueError("TitleFeaturizer is not fitted; call fit() or finalize() first")
+        # Featurize each distinct title once, then gather rows by title code
+        codes, uniques = pd.factorize(pd.Series(titles, dtype=str))
+        uniques = pd.Series(uniques, dtype=str)
+        counts = self._vectorizer().transform(uniques)
+        ngrams = normalize(counts @ sparse.diags(self.idf_), norm="l2", copy=False)
+        features = sparse.hstack([ngrams, sparse.csr_matrix(structured_features(uniques))], format="csr")
+        return features if len(uniques) == len(codes) else features[codes]
+
+    def transform_parallel(self, titles, n_jobs: int = -1, chunk_rows: int = CHUNK_ROWS) -> sparse.csr_matrix:
+        """transform() over chunks of `chunk_rows` titles on `n_jobs` workers."""
+        titles = pd.Series(titles, dtype=str).reset_index(drop=True)
+        if n_jobs == 1 or len(titles) <= chunk_rows:
+            return self.transform(titles)
+        parts = Parallel(n_jobs=n_jobs)(
+            delayed(self.transform)(titles.iloc[start:start + chunk_rows])
+            for start in range(0, len(titles), chunk_rows)
+        )
+        return sparse.vstack(parts, format="csr")
+
+    @property
+    def n_columns(self) -> int:
+        width = self.n_features if self.mode == "hashing" else len(self.vocabulary_ or ())
+        return width + len(STRUCTURED_FEATURES)
+
+    def feature_names(self) -> list[str]:
+        if self.mode == "hashing":
+            ngrams = [f"title_hash_{i}" for i in range(self.n_features)]
+        else:
+            ngrams = [f"title_{term}" for term in sorted(self.vocabulary_, key=self.vocabulary_.get)]
+        return [*ngrams, *STRUCTURED_FEATURES]
+
+
+def iter_title_chunks(path: str = CLEAN_FILE, chunk_rows: int = CHUNK_ROWS):
+    """Stream the title column of a CSV without loading the whole file."""
+    for chunk in pd.read_csv(path, usecols=["title"], chunksize=chunk_rows):
+        yield chunk["title"].dropna()
+
+
+def fit_from_csv(path: str = CLEAN_FILE, chunk_rows: int = CHUNK_ROWS, **params) -> TitleFeaturizer:
+    return TitleFeaturizer(**params).fit(iter_title_chunks(path, chunk_rows))
+
+
+def _fit_for_cache(path, size, mtime, chunk_rows, params):
+    # size/mtime only take part in the cache key: any change to the CSV refits
+    return fit_from_csv(path, chunk_rows, **params)
+
+
+def load_or_fit(path: str = CLEAN_FILE, cache_dir: str = CACHE_DIR,
+                chunk_rows: int = CHUNK_ROWS, **params) -> TitleFeaturizer:
+    """Fitted featurizer for `path`, reused from the on-disk cache when the CSV is unchanged."""
+    stat = os.stat(path)
+    fit = Memory(cache_dir, verbose=0).cache(_fit_for_cache) if cache_dir else _fit_for_cache
+    return fit(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, chunk_rows, dict(sorted(params.items())))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the title featurizer and summarise the title features.")
+    parser.add_argument("--mode", choices=MODES, default="vocab")
+    parser.add_argument("--input", default=CLEAN_FILE)
+    parser.add_argument("--top", type=int, default=20, help="most frequent n-grams to print (vocab mode)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    featurizer = load_or_fit(args.input, mode=args.mode)
+    titles = pd.read_csv(args.input, usecols=["title"])["title"].dropna()
+    X = featurizer.transform_parallel(titles)
+
+    print(f"[INFO] {featurizer.n_docs} titles -> {X.shape[1]} columns ({featurizer.mode}), "
+          f"{X.nnz / max(X.shape[0], 1):.1f} non-zeros per title")
+    structured = pd.DataFrame(X[:, -len(STRUCTURED_FEATURES):].toarray(), columns=STRUCTURED_FEATURES)
+    print(f"[INFO] Series titles: {int(structured['in_series'].sum())} | "
+          f"with subtitle: {int(structured['has_subtitle'].sum())} | "
+          f"with volume number: {int((structured['volume_number'] > 0).sum())}")
+
+    if featurizer.vocabulary_:
+        top = sorted(featurizer.vocabulary_, key=featurizer.vocabulary_.get)[: args.top]
+        print(f"\nMost frequent n-grams: {', '.join(top)}")
+    print(f"\n[SUCCESS] Featurizer cached in {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
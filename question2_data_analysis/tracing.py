@@ -0,0 +1,310 @@
+"""
+tracing.py
+
+Lightweight per-stage tracing for the books pipeline (1_scraper.py … 5_prediction.py).
+
+Functions wrapped with @traced (or blocks wrapped in `with span("name"):`)
+record wall time, CPU time, growth of the process peak RSS and, optionally,
+the peak tracemalloc allocation while they run. Nested spans form a call
+tree that is exported as a trace viewable as a flame graph:
+- *.json    Chrome trace events (chrome://tracing, ui.perfetto.dev, speedscope.app)
+- *.folded  collapsed stacks for flamegraph.pl / speedscope (self time in µs)
+
+Tracing is off by default and costs one flag check per traced call. It is
+switched on without touching code through environment variables:
+    BOOKS_TRACE=trace.json        write the span trace at exit (+ a [TRACE] summary)
+    BOOKS_TRACE_MEMORY=1          also record tracemalloc peaks (slower)
+    BOOKS_PROFILE=run.prof        full cProfile capture (snakeviz / pstats)
+    BOOKS_PROFILE=run.html        pyinstrument capture, if pyinstrument is installed
+
+Example (from the repository root):
+    BOOKS_TRACE=trace.json python question2_data_analysis/2_data_cleaning.py
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_ENV = "BOOKS_TRACE"
+MEMORY_ENV = "BOOKS_TRACE_MEMORY"
+PROFILE_ENV = "BOOKS_PROFILE"
+
+# ru_maxrss is reported in KiB on Linux and in bytes on macOS
+RSS_UNIT_KB = 1 / 1024 if sys.platform == "darwin" else 1
+
+_enabled = False
+_memory = False
+_trace_path = None
+_profile_path = None
+_profiler = None
+_registered = False
+_events = []
+_local = threading.local()
+_lock = threading.Lock()
+_t0 = time.perf_counter()
+
+
+def _max_rss_kb() -> float:
+    if resource is None:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT_KB
+
+
+class _Frame:
+    __slots__ = ("name", "path", "start", "cpu", "rss", "mem_start", "mem_peak", "child_time")
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.child_time = 0.0
+        self.mem_start = 0
+        self.mem_peak = 0
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _enter(name: str) -> _Frame:
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    frame = _Frame(name, f"{parent.path};{name}" if parent else name)
+
+    if _memory and tracemalloc.is_tracing():
+        # tracemalloc keeps one global peak: fold it into the parent, then restart it for this span
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent.mem_peak = max(parent.mem_peak, peak)
+        tracemalloc.reset_peak()
+        frame.mem_start = frame.mem_peak = current
+
+    stack.append(frame)
+    frame.rss = _max_rss_kb()
+    frame.cpu = time.process_time()
+    frame.start = time.perf_counter()
+    return frame
+
+
+def _exit(frame: _Frame) -> None:
+    end = time.perf_counter()
+    cpu = time.process_time() - frame.cpu
+    rss_growth = _max_rss_kb() - frame.rss
+    stack = _stack()
+    stack.pop()
+    parent = stack[-1] if stack else None
+
+    mem_peak_kb = None
+    if _memory and tracemalloc.is_tracing():
+        frame.mem_peak = max(frame.mem_peak, tracemalloc.get_traced_memory()[1])
+        mem_peak_kb = (frame.mem_peak - frame.mem_start) / 1024
+        if parent is not None:
+            parent.mem_peak = max(parent.mem_peak, frame.mem_peak)
+        tracemalloc.reset_peak()
+
+    wall = end - frame.start
+    if parent is not None:
+        parent.child_time += wall
+
+    with _lock:
+        _events.append({
+            "name": frame.name,
+            "path": frame.path,
+            "tid": threading.get_ident(),
+            "start": frame.start - _t0,
+            "wall": wall,
+            "self": wall - frame.child_time,
+            "cpu": cpu,
+            "rss_growth_kb": rss_growth,
+            "mem_peak_kb": mem_peak_kb,
+        })
+
+
+@contextmanager
+def span(name: str):
+    """Record one traced block; a no-op while tracing is disabled."""
+    if not _enabled:
+        yield
+        return
+    frame = _enter(name)
+    try:
+        yield
+    finally:
+        _exit(frame)
+
+
+def traced(func=None, *, name: str = None):
+    """Decorator form of span(), named "<script>.<function>" unless `name` is given."""
+    if func is None:
+        return functools.partial(traced, name=name)
+    script = os.path.splitext(os.path.basename(func.__code__.co_filename))[0]
+    label = name or f"{script}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        frame = _enter(label)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _exit(frame)
+
+    return wrapper
+
+
+def enable(trace_path: str = None, memory: bool = False, profile_path: str = None) -> None:
+    """Switch tracing on; outputs are written by finish(), which also runs at exit."""
+    global _enabled, _memory, _trace_path, _profile_path, _registered
+    _enabled = True
+    if not _registered:
+        atexit.register(finish)
+        _registered = True
+    _trace_path = trace_path
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if profile_path:
+        _profile_path = profile_path
+        _start_profiler(profile_path)
+
+
+def _start_profiler(path: str) -> None:
+    global _profiler
+    if path.endswith(".html"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print(f"[WARN] pyinstrument is not installed; writing a cProfile capture instead of {path}")
+        else:
+            _profiler = Profiler()
+            _profiler.start()
+            return
+    import cProfile
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+
+def _stop_profiler() -> None:
+    global _profiler
+    if _profiler is None:
+        return
+    os.makedirs(os.path.dirname(_profile_path) or ".", exist_ok=True)
+    if hasattr(_profiler, "output_html"):
+        _profiler.stop()
+        with open(_profile_path, "w", encoding="utf-8") as f:
+            f.write(_profiler.output_html())
+        path = _profile_path
+    else:
+        _profiler.disable()
+        path = _profile_path if not _profile_path.endswith(".html") else _profile_path[:-5] + ".prof"
+        _profiler.dump_stats(path)
+    _profiler = None
+    print(f"[SAVED] Profile: {path}")
+
+
+def events() -> list:
+    """Snapshot of the finished spans (dicts with name, path, wall, cpu, ... in seconds / KiB)."""
+    with _lock:
+        return list(_events)
+
+
+def reset() -> None:
+    with _lock:
+        _events.clear()
+
+
+def write_chrome_trace(path: str, spans: list = None) -> None:
+    """Write spans as Chrome 'complete' events (timestamps in µs)."""
+    spans = events() if spans is None else spans
+    pid = os.getpid()
+    trace = []
+    for e in spans:
+        args = {"cpu_ms": round(e["cpu"] * 1e3, 3), "rss_growth_kb": round(e["rss_growth_kb"], 1)}
+        if e["mem_peak_kb"] is not None:
+            args["mem_peak_kb"] = round(e["mem_peak_kb"], 1)
+        trace.append({
+            "name": e["name"], "cat": "pipeline", "ph": "X", "pid": pid, "tid": e["tid"],
+            "ts": round(e["start"] * 1e6, 1), "dur": round(e["wall"] * 1e6, 1), "args": args,
+        })
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+def write_folded(path: str, spans: list = None) -> None:
+    """Write collapsed stacks ("a;b;c <self µs>"), one line per distinct stack."""
+    spans = events() if spans is None else spans
+    totals = {}
+    for e in spans:
+        totals[e["path"]] = totals.get(e["path"], 0.0) + e["self"]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, seconds in sorted(totals.items()):
+            f.write(f"{stack} {max(int(seconds * 1e6), 0)}\n")
+
+
+def summary(spans: list = None) -> list[dict]:
+    """Aggregate spans by name, slowest total wall time first."""
+    spans = events() if spans is None else spans
+    rows = {}
+    for e in spans:
+        row = rows.setdefault(e["name"], {"name": e["name"], "calls": 0, "wall": 0.0, "cpu": 0.0,
+                                          "rss_growth_kb": 0.0, "mem_peak_kb": None})
+        row["calls"] += 1
+        row["wall"] += e["wall"]
+        row["cpu"] += e["cpu"]
+        row["rss_growth_kb"] += e["rss_growth_kb"]
+        if e["mem_peak_kb"] is not None:
+            row["mem_peak_kb"] = max(row["mem_peak_kb"] or 0.0, e["mem_peak_kb"])
+    return sorted(rows.values(), key=lambda r: r["wall"], reverse=True)
+
+
+def print_summary(spans: list = None) -> None:
+    rows = summary(spans)
+    if not rows:
+        return
+    print(f"\n[TRACE] {'span':<44}{'calls':>7}{'wall ms':>11}{'cpu ms':>11}{'+rss MB':>9}{'peak MB':>9}")
+    for r in rows:
+        peak = "-" if r["mem_peak_kb"] is None else f"{r['mem_peak_kb'] / 1024:.1f}"
+        print(f"[TRACE] {r['name'][:43]:<44}{r['calls']:>7}{r['wall'] * 1e3:>11.1f}"
+              f"{r['cpu'] * 1e3:>11.1f}{r['rss_growth_kb'] / 1024:>9.1f}{peak:>9}")
+
+
+def finish() -> None:
+    """Stop any profiler and write the configured trace + summary (idempotent)."""
+    global _enabled
+    if not _enabled:
+        return
+    _stop_profiler()
+    if _trace_path:
+        if _trace_path.endswith(".folded"):
+            write_folded(_trace_path)
+        else:
+            write_chrome_trace(_trace_path)
+        print_summary()
+        print(f"[SAVED] Trace: {_trace_path}")
+    _enabled = False
+
+
+def _enable_from_env() -> None:
+    trace_path = os.environ.get(TRACE_ENV)
+    profile_path = os.environ.get(PROFILE_ENV)
+    if trace_path or profile_path:
+        enable(trace_path, os.environ.get(MEMORY_ENV, "") not in ("", "0"), profile_path)
+
+
+_enable_from_env()